@@ -0,0 +1 @@
+# 성능 측정 스크립트 패키지 (backend 디렉터리에서 python -m benchmarks.<모듈> 로 실행)
@@ -0,0 +1,142 @@
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+
+# 결과 JSON 형식 버전 (필드가 바뀌면 올림)
+RESULT_SCHEMA_VERSION = 1
+
+# 측정 크기 (width, height)
+BENCHMARK_SIZES: List[Tuple[int, int]] = [(20, 15), (64, 40), (128, 80)]
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    """'64x40' 형식의 맵 크기 파싱"""
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def measure(
+    func: Callable[..., Any],
+    repeat: int,
+    setup: Optional[Callable[[int], tuple]] = None
+) -> List[float]:
+    """func를 repeat번 실행한 각 소요 시간(초) 목록 - setup(i)의 반환값을 인자로 넘기며 setup 시간은 제외"""
+    timings = []
+    for i in range(repeat):
+        args = setup(i) if setup else ()
+        start = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def make_result(name: str, timings: List[float], tiles: int, **params) -> Dict[str, Any]:
+    """측정 결과 한 건 (벽시계 시간은 ms, 처리량은 중앙값 기준 tiles/sec)"""
+    median = statistics.median(timings)
+    return {
+        "benchmark": name,
+        **params,
+        "tiles": tiles,
+        "repeat": len(timings),
+        "wall_time_ms": {
+            "min": round(min(timings) * 1000, 3),
+            "median": round(median * 1000, 3),
+            "mean": round(statistics.fmean(timings) * 1000, 3),
+            "max": round(max(timings) * 1000, 3)
+        },
+        "tiles_per_sec": round(tiles / median, 1) if median > 0 else None
+    }
+
+
+def result_key(result: Dict[str, Any]) -> Tuple:
+    """릴리스 간 비교를 위한 결과 식별 키"""
+    return (
+        result["benchmark"], result.get("map_type"), result.get("width"), result.get("height"),
+        result.get("variant"), result.get("radius")
+    )
+
+
+def result_labels(result: Dict[str, Any]) -> Tuple[str, str]:
+    """요약 표의 (구분, 크기) 열 - 맵 벤치마크는 MapType/맵 크기, 좌표 벤치마크는 구현 방식/반경"""
+    label = result.get("map_type") or result.get("variant") or "-"
+    if result.get("radius") is not None:
+        return str(label), f"r={result['radius']}"
+    return str(label), f"{result.get('width')}x{result.get('height')}"
+
+
+def environment_info() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine()
+    }
+
+
+def write_report(suite: str, results: List[Dict[str, Any]], path: Optional[str], extra: Optional[Dict] = None) -> Dict:
+    """결과를 JSON으로 저장 (path가 '-' 또는 None이면 표준 출력)"""
+    report = {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "suite": suite,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        **(extra or {}),
+        "results": results
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2, sort_keys=False)
+    if path and path != "-":
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return report
+
+
+def compare_reports(baseline_path: str, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """이전 결과 파일과 중앙값 시간 비교 (ratio > 1이면 느려짐)"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {result_key(r): r for r in json.load(f)["results"]}
+
+    comparisons = []
+    for result in results:
+        previous = baseline.get(result_key(result))
+        if not previous:
+            continue
+        before = previous["wall_time_ms"]["median"]
+        after = result["wall_time_ms"]["median"]
+        label, size = result_labels(result)
+        comparisons.append({
+            "benchmark": result["benchmark"],
+            "map_type": label,
+            "size": size,
+            "baseline_ms": before,
+            "current_ms": after,
+            "ratio": round(after / before, 3) if before else None
+        })
+    return comparisons
+
+
+def print_summary(results: List[Dict[str, Any]], comparisons: Optional[List[Dict[str, Any]]] = None):
+    """사람이 읽기 쉬운 요약 표 출력 (JSON 출력과 섞이지 않도록 표준 에러로)"""
+    ratios = {
+        (c["benchmark"], c["map_type"], c["size"]): c["ratio"] for c in (comparisons or [])
+    }
+    header = f"{'benchmark':<28} {'map_type':<18} {'size':>8} {'median ms':>11} {'tiles/sec':>13}"
+    if comparisons is not None:
+        header += f" {'vs base':>8}"
+    print(header, file=sys.stderr)
+    for r in results:
+        label, size = result_labels(r)
+        line = (
+            f"{r['benchmark']:<28} {label:<18} {size:>8} "
+            f"{r['wall_time_ms']['median']:>11.3f} {r['tiles_per_sec'] or 0:>13.0f}"
+        )
+        if comparisons is not None:
+            ratio = ratios.get((r["benchmark"], label, size))
+            line += f" {ratio if ratio is not None else '-':>8}"
+        print(line, file=sys.stderr)
@@ -0,0 +1,115 @@
+"""헥스 좌표 표현별 링/나선 생성 벤치마크
+
+backend 디렉터리에서 실행:
+    python -m benchmarks.hex_coords --output hex_coords.json
+    python -m benchmarks.hex_coords --radii 1 3 --centers 500 --compare hex_coords.json
+
+같은 중심 좌표 목록(--centers 개)에 대해 반경별 링(ring)과 나선(spiral)을 만드는 시간을 구현 방식별로 측정합니다.
+    pydantic      매 단계 models.hexmap.HexCoord 모델 생성 (오프셋 테이블 도입 전 get_ring 방식)
+    namedtuple    매 단계 Hex(q, r, s) 생성
+    interned      매 단계 hex_at(q, r) (같은 좌표는 같은 객체 재사용)
+    tuple         map_utils.get_ring / get_spiral (캐시된 오프셋 + 일반 튜플)
+    batch         map_utils.batch_ring / batch_spiral (모든 중심을 배열 연산 한 번으로)
+"""
+import argparse
+import random
+from typing import Callable, Dict, List
+import numpy as np
+from models.hexmap import Hex, HexCoord, hex_at
+from utils.map_utils import RING_DIRECTIONS, batch_ring, batch_spiral, get_ring, get_spiral
+from benchmarks.common import compare_reports, make_result, measure, print_summary, write_report
+
+SUITE_NAME = "hex_coords"
+
+DEFAULT_RADII = [1, 2, 3, 5, 8]
+DEFAULT_CENTERS = 1000
+
+BASE_SEED = 20240501
+
+_DIRECTIONS = [tuple(d) for d in RING_DIRECTIONS.tolist()]
+
+
+def _walk_ring(center, radius: int, make: Callable[[int, int, int], tuple]) -> list:
+    """get_ring과 같은 순서로 링을 걸으며 매 단계 make(q, r, s)로 좌표 객체 생성"""
+    results = []
+    q, r, s = center[0], center[1] - radius, center[2] + radius
+    coord = make(q, r, s)
+    for dq, dr, ds in _DIRECTIONS:
+        for _ in range(radius):
+            results.append(coord)
+            q, r, s = q + dq, r + dr, s + ds
+            coord = make(q, r, s)
+    return results
+
+
+def _walk_spiral(center, radius: int, make: Callable[[int, int, int], tuple]) -> list:
+    results = [make(center[0], center[1], center[2])]
+    for ring_radius in range(1, radius + 1):
+        results.extend(_walk_ring(center, ring_radius, make))
+    return results
+
+
+COORD_FACTORIES: Dict[str, Callable[[int, int, int], tuple]] = {
+    "pydantic": lambda q, r, s: HexCoord(q=q, r=r, s=s),
+    "namedtuple": Hex,
+    "interned": lambda q, r, s: hex_at(q, r)
+}
+
+
+def make_centers(count: int) -> List[tuple]:
+    rng = random.Random(BASE_SEED)
+    centers = []
+    for _ in range(count):
+        q, r = rng.randrange(256), rng.randrange(160)
+        centers.append((q, r, -q - r))
+    return centers
+
+
+def bench_shape(shape: str, radius: int, centers: List[tuple], repeat: int) -> List[Dict]:
+    walk = _walk_ring if shape == "ring" else _walk_spiral
+    scalar = get_ring if shape == "ring" else get_spiral
+    batch = batch_ring if shape == "ring" else batch_spiral
+    center_array = np.array(centers, dtype=np.int32)
+    per_center = 6 * radius if shape == "ring" else 1 + 3 * radius * (radius + 1)
+    coords = per_center * len(centers)
+
+    variants: Dict[str, Callable[[], object]] = {
+        name: (lambda make=make: [walk(center, radius, make) for center in centers])
+        for name, make in COORD_FACTORIES.items()
+    }
+    variants["tuple"] = lambda: [scalar(center, radius) for center in centers]
+    variants["batch"] = lambda: batch(center_array, radius)
+
+    return [
+        make_result(shape, measure(func, repeat), coords, variant=name, radius=radius, centers=len(centers))
+        for name, func in variants.items()
+    ]
+
+
+def run(radii, centers: int, repeat: int) -> List[Dict]:
+    center_list = make_centers(centers)
+    results = []
+    for radius in radii:
+        for shape in ("ring", "spiral"):
+            results.extend(bench_shape(shape, radius, center_list, repeat))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="헥스 좌표 링/나선 생성 벤치마크")
+    parser.add_argument("--radii", nargs="+", type=int, default=DEFAULT_RADII, help="측정할 반경")
+    parser.add_argument("--centers", type=int, default=DEFAULT_CENTERS, help="중심 좌표 수")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수")
+    parser.add_argument("--output", default="-", help="결과 JSON 경로 (기본: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    results = run(args.radii, args.centers, args.repeat)
+    comparisons = compare_reports(args.compare, results) if args.compare else None
+    extra = {"comparison": comparisons} if comparisons is not None else None
+    write_report(SUITE_NAME, results, args.output, extra)
+    print_summary(results, comparisons)
+
+
+if __name__ == "__main__":
+    main()
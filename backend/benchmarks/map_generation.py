@@ -0,0 +1,124 @@
+"""맵 생성 벤치마크
+
+backend 디렉터리에서 실행:
+    python -m benchmarks.map_generation --output map_generation.json
+    python -m benchmarks.map_generation --sizes 20x15 64x40 --repeat 3 --compare map_generation.json
+
+측정 항목 (맵 크기 x MapType 별):
+    generate_map                 MapCache.get_or_generate (build_prepared_map의 지형/자원 생성 단계, 캐시 미적중)
+    generate_inland_sea_map      routers.map.generate_inland_sea_map (MapType 무관, 크기별 1회)
+    distribute_map_resources     전체 맵 자원 분포
+    assign_guaranteed_resources  수도 주변 보장 자원 배치
+    start_positions              create_game_session의 수도 위치 탐색 (place_capitals)
+"""
+import argparse
+import random
+from typing import Dict, List
+from models.map import MapType
+from routers.map import generate_inland_sea_map
+from utils.map_cache import MapCache, copy_map
+from utils.map_generator import RESOURCE_IDS
+from utils.map_utils import assign_guaranteed_resources, distribute_map_resources
+from utils.start_positions import place_capitals
+from benchmarks.common import (
+    BENCHMARK_SIZES, compare_reports, make_result, measure, parse_size, print_summary, write_report
+)
+
+SUITE_NAME = "map_generation"
+
+# 게임 생성 기본 문명 수 (GameSessionCreate.civCount 기본값)
+DEFAULT_CIV_COUNT = 8
+
+BASE_SEED = 20240501
+
+
+def bench_generate_map(map_type: MapType, width: int, height: int, repeat: int) -> Dict:
+    # 매 반복마다 다른 시드 + 디스크 없는 캐시로 항상 실제 생성 시간을 측정
+    cache = MapCache(cache_dir=None, max_entries=1)
+    timings = measure(
+        lambda seed: cache.get_or_generate(map_type, width, height, seed, list(RESOURCE_IDS)),
+        repeat,
+        setup=lambda i: (BASE_SEED + i,)
+    )
+    return make_result("generate_map", timings, width * height, map_type=map_type.value, width=width, height=height)
+
+
+def bench_inland_sea(width: int, height: int, repeat: int) -> Dict:
+    timings = measure(
+        lambda seed: generate_inland_sea_map(width, height, seed=seed),
+        repeat,
+        setup=lambda i: (BASE_SEED + i,)
+    )
+    return make_result("generate_inland_sea_map", timings, width * height, map_type=None, width=width, height=height)
+
+
+def bench_placement(map_type: MapType, width: int, height: int, repeat: int, civ_count: int) -> List[Dict]:
+    """자원 분포/보장 자원/시작 위치 측정 (같은 생성 맵의 복사본에서 반복)"""
+    cache = MapCache(cache_dir=None, max_entries=1)
+    base_map = cache.get_or_generate(map_type, width, height, BASE_SEED, RESOURCE_IDS)
+    random.seed(BASE_SEED)
+    capitals = place_capitals(copy_map(base_map), civ_count)
+    tiles = width * height
+    params = {"map_type": map_type.value, "width": width, "height": height}
+
+    def with_seed(game_map):
+        random.seed(BASE_SEED)
+        return (game_map,)
+
+    results = [
+        make_result(
+            "distribute_map_resources",
+            measure(distribute_map_resources, repeat, setup=lambda i: with_seed(copy_map(base_map))),
+            tiles, **params
+        ),
+        make_result(
+            "assign_guaranteed_resources",
+            measure(
+                lambda game_map: assign_guaranteed_resources(game_map, capitals),
+                repeat,
+                setup=lambda i: with_seed(copy_map(base_map))
+            ),
+            tiles, **params
+        ),
+        make_result(
+            "start_positions",
+            measure(
+                lambda game_map: place_capitals(game_map, civ_count),
+                repeat,
+                setup=lambda i: with_seed(copy_map(base_map))
+            ),
+            tiles, civ_count=civ_count, **params
+        )
+    ]
+    return results
+
+
+def run(sizes, map_types, repeat: int, civ_count: int) -> List[Dict]:
+    results = []
+    for width, height in sizes:
+        results.append(bench_inland_sea(width, height, repeat))
+        for map_type in map_types:
+            results.append(bench_generate_map(map_type, width, height, repeat))
+            results.extend(bench_placement(map_type, width, height, repeat, civ_count))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="맵 생성 벤치마크")
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=BENCHMARK_SIZES, help="맵 크기 (예: 20x15 64x40)")
+    parser.add_argument("--map-types", nargs="+", type=MapType, default=list(MapType), help="측정할 MapType 값")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수")
+    parser.add_argument("--civ-count", type=int, default=DEFAULT_CIV_COUNT, help="시작 위치 탐색 문명 수")
+    parser.add_argument("--output", default="-", help="결과 JSON 경로 (기본: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.map_types, args.repeat, args.civ_count)
+    comparisons = compare_reports(args.compare, results) if args.compare else None
+    extra = {"comparison": comparisons} if comparisons is not None else None
+    write_report(SUITE_NAME, results, args.output, extra)
+    print_summary(results, comparisons)
+
+
+if __name__ == "__main__":
+    main()
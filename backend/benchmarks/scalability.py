@@ -0,0 +1,535 @@
+"""맵 크기별 엔드투엔드 지연 시간/DB 왕복 횟수 벤치마크 (목표 초과 시 종료 코드 1)
+
+backend 디렉터리에서 실행:
+    python -m benchmarks.scalability --output scalability.json
+    python -m benchmarks.scalability --map-sizes huge --repeat 3 --rtt-ms 2
+
+MapSize(Small 20x15, Large 64x40, Huge 128x80)마다 실제 API 핸들러를 메모리 DB 대체 객체 위에서 실행합니다.
+    create_game   routers.game.create_game_session (맵 풀/캐시 미적중 - 맵 생성과 배치 포함)
+    map_fetch     routers.game.get_session_map_chunks (맵 전체 청크)
+    unit_move     routers.game.move_unit (이웃 타일 왕복 이동)
+    end_turn      routers.game.end_turn (AI 턴 포함)
+
+DB는 호출(왕복)마다 --rtt-ms 만큼 기다리는 것으로 모델링하고, 대체 객체 자체의 조회/필터 연산 시간은 측정에서
+제외합니다. 따라서 지연 시간 = 서버 연산 시간 + 왕복 횟수 x RTT 입니다.
+중앙값이 LATENCY_TARGETS_MS를 넘거나 왕복 횟수가 ROUND_TRIP_LIMITS(맵 크기와 무관)를 넘으면 위반으로 보고합니다.
+create_game은 헥사곤 일괄 저장 배치 수(타일 수 / HEXAGON_BATCH_SIZE)만큼 추가 왕복을 허용합니다.
+"""
+import argparse
+import asyncio
+import copy
+import itertools
+import math
+import os
+import re
+import sys
+import time
+import uuid
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set, Tuple
+from core.config import settings
+from models.game import GameSessionCreate, TurnEndRequest
+from models.map import MAP_SIZE_DIMENSIONS, MapSize
+from routers import game as game_router
+from utils import map_persistence, map_pool, map_utils, production_utils, turn_manager
+from utils.hex_grid import HexGrid, hex_grids
+from utils.map_cache import MapCache
+from benchmarks.common import compare_reports, make_result, print_summary, write_report
+
+SUITE_NAME = "scalability"
+
+# 맵 크기/작업별 중앙값 지연 시간 목표 (ms, 기본 RTT 1ms 기준)
+LATENCY_TARGETS_MS: Dict[MapSize, Dict[str, float]] = {
+    MapSize.SMALL: {"create_game": 500, "map_fetch": 50, "unit_move": 50, "end_turn": 150},
+    MapSize.LARGE: {"create_game": 1000, "map_fetch": 150, "unit_move": 50, "end_turn": 150},
+    MapSize.HUGE: {"create_game": 2000, "map_fetch": 500, "unit_move": 50, "end_turn": 150}
+}
+
+# 작업별 DB 왕복 횟수 상한 (맵 크기와 무관해야 함)
+ROUND_TRIP_LIMITS: Dict[str, int] = {
+    "create_game": 80,
+    "map_fetch": 2,
+    "unit_move": 6,
+    "end_turn": 30
+}
+
+DEFAULT_RTT_MS = 1.0
+DEFAULT_CIV_COUNT = 8
+
+# 행 데이터 키를 검증할 Prisma 스키마 (backend/prisma/schema.prisma)
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "prisma", "schema.prisma")
+
+# 스키마에 없지만 기존 게임 생성 코드가 이미 쓰고 있는 필드 (스키마 정리 전까지 허용 - 새 필드는 추가하지 말 것)
+_LEGACY_FIELDS: Dict[str, Set[str]] = {
+    "player": {"civ_type"},
+    "unit": {"charges"}
+}
+
+# 대체 객체가 지원하는 필드 비교 연산
+_OPERATORS = {"equals", "not", "in", "gt", "gte", "lt", "lte"}
+
+# 자동 증가 id 대신 uuid 문자열 id를 쓰는 테이블
+_UUID_TABLES = {"gamesession", "mapseed"}
+
+# include 관계 - (테이블, 관계 이름): (대상 테이블, 대상 필드, 원본 필드, 여러 행 여부)
+_RELATIONS = {
+    ("gamesession", "players"): ("player", "session_id", "id", True),
+    ("unit", "owner"): ("player", "id", "owner_player_id", False),
+    ("unit", "unit_type"): ("unittype", "id", "unit_type_id", False),
+    ("researchprogress", "tech"): ("tech", "id", "tech_id", False)
+}
+
+
+def load_schema_fields(path: str = SCHEMA_PATH) -> Dict[str, Set[str]]:
+    """Prisma 스키마의 모델별 필드 이름 (prisma_client 접근 이름(소문자 모델명) -> 컬럼/관계 필드 집합)"""
+    fields: Dict[str, Set[str]] = {}
+    model = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("//", 1)[0].strip()
+            header = re.match(r"model\s+(\w+)\s*\{", line)
+            if header:
+                model = fields.setdefault(header.group(1).lower(), set())
+            elif line.startswith("}"):
+                model = None
+            elif model is not None and line and not line.startswith("@@"):
+                model.add(line.split()[0])
+    return fields
+
+
+class Row(SimpleNamespace):
+    """DB 행 - 저장하지 않은 nullable 컬럼은 None"""
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return None
+
+
+def _match_field(value: Any, condition: Any) -> bool:
+    if not isinstance(condition, dict):
+        return value == condition
+    for op, operand in condition.items():
+        if op == "equals" and value != operand:
+            return False
+        if op == "not" and _match_field(value, operand):
+            return False
+        if op == "in" and value not in operand:
+            return False
+        if op in ("gt", "gte", "lt", "lte") and value is None:
+            return False
+        if op == "gt" and not value > operand:
+            return False
+        if op == "gte" and not value >= operand:
+            return False
+        if op == "lt" and not value < operand:
+            return False
+        if op == "lte" and not value <= operand:
+            return False
+    return True
+
+
+def matches(row: Row, where: Optional[Dict[str, Any]]) -> bool:
+    """Prisma where 조건 평가 (필드 비교, AND/OR/NOT, 복합 고유 키)"""
+    for key, condition in (where or {}).items():
+        if key == "AND":
+            if not all(matches(row, sub) for sub in condition):
+                return False
+        elif key == "OR":
+            if not any(matches(row, sub) for sub in condition):
+                return False
+        elif key == "NOT":
+            if matches(row, condition):
+                return False
+        elif isinstance(condition, dict) and not set(condition) <= _OPERATORS:
+            # 복합 고유 키 (예: session_id_q_r_s, ux_map_seed_config)
+            if not matches(row, condition):
+                return False
+        elif not _match_field(getattr(row, key), condition):
+            return False
+    return True
+
+
+class InMemoryTable:
+    """prisma_client.<model> 대체 - 호출마다 DB 왕복 1회로 기록"""
+
+    def __init__(self, db: "InMemoryDB", name: str):
+        self.db = db
+        self.name = name
+        self.rows: List[Row] = []
+
+    def _check_fields(self, data: Dict[str, Any]):
+        """스키마에 없는 모델/필드를 쓰면 실제 Prisma처럼 실패 (일괄 저장 한 건의 잘못된 필드가 측정에서 가려지지 않도록)"""
+        fields = self.db.schema.get(self.name)
+        if fields is None:
+            raise ValueError(f"Prisma 스키마에 없는 모델입니다: {self.name}")
+        unknown = set(data) - fields - _LEGACY_FIELDS.get(self.name, set())
+        if unknown:
+            raise ValueError(f"{self.name} 모델에 없는 필드입니다: {sorted(unknown)}")
+
+    def _new_row(self, data: Dict[str, Any]) -> Row:
+        self._check_fields(data)
+        data = dict(data)
+        if "id" not in data and self.name != "hexagon":
+            data["id"] = str(uuid.uuid4()) if self.name in _UUID_TABLES else next(self.db.ids)
+        return Row(**data)
+
+    def _with_includes(self, row: Optional[Row], include: Optional[Dict[str, Any]]) -> Optional[Row]:
+        if row is None or not include:
+            return row
+        row = copy.copy(row)
+        for relation in include:
+            target, target_field, source_field, many = _RELATIONS[(self.name, relation)]
+            related = [r for r in self.db.table(target).rows if getattr(r, target_field) == getattr(row, source_field)]
+            setattr(row, relation, related if many else (related[0] if related else None))
+        return row
+
+    def _find(self, where) -> List[Row]:
+        return [row for row in self.rows if matches(row, where)]
+
+    async def find_unique(self, where, include=None):
+        async with self.db.round_trip():
+            found = self._find(where)
+            return self._with_includes(found[0] if found else None, include)
+
+    async def find_first(self, where=None, include=None, **kwargs):
+        return await self.find_unique(where, include)
+
+    async def find_many(self, where=None, include=None, **kwargs):
+        async with self.db.round_trip():
+            return [self._with_includes(row, include) for row in self._find(where)]
+
+    async def create(self, data, include=None):
+        async with self.db.round_trip():
+            row = self._new_row(data)
+            self.rows.append(row)
+            return self._with_includes(row, include)
+
+    async def create_many(self, data, skip_duplicates=False):
+        async with self.db.round_trip():
+            self.rows.extend(self._new_row(item) for item in data)
+            return len(data)
+
+    async def update(self, where, data, include=None):
+        async with self.db.round_trip():
+            self._check_fields(data)
+            found = self._find(where)
+            if not found:
+                return None
+            found[0].__dict__.update(data)
+            return self._with_includes(found[0], include)
+
+    async def update_many(self, where, data):
+        async with self.db.round_trip():
+            self._check_fields(data)
+            found = self._find(where)
+            for row in found:
+                row.__dict__.update(data)
+            return len(found)
+
+    async def upsert(self, where, data):
+        async with self.db.round_trip():
+            self._check_fields(data["update"])
+            found = self._find(where)
+            if found:
+                found[0].__dict__.update(data["update"])
+                return found[0]
+            row = self._new_row(data["create"])
+            self.rows.append(row)
+            return row
+
+    async def delete(self, where):
+        async with self.db.round_trip():
+            found = self._find(where)
+            for row in found:
+                self.rows.remove(row)
+            return found[0] if found else None
+
+
+class InMemoryDB:
+    """prisma_client 대체 - 호출마다 RTT만큼 기다리고 왕복 횟수와 자체 연산 시간을 기록"""
+
+    def __init__(self, rtt_seconds: float, schema: Optional[Dict[str, Set[str]]] = None):
+        self.rtt_seconds = rtt_seconds
+        self.schema = schema if schema is not None else load_schema_fields()
+        self.tables: Dict[str, InMemoryTable] = {}
+        self.ids = itertools.count(1)
+        self.round_trips = 0
+        self.busy_seconds = 0.0
+
+    def table(self, name: str) -> InMemoryTable:
+        if name not in self.tables:
+            self.tables[name] = InMemoryTable(self, name)
+        return self.tables[name]
+
+    def __getattr__(self, name: str) -> InMemoryTable:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.table(name)
+
+    def round_trip(self) -> "_RoundTrip":
+        return _RoundTrip(self)
+
+    def tx(self, timeout=None) -> "_Transaction":
+        return _Transaction(self)
+
+    async def raw_query(self, query: str):
+        async with self.round_trip():
+            return []
+
+    def reset_counters(self):
+        self.round_trips = 0
+        self.busy_seconds = 0.0
+
+
+class _RoundTrip:
+    """DB 호출 한 번 - 네트워크 RTT는 기다리고 대체 객체 연산 시간은 busy_seconds로 따로 집계"""
+
+    def __init__(self, db: InMemoryDB):
+        self.db = db
+
+    async def __aenter__(self):
+        self.db.round_trips += 1
+        await asyncio.sleep(self.db.rtt_seconds)
+        self.start = time.perf_counter()
+
+    async def __aexit__(self, *exc):
+        self.db.busy_seconds += time.perf_counter() - self.start
+        return False
+
+
+class _Transaction:
+    """prisma_client.tx() 대체 - 시작/커밋을 각각 왕복 1회로 기록"""
+
+    def __init__(self, db: InMemoryDB):
+        self.db = db
+
+    async def __aenter__(self) -> InMemoryDB:
+        async with self.db.round_trip():
+            return self.db
+
+    async def __aexit__(self, *exc):
+        async with self.db.round_trip():
+            return False
+
+
+# prisma_client를 모듈 전역으로 가져다 쓰는 모듈 (벤치마크 동안 대체 객체로 교체)
+_DB_MODULES = [game_router, map_persistence, map_utils, production_utils, turn_manager]
+
+
+class patched_db:
+    """_DB_MODULES의 prisma_client와 맵 캐시를 교체하고 끝나면 복구"""
+
+    def __init__(self, db: InMemoryDB):
+        self.db = db
+
+    def __enter__(self):
+        self.originals = [(module, module.prisma_client) for module in _DB_MODULES]
+        self.original_cache = map_pool.map_cache
+        for module in _DB_MODULES:
+            module.prisma_client = self.db
+        return self.db
+
+    def __exit__(self, *exc):
+        for module, client in self.originals:
+            module.prisma_client = client
+        map_pool.map_cache = self.original_cache
+        return False
+
+
+def fresh_map_cache():
+    """디스크 없는 빈 캐시와 빈 최근 맵 LRU - 매 게임 생성이 실제 맵 생성/배치를 거치도록"""
+    map_pool.map_cache = MapCache(cache_dir=None, max_entries=1)
+    map_pool.map_pool.clear_recent()
+
+
+def clone_db(base: InMemoryDB) -> InMemoryDB:
+    """기본 게임 데이터(유닛 타입/지형/자원)가 채워진 DB 복사본"""
+    db = InMemoryDB(base.rtt_seconds, base.schema)
+    for name, table in base.tables.items():
+        db.table(name).rows = [copy.copy(row) for row in table.rows]
+    db.ids = itertools.count(next(base.ids) + 1000)
+    return db
+
+
+def timed(loop, db: InMemoryDB, coro) -> Tuple[Any, float, int]:
+    """코루틴 실행 - (결과, 대체 객체 연산을 뺀 소요 시간(초), DB 왕복 횟수)"""
+    db.reset_counters()
+    start = time.perf_counter()
+    result = loop.run_until_complete(coro)
+    elapsed = time.perf_counter() - start - db.busy_seconds
+    return result, elapsed, db.round_trips
+
+
+def game_request(civ_count: int, map_size: MapSize, index: int) -> GameSessionCreate:
+    # 문명 선택을 바꿔 매번 새 MapSeed(새 시드)를 만들도록 함
+    civs = ["korea", "japan", "china", "rome", "egypt", "france", "germany", "england"]
+    return GameSessionCreate(
+        playerName="bench",
+        mapSize=map_size,
+        playerCiv=civs[index % len(civs)],
+        civCount=civ_count
+    )
+
+
+def move_targets(grid: HexGrid, db: InMemoryDB) -> Tuple[Any, List[Tuple[int, int, int]]]:
+    """플레이어 정찰병과 수도 주변의 비어 있는 이동 가능 타일 두 곳 (두 타일 사이를 오가며 측정)"""
+    game_id = grid.session_id
+    player = next(p for p in db.table("player").rows if p.session_id == game_id and not p.is_ai)
+    scout = next(
+        u for u in db.table("unit").rows
+        if u.owner_player_id == player.id and u.unit_type_id == "scout"
+    )
+    origin = grid.index_of(scout.loc_q, scout.loc_r, scout.loc_s)
+    occupied = {(u.loc_q, u.loc_r) for u in db.table("unit").rows if u.session_id == game_id}
+    targets = []
+    for index in grid.within(scout.loc_q, scout.loc_r, 1).tolist():
+        q, r, s = grid.coords([index])[0]
+        if (
+            (q, r) not in occupied
+            and grid.terrain_id(index) not in ("ocean", "coast", "lake", "mountain")
+            and grid.same_landmass(origin, index)
+        ):
+            targets.append((q, r, s))
+    return scout, targets[:2]
+
+
+def bench_size(map_size: MapSize, base_db: InMemoryDB, repeat: int, civ_count: int) -> List[Dict]:
+    width, height = MAP_SIZE_DIMENSIONS[map_size]
+    tiles = width * height
+    params = {"map_type": map_size.value, "width": width, "height": height}
+    timings: Dict[str, List[float]] = {name: [] for name in ROUND_TRIP_LIMITS}
+    round_trips: Dict[str, int] = {name: 0 for name in ROUND_TRIP_LIMITS}
+
+    def record(name: str, elapsed: float, trips: int):
+        timings[name].append(elapsed)
+        round_trips[name] = max(round_trips[name], trips)
+
+    loop = asyncio.new_event_loop()
+    try:
+        for i in range(repeat):
+            db = clone_db(base_db)
+            with patched_db(db):
+                fresh_map_cache()
+                session, elapsed, trips = timed(
+                    loop, db, game_router.create_game_session(game_request(civ_count, map_size, i))
+                )
+                record("create_game", elapsed, trips)
+                game_id = session.id
+                player_id = session.initialState["playerId"]
+
+                chunk_size = settings.MAP_CHUNK_SIZE
+                chunks = ",".join(
+                    f"{cq}:{cr}"
+                    for cq in range(math.ceil(width / chunk_size))
+                    for cr in range(math.ceil(height / chunk_size))
+                )
+                _, elapsed, trips = timed(
+                    loop, db, game_router.get_session_map_chunks(game_id, chunks, None, None, None, None, None)
+                )
+                record("map_fetch", elapsed, trips)
+
+                grid = loop.run_until_complete(hex_grids.get(db, game_id))
+                scout, targets = move_targets(grid, db)
+                for q, r, s in targets:
+                    scout.movement = scout.max_movement
+                    _, elapsed, trips = timed(loop, db, game_router.move_unit(game_id, scout.id, q, r, s))
+                    record("unit_move", elapsed, trips)
+
+                _, elapsed, trips = timed(
+                    loop, db, game_router.end_turn(TurnEndRequest(game_id=game_id, player_id=player_id))
+                )
+                record("end_turn", elapsed, trips)
+                hex_grids.forget(game_id)
+    finally:
+        loop.close()
+
+    results = []
+    for name, values in timings.items():
+        if not values:
+            continue
+        result = make_result(name, values, tiles, **params)
+        result["round_trips"] = round_trips[name]
+        results.append(result)
+    return results
+
+
+def round_trip_limit(name: str, tiles: int) -> int:
+    limit = ROUND_TRIP_LIMITS[name]
+    if name == "create_game":
+        limit += math.ceil(tiles / settings.HEXAGON_BATCH_SIZE)
+    return limit
+
+
+def check_targets(results: List[Dict], rtt_ms: float) -> List[str]:
+    """목표를 넘은 항목 설명 목록 (비어 있으면 통과)"""
+    violations = []
+    for result in results:
+        name = result["benchmark"]
+        map_size = MapSize(result["map_type"])
+        # RTT가 기본값보다 길면 늘어난 왕복 대기 시간만큼 목표를 늘림
+        target = LATENCY_TARGETS_MS[map_size][name] + result["round_trips"] * max(0.0, rtt_ms - DEFAULT_RTT_MS)
+        median = result["wall_time_ms"]["median"]
+        result["target_ms"] = round(target, 3)
+        result["round_trip_limit"] = round_trip_limit(name, result["tiles"])
+        if median > target:
+            violations.append(f"{name} {map_size.value}: 중앙값 {median:.1f}ms > 목표 {target:.1f}ms")
+        if result["round_trips"] > result["round_trip_limit"]:
+            violations.append(
+                f"{name} {map_size.value}: DB 왕복 {result['round_trips']}회 > 상한 {result['round_trip_limit']}회"
+            )
+    return violations
+
+
+def seeded_db(rtt_ms: float) -> InMemoryDB:
+    """기본 게임 데이터를 미리 채운 DB (측정 대상 아님)"""
+    db = InMemoryDB(0.0)
+    with patched_db(db):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(game_router.ensure_basic_game_data())
+        finally:
+            loop.close()
+    db.rtt_seconds = rtt_ms / 1000
+    return db
+
+
+def run(map_sizes, repeat: int, civ_count: int, rtt_ms: float) -> List[Dict]:
+    base_db = seeded_db(rtt_ms)
+    results = []
+    for map_size in map_sizes:
+        results.extend(bench_size(map_size, base_db, repeat, civ_count))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="맵 크기별 엔드투엔드 지연 시간 벤치마크")
+    parser.add_argument("--map-sizes", nargs="+", type=MapSize, default=list(MapSize), help="측정할 MapSize 값")
+    parser.add_argument("--repeat", type=int, default=3, help="크기별 반복 횟수")
+    parser.add_argument("--civ-count", type=int, default=DEFAULT_CIV_COUNT, help="게임 생성 문명 수")
+    parser.add_argument("--rtt-ms", type=float, default=DEFAULT_RTT_MS, help="DB 호출 1회당 왕복 지연 (ms)")
+    parser.add_argument("--output", default="-", help="결과 JSON 경로 (기본: 표준 출력)")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    results = run(args.map_sizes, args.repeat, args.civ_count, args.rtt_ms)
+    violations = check_targets(results, args.rtt_ms)
+    comparisons = compare_reports(args.compare, results) if args.compare else None
+    extra = {"rtt_ms": args.rtt_ms, "violations": violations}
+    if comparisons is not None:
+        extra["comparison"] = comparisons
+    write_report(SUITE_NAME, results, args.output, extra)
+    print_summary(results, comparisons)
+    for result in results:
+        print(
+            f"{result['benchmark']:<28} {result['map_type']:<18} DB 왕복 {result['round_trips']:>4}회 "
+            f"(상한 {result['round_trip_limit']}), 목표 {result['target_ms']}ms",
+            file=sys.stderr
+        )
+    for violation in violations:
+        print(f"목표 초과: {violation}", file=sys.stderr)
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
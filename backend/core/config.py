@@ -22,6 +22,55 @@ class Settings(BaseSettings):
     DEFAULT_MAP_WIDTH: int = 20
     DEFAULT_MAP_HEIGHT: int = 15
     
+    # 지형 생성기 (continent_seeds, noise, auto - auto는 큰 맵에서만 noise 사용)
+    TERRAIN_ENGINE: str = os.getenv("TERRAIN_ENGINE", "auto")
+    
+    # 맵 타일 일괄 저장 설정 (create_many 1회당 행 수, 트랜잭션 제한 시간)
+    HEXAGON_BATCH_SIZE: int = int(os.getenv("HEXAGON_BATCH_SIZE", "1000"))
+    HEXAGON_WRITE_TIMEOUT_SECONDS: int = int(os.getenv("HEXAGON_WRITE_TIMEOUT_SECONDS", "30"))
+    
+    # 생성 맵 캐시 설정 (프로세스 내 LRU 항목 수, 압축 디스크 저장 경로 - 비우면 디스크 캐시 미사용)
+    MAP_CACHE_SIZE: int = int(os.getenv("MAP_CACHE_SIZE", "64"))
+    MAP_CACHE_DIR: str = os.getenv("MAP_CACHE_DIR", "map_cache")
+    
+    # 사전 생성 맵 풀 설정 (맵 타입/문명 수별 보관 개수 - 0이면 비활성화)
+    MAP_POOL_SIZE: int = int(os.getenv("MAP_POOL_SIZE", "2"))
+    # 이미 시드가 기록된 설정용으로 배치까지 끝난 맵을 보관할 LRU 항목 수 ((시드, 맵 타입, 크기, 문명 수) 키)
+    MAP_POOL_RECENT_SIZE: int = int(os.getenv("MAP_POOL_RECENT_SIZE", "64"))
+    # 맵 풀 채우기 동시 실행 수 (CPU 풀 대기열 한도보다 작게 제한해 요청 작업 자리를 남김), 실패 시 재시도 대기 시간(초, 실패할 때마다 2배 - 최대값)
+    MAP_POOL_REFILL_CONCURRENCY: int = int(os.getenv("MAP_POOL_REFILL_CONCURRENCY", "1"))
+    MAP_POOL_REFILL_BACKOFF_SECONDS: float = float(os.getenv("MAP_POOL_REFILL_BACKOFF_SECONDS", "1"))
+    MAP_POOL_REFILL_MAX_BACKOFF_SECONDS: float = float(os.getenv("MAP_POOL_REFILL_MAX_BACKOFF_SECONDS", "60"))
+    
+    # CPU 연산용 프로세스 풀 설정 (워커 수 - 0이면 이벤트 루프에서 직접 실행(실행 중 루프 정지), 실행 대기 최대 작업 수, 작업 제한 시간)
+    CPU_POOL_WORKERS: int = int(os.getenv("CPU_POOL_WORKERS", "2"))
+    CPU_POOL_MAX_QUEUE: int = int(os.getenv("CPU_POOL_MAX_QUEUE", "16"))
+    CPU_POOL_TASK_TIMEOUT_SECONDS: int = int(os.getenv("CPU_POOL_TASK_TIMEOUT_SECONDS", "30"))
+    
+    # 턴별 게임 상태 저장 설정 (키프레임 간격 - 사이 턴은 이전 턴 대비 변경분만 저장, 복원 상태 LRU 항목 수)
+    STATE_KEYFRAME_INTERVAL: int = int(os.getenv("STATE_KEYFRAME_INTERVAL", "10"))
+    STATE_HISTORY_CACHE_SIZE: int = int(os.getenv("STATE_HISTORY_CACHE_SIZE", "64"))
+    
+    # 맵 청크 조회 설정 (청크 한 변의 타일 수, 요청당 최대 청크 수)
+    MAP_CHUNK_SIZE: int = int(os.getenv("MAP_CHUNK_SIZE", "16"))
+    MAP_CHUNK_MAX_PER_REQUEST: int = int(os.getenv("MAP_CHUNK_MAX_PER_REQUEST", "64"))
+    
+    # 게임 세션별 메모리 헥스 그리드 캐시 크기 (세션 수)
+    HEX_GRID_CACHE_SIZE: int = int(os.getenv("HEX_GRID_CACHE_SIZE", "32"))
+    
+    # 경로 탐색/이동 범위 결과 캐시 크기 (각각의 항목 수)
+    PATH_CACHE_SIZE: int = int(os.getenv("PATH_CACHE_SIZE", "4096"))
+    
+    # 유닛 일괄 이동 요청당 최대 이동 수
+    UNIT_BATCH_MOVE_MAX: int = int(os.getenv("UNIT_BATCH_MOVE_MAX", "100"))
+    
+    # 시작 위치 균형 설정 (수도별 도시 반경 총 수확량 지니 계수 목표, 자원 조정 시간 예산)
+    START_BALANCE_GINI_THRESHOLD: float = float(os.getenv("START_BALANCE_GINI_THRESHOLD", "0.03"))
+    START_BALANCE_TIME_BUDGET_MS: int = int(os.getenv("START_BALANCE_TIME_BUDGET_MS", "50"))
+    
+    # 수도 배치 개선 시간 예산 (초과 시 경고 후 현재 배치 사용)
+    START_PLACEMENT_TIME_BUDGET_MS: int = int(os.getenv("START_PLACEMENT_TIME_BUDGET_MS", "500"))
+    
     # API 설정
     API_PREFIX: str = "/api"
     
@@ -2,6 +2,9 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from routers import game, map, websocket, research, city
 from core.config import Settings, prisma_client
+from utils.map_pool import map_pool
+from utils.cpu_pool import cpu_pool
+from utils.start_balance import load_yield_data
 import uvicorn
 import os
 import logging
@@ -36,9 +39,22 @@ app.include_router(city.router, prefix="/city", tags=["City"])
 @app.on_event("startup")
 async def startup():
     await prisma_client.connect()
+    
+    # 맵 생성 등 CPU 연산용 프로세스 풀 시작
+    cpu_pool.start()
+    
+    # 기본 데이터(유닛 타입, 지형, 자원)를 먼저 채움 - 빈 DB에서 자원 목록 없이 맵 풀을 채우면
+    # 자원 없는 맵의 시드가 MapSeed에 기록되고, 재시작 후 같은 시드가 자원 있는 다른 맵으로 재현됨
+    await game.ensure_basic_game_data()
+    
+    # 사전 생성 맵 풀 채우기 시작 (DB에 존재하는 자원만 배치, 시작 위치 균형은 DB 수확량 기준)
+    terrain_yields, resource_types = await load_yield_data(prisma_client)
+    map_pool.start(list(resource_types), terrain_yields, resource_types)
 
 @app.on_event("shutdown")
 async def shutdown():
+    await map_pool.stop()
+    await cpu_pool.stop()
     await prisma_client.disconnect()
 
 @app.get("/")
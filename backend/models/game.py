@@ -5,7 +5,7 @@ from enum import Enum
 from pydantic import BaseModel, Field
 from datetime import datetime
 from typing import Optional
-from models.map import MapType, Difficulty
+from models.map import MapType, MapSize, Difficulty
 
 class GameSpeed(str, Enum):
     """게임 속도 구분"""
@@ -131,6 +131,7 @@ class GameSessionCreate(BaseModel):
     """게임 세션 생성을 위한 모델"""
     playerName: str
     mapType: MapType = MapType.CONTINENTS
+    mapSize: MapSize = MapSize.SMALL
     difficulty: Difficulty = Difficulty.NORMAL
     gameSpeed: GameSpeed = GameSpeed.STANDARD
     playerCiv: str  # 선택한 문명 
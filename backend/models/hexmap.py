@@ -1,6 +1,9 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal, Dict, Any
+from pydantic import BaseModel, Field, GetCoreSchemaHandler
+from pydantic_core import core_schema
+from typing import List, Optional, Literal, Dict, Any, Iterable, Iterator, NamedTuple, Union
 from enum import Enum
+from functools import lru_cache
+import numpy as np
 
 class TerrainType(str, Enum):
     """지형 타입 enum"""
@@ -44,6 +47,43 @@ class HexCoord(BaseModel):
         # 내부적으로 s = -q-r 관계를 유지
         self.s = -self.q - self.r
 
+    def to_hex(self) -> "Hex":
+        return hex_at(self.q, self.r)
+
+# 내부 연산용 좌표 인터닝 캐시 크기 (256x160 맵 타일 수 이상)
+HEX_INTERN_SIZE = 1 << 16
+
+class Hex(NamedTuple):
+    """내부 연산용 경량 헥스 좌표 (튜플 기반 - 불변, 해시 가능, 같은 값의 (q, r, s) 튜플과 동일하게 비교/해시)
+
+    API 경계에서는 Hex.of()로 HexCoord 모델/딕셔너리를 변환하고, 응답에는 to_dict()/to_model()을 사용합니다.
+    """
+    q: int
+    r: int
+    s: int
+
+    @classmethod
+    def of(cls, value: Any) -> "Hex":
+        """HexCoord 모델, {"q", "r"[, "s"]} 딕셔너리, (q, r[, s]) 시퀀스를 Hex로 변환 (s는 항상 -q - r)"""
+        if isinstance(value, Hex):
+            return value
+        if isinstance(value, dict):
+            return hex_at(int(value["q"]), int(value["r"]))
+        if hasattr(value, "q") and hasattr(value, "r"):
+            return hex_at(int(value.q), int(value.r))
+        return hex_at(int(value[0]), int(value[1]))
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"q": self.q, "r": self.r, "s": self.s}
+
+    def to_model(self) -> HexCoord:
+        return HexCoord(q=self.q, r=self.r)
+
+@lru_cache(maxsize=HEX_INTERN_SIZE)
+def hex_at(q: int, r: int) -> Hex:
+    """(q, r) 좌표의 Hex (같은 좌표는 같은 객체를 재사용)"""
+    return Hex(q, r, -q - r)
+
 class HexTile(BaseModel):
     """헥사곤 타일 모델"""
     q: int
@@ -63,17 +103,248 @@ class Civilization(BaseModel):
     capital_tile: HexCoord
     units: List[str] = []
 
+# 지원하는 최대 맵 크기 (노이즈 지형 생성기 기준)
+MAX_MAP_WIDTH = 256
+MAX_MAP_HEIGHT = 160
+
 class MapInitRequest(BaseModel):
     """맵 초기화 요청 모델"""
-    width: int = Field(default=11, ge=5, le=20)
-    height: int = Field(default=9, ge=5, le=20)
+    width: int = Field(default=11, ge=5, le=MAX_MAP_WIDTH)
+    height: int = Field(default=9, ge=5, le=MAX_MAP_HEIGHT)
     ai_civs: List[str] = ["Japan", "China", "Mongolia", "Russia", "Rome"]
     player_civ: str = "Korea"
     map_type: str = "continental"  # continental, pangaea, archipelago 등
 
+# TileStore 배열에 저장하는 지형/자원 코드 (목록 인덱스, 자원 -1은 없음)
+TERRAIN_CODES: List[TerrainType] = list(TerrainType)
+RESOURCE_CODES: List[ResourceType] = list(ResourceType)
+NO_RESOURCE_CODE = -1
+TERRAIN_CODE_INDEX = {terrain: code for code, terrain in enumerate(TERRAIN_CODES)}
+RESOURCE_CODE_INDEX = {resource: code for code, resource in enumerate(RESOURCE_CODES)}
+
+# 직렬화용 문자열 값 (자원 목록 끝의 None은 코드 -1에 대응)
+_TERRAIN_VALUES = [terrain.value for terrain in TERRAIN_CODES]
+_RESOURCE_VALUES = [resource.value for resource in RESOURCE_CODES] + [None]
+
+# 타일마다 값이 있는 경우가 드문 문자열 필드 (인덱스 -> 값 딕셔너리로 저장)
+SPARSE_TILE_FIELDS = ("occupant", "city_id", "unit_id")
+
+
+class TileStore:
+    """타일 목록을 필드별 배열로 보관하는 저장소 (struct-of-arrays)
+
+    좌표는 int32, 지형/자원은 int8 코드, 시야/탐험 여부는 비트 배열로 저장하고
+    점유자/도시/유닛 ID처럼 드문 값은 인덱스별 딕셔너리에 둡니다.
+    인덱스/반복 접근 시에는 HexTile을 그때그때 만들어 반환하므로 기존 List[HexTile]처럼 쓸 수 있지만,
+    반환된 HexTile은 복사본이라 변경은 update()로 해야 합니다.
+    """
+
+    __slots__ = ("q", "r", "terrain", "resource", "_visible_bits", "_explored_bits", "_sparse", "_index")
+
+    def __init__(
+        self,
+        q: np.ndarray,
+        r: np.ndarray,
+        terrain: np.ndarray,
+        resource: np.ndarray,
+        visible: np.ndarray,
+        explored: np.ndarray,
+        occupant: Optional[Dict[int, str]] = None,
+        city_id: Optional[Dict[int, str]] = None,
+        unit_id: Optional[Dict[int, str]] = None
+    ):
+        self.q = np.ascontiguousarray(q, dtype=np.int32).ravel()
+        self.r = np.ascontiguousarray(r, dtype=np.int32).ravel()
+        self.terrain = np.ascontiguousarray(terrain, dtype=np.int8).ravel()
+        self.resource = np.ascontiguousarray(resource, dtype=np.int8).ravel()
+        self._visible_bits = np.packbits(np.asarray(visible, dtype=bool).ravel())
+        self._explored_bits = np.packbits(np.asarray(explored, dtype=bool).ravel())
+        self._sparse: Dict[str, Dict[int, str]] = {
+            "occupant": dict(occupant or {}),
+            "city_id": dict(city_id or {}),
+            "unit_id": dict(unit_id or {})
+        }
+        self._index: Optional[Dict[tuple, int]] = None
+
+    @classmethod
+    def from_tiles(cls, tiles: Iterable[Union[HexTile, Dict[str, Any]]]) -> "TileStore":
+        """HexTile 또는 타일 딕셔너리(stateData의 tiles) 목록에서 생성"""
+        tiles = [tile.model_dump() if isinstance(tile, HexTile) else tile for tile in tiles]
+        sparse = {field: {} for field in SPARSE_TILE_FIELDS}
+        for index, tile in enumerate(tiles):
+            for field in SPARSE_TILE_FIELDS:
+                value = tile.get(field)
+                if value is not None:
+                    sparse[field][index] = value
+        return cls(
+            q=np.fromiter((tile["q"] for tile in tiles), dtype=np.int32, count=len(tiles)),
+            r=np.fromiter((tile["r"] for tile in tiles), dtype=np.int32, count=len(tiles)),
+            terrain=np.fromiter(
+                (TERRAIN_CODE_INDEX[tile["terrain"]] for tile in tiles), dtype=np.int8, count=len(tiles)
+            ),
+            resource=np.fromiter(
+                (
+                    NO_RESOURCE_CODE if tile.get("resource") is None else RESOURCE_CODE_INDEX[tile["resource"]]
+                    for tile in tiles
+                ),
+                dtype=np.int8,
+                count=len(tiles)
+            ),
+            visible=np.fromiter((bool(tile.get("visible")) for tile in tiles), dtype=bool, count=len(tiles)),
+            explored=np.fromiter((bool(tile.get("explored")) for tile in tiles), dtype=bool, count=len(tiles)),
+            **sparse
+        )
+
+    @classmethod
+    def validate(cls, value: Any) -> "TileStore":
+        """pydantic 필드 검증 - TileStore는 그대로, 타일 목록은 변환"""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, (list, tuple)):
+            return cls.from_tiles(value)
+        raise TypeError(f"TileStore 또는 타일 목록이어야 합니다: {type(value).__name__}")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            json_schema_input_schema=handler.generate_schema(List[HexTile]),
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda store: store.to_dicts())
+        )
+
+    def __len__(self) -> int:
+        return len(self.q)
+
+    def __getitem__(self, index: int) -> HexTile:
+        return self.tile(index)
+
+    def __iter__(self) -> Iterator[HexTile]:
+        for index in range(len(self)):
+            yield self.tile(index)
+
+    @property
+    def visible(self) -> np.ndarray:
+        return np.unpackbits(self._visible_bits, count=len(self)).astype(bool)
+
+    @property
+    def explored(self) -> np.ndarray:
+        return np.unpackbits(self._explored_bits, count=len(self)).astype(bool)
+
+    @staticmethod
+    def _bit(bits: np.ndarray, index: int) -> bool:
+        return bool((bits[index >> 3] >> (7 - (index & 7))) & 1)
+
+    @staticmethod
+    def _set_bit(bits: np.ndarray, index: int, value: bool):
+        mask = np.uint8(1 << (7 - (index & 7)))
+        if value:
+            bits[index >> 3] |= mask
+        else:
+            bits[index >> 3] &= ~mask
+
+    def index_of(self, q: int, r: int) -> Optional[int]:
+        """(q, r) 좌표의 타일 인덱스 (없으면 None)"""
+        if self._index is None:
+            self._index = {coord: index for index, coord in enumerate(zip(self.q.tolist(), self.r.tolist()))}
+        return self._index.get((q, r))
+
+    def sparse_values(self, field: str) -> Dict[int, str]:
+        """희소 문자열 필드(occupant, city_id, unit_id)의 인덱스 -> 값 (복사본)"""
+        return dict(self._sparse[field])
+
+    def tile(self, index: int) -> HexTile:
+        """인덱스 위치의 타일을 HexTile로 반환 (복사본)"""
+        if index < 0:
+            index += len(self)
+        q, r = int(self.q[index]), int(self.r[index])
+        resource = int(self.resource[index])
+        return HexTile(
+            q=q,
+            r=r,
+            s=-q - r,
+            terrain=TERRAIN_CODES[self.terrain[index]],
+            resource=None if resource == NO_RESOURCE_CODE else RESOURCE_CODES[resource],
+            occupant=self._sparse["occupant"].get(index),
+            city_id=self._sparse["city_id"].get(index),
+            unit_id=self._sparse["unit_id"].get(index),
+            visible=self._bit(self._visible_bits, index),
+            explored=self._bit(self._explored_bits, index)
+        )
+
+    def get(self, q: int, r: int) -> Optional[HexTile]:
+        index = self.index_of(q, r)
+        return None if index is None else self.tile(index)
+
+    def update(self, index: int, **fields):
+        """타일 필드 변경 (q, r, s 제외)"""
+        for field, value in fields.items():
+            if field == "terrain":
+                self.terrain[index] = TERRAIN_CODE_INDEX[value]
+            elif field == "resource":
+                self.resource[index] = NO_RESOURCE_CODE if value is None else RESOURCE_CODE_INDEX[value]
+            elif field == "visible":
+                self._set_bit(self._visible_bits, index, value)
+            elif field == "explored":
+                self._set_bit(self._explored_bits, index, value)
+            elif field in SPARSE_TILE_FIELDS:
+                if value is None:
+                    self._sparse[field].pop(index, None)
+                else:
+                    self._sparse[field][index] = value
+            else:
+                raise KeyError(f"변경할 수 없는 타일 필드입니다: {field}")
+
+    def to_dicts(self, indices: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
+        """HexTile.model_dump(mode="json")과 같은 형태의 타일 딕셔너리 목록 (stateData/응답 직렬화용)
+
+        indices를 주면 해당 인덱스 타일만 그 순서대로 반환합니다.
+        """
+        if indices is None:
+            positions = None
+            tiles = self._tile_dicts(self.q, self.r, self.terrain, self.resource, self.visible, self.explored)
+        else:
+            indices = np.asarray(indices, dtype=np.intp)
+            positions = {index: position for position, index in enumerate(indices.tolist())}
+            tiles = self._tile_dicts(
+                self.q[indices], self.r[indices], self.terrain[indices], self.resource[indices],
+                self.visible[indices], self.explored[indices]
+            )
+        for field, values in self._sparse.items():
+            for index, value in values.items():
+                position = index if positions is None else positions.get(index)
+                if position is not None:
+                    tiles[position][field] = value
+        return tiles
+
+    @staticmethod
+    def _tile_dicts(q, r, terrain, resource, visible, explored) -> List[Dict[str, Any]]:
+        return [
+            {
+                "q": q,
+                "r": r,
+                "s": -q - r,
+                "terrain": _TERRAIN_VALUES[terrain],
+                "resource": _RESOURCE_VALUES[resource],
+                "occupant": None,
+                "city_id": None,
+                "unit_id": None,
+                "visible": visible,
+                "explored": explored
+            }
+            for q, r, terrain, resource, visible, explored in zip(
+                q.tolist(), r.tolist(), terrain.tolist(), resource.tolist(), visible.tolist(), explored.tolist()
+            )
+        ]
+
+    @property
+    def nbytes(self) -> int:
+        """배열 메모리 사용량 (바이트, 희소 필드 제외)"""
+        return sum(a.nbytes for a in (self.q, self.r, self.terrain, self.resource, self._visible_bits, self._explored_bits))
+
+
 class GameMapState(BaseModel):
     """게임 맵 상태 모델"""
-    tiles: List[HexTile]
+    tiles: TileStore
     civs: List[Civilization]
     turn: int = 0
-    game_id: str
\ No newline at end of file
+    game_id: str
@@ -1,9 +1,10 @@
 
 from enum import Enum
 from pydantic import BaseModel
-from typing import Optional,Dict,Any
+from typing import Optional,Dict,Any,Tuple
 from datetime import datetime
 from typing import List
+from core.config import settings
 
 # models/map.py 파일
 class MapType(str, Enum):
@@ -19,6 +20,19 @@ class MapType(str, Enum):
     SHUFFLE = "shuffle"        
     DONUT = "donut"
 
+class MapSize(str, Enum):
+    """맵 크기 enum"""
+    SMALL = "small"    # settings.DEFAULT_MAP_WIDTH x DEFAULT_MAP_HEIGHT (기본 20x15, 맵 풀 크기)
+    LARGE = "large"    # 64x40
+    HUGE = "huge"      # 128x80
+
+# 맵 크기별 (width, height) - Small은 맵 풀과 같은 기본 크기 설정을 따름
+MAP_SIZE_DIMENSIONS: Dict[MapSize, Tuple[int, int]] = {
+    MapSize.SMALL: (settings.DEFAULT_MAP_WIDTH, settings.DEFAULT_MAP_HEIGHT),
+    MapSize.LARGE: (64, 40),
+    MapSize.HUGE: (128, 80)
+}
+
 class Difficulty(str, Enum):
     EASY   = "easy"
     NORMAL = "normal"
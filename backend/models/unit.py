@@ -61,6 +61,30 @@ class UnitMoveRequest(BaseModel):
     unitId: str
     to: HexCoord
 
+class UnitMoveOrder(BaseModel):
+    """일괄 이동 요청의 유닛 이동 한 건"""
+    unitId: int
+    to: HexCoord
+
+class UnitBatchMoveRequest(BaseModel):
+    """유닛 일괄 이동 요청 모델 (요청 순서대로 검증/적용)"""
+    gameId: str
+    moves: List[UnitMoveOrder]
+
+class UnitMoveResult(BaseModel):
+    """일괄 이동 결과 한 건 (성공하면 unit, 실패하면 error)"""
+    unitId: int
+    success: bool
+    unit: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class UnitBatchMoveResponse(BaseModel):
+    """유닛 일괄 이동 응답 모델"""
+    gameId: str
+    moved: int
+    failed: int
+    results: List[UnitMoveResult]
+
 class UnitCommandRequest(BaseModel):
     """유닛 명령 요청 모델"""
     gameId: str
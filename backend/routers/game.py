@@ -1,31 +1,37 @@
 import uuid
 import random
-import time
-import math
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, status
-from typing import List, Dict, Any, Set, Tuple
+import logging
+import numpy as np
+from datetime import datetime, timedelta
+from fastapi import APIRouter, HTTPException, status, Query
+from typing import List, Dict, Any, Optional, Set, Tuple
 from prisma.models import GameSession, Player, Hexagon, City, Unit, UnitType, Terrain, Resource
 from models.game import GameSessionCreate, GameSessionResponse, GameState, GameOptions, GameOptionsResponse, TurnEndRequest, TurnEndResponse, GameTurnInfo, GameSpeed, GamePhase
-from models.map import MapType, Difficulty
+from models.map import MapType, MAP_SIZE_DIMENSIONS, Difficulty
+from models.hexmap import Hex, hex_at
 from core.config import prisma_client, settings
 import json
-from models.unit import UnitMoveRequest, UnitResponse
+from models.unit import UnitMoveRequest, UnitResponse, UnitBatchMoveRequest, UnitBatchMoveResponse
 from utils.turn_manager import process_turn_end
 from utils.scenario_manager import calculate_turn_year
 from routers.websocket import manager as ws_manager
 from utils.map_utils import (
-    assign_guaranteed_resources, 
-    distribute_map_resources, 
-    setup_capital_yield, 
     create_starting_units,
     get_suggested_improvements
 )
+from utils.map_cache import map_cache
+from utils.map_persistence import HexagonWriteBatch
+from utils.map_pool import PreparedMap, map_pool, build_prepared_map
+from utils.cpu_pool import cpu_pool, CpuPoolBusyError
+from utils.hex_grid import HexGrid, hex_grids, NO_VALUE
+from utils.pathfinding import UNIT_CLASS_RULES, path_finder, terrain_move_cost, unit_class_of
+from utils.start_balance import load_yield_data
+from utils.map_chunks import resolve_chunk_request, parse_chunk_versions, hexagon_chunk_filter, hexagon_chunks
 
 router = APIRouter()
 
-# 헥스 좌표 저장을 위한 튜플 타입
-HexCoord = Tuple[int, int, int]
+logger = logging.getLogger(__name__)
+
 import hashlib
 
 def generate_deterministic_seed(mode, difficulty, civ, map_type, civ_count):
@@ -36,12 +42,82 @@ def generate_deterministic_seed(mode, difficulty, civ, map_type, civ_count):
     # SHA-256 해시를 사용하여 고유한 정수 시드 생성
     hash_object = hashlib.sha256(seed_input.encode())
     
-    # 해시의 처음 8바이트를 사용하여 큰 정수 생성
-    seed_int = int.from_bytes(hash_object.digest()[:8], byteorder='big')
+    # 해시의 처음 8바이트를 사용하여 큰 정수 생성 (MapSeed.seed BIGINT 범위에 맞게 63비트로 제한)
+    seed_int = int.from_bytes(hash_object.digest()[:8], byteorder='big') & 0x7FFFFFFFFFFFFFFF
     
     return seed_int
 
 
+async def resolve_prepared_map(request: GameSessionCreate, width: int, height: int) -> PreparedMap:
+    """게임 설정에 맞는 배치 완료 맵 반환
+
+    처음 보는 설정은 맵 풀에서 미리 만들어 둔 맵을 꺼내 그 시드를 MapSeed에 기록하고,
+    이미 MapSeed가 있는 설정은 최근 배치한 맵(map_pool.recall)을 재사용하며 없을 때만 같은 시드로 맵을 재현합니다.
+    """
+    config = {
+        "gameMode": request.gameSpeed.value,
+        "difficulty": request.difficulty.value,
+        "civilization": request.playerCiv,
+        "mapType": request.mapType.value,
+        "civCount": request.civCount
+    }
+    
+    map_seed = await prisma_client.mapseed.find_unique(
+        where={"ux_map_seed_config": config}
+    )
+    
+    prepared = None
+    if not map_seed:
+        # 맵 풀은 기본 크기 맵만 보관 (Large/Huge는 항상 새로 생성)
+        if (width, height) == (map_pool.width, map_pool.height):
+            prepared = map_pool.claim(request.mapType, request.civCount)
+        seed = prepared.seed if prepared else generate_deterministic_seed(
+            request.gameSpeed.value,
+            request.difficulty.value,
+            request.playerCiv,
+            request.mapType.value,
+            request.civCount
+        )
+        # 동시에 같은 설정이 생성된 경우 먼저 저장된 시드를 따름
+        map_seed = await prisma_client.mapseed.upsert(
+            where={"ux_map_seed_config": config},
+            data={
+                "create": {**config, "seed": seed},
+                "update": {}
+            }
+        )
+    
+    if prepared is None or prepared.seed != map_seed.seed:
+        prepared = map_pool.recall(map_seed.seed, request.mapType, width, height, request.civCount)
+        if prepared is not None:
+            return prepared
+    
+    if prepared is None:
+        # 맵 생성과 배치는 CPU 연산이므로 이벤트 루프를 막지 않도록 프로세스 풀에서 실행
+        terrain_yields, resource_types = await load_yield_data(prisma_client)
+        try:
+            prepared = await cpu_pool.run(
+                build_prepared_map,
+                request.mapType,
+                width,
+                height,
+                map_seed.seed,
+                request.civCount,
+                list(resource_types),
+                terrain_yields,
+                resource_types,
+                label="prepare_map"
+            )
+        except CpuPoolBusyError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="맵 생성 요청이 많아 잠시 후 다시 시도해주세요."
+            )
+    
+    # 같은 설정의 다음 게임은 생성/배치 없이 이 맵을 재사용
+    map_pool.remember(prepared)
+    return prepared
+
 async def create_initial_city(game_session_id: str, player_id: int, start_hex: Hexagon, civ: str):
     """플레이어 초기 도시 생성"""
     # 문명별 초기 도시 이름 결정
@@ -104,150 +180,6 @@ async def create_initial_city(game_session_id: str, player_id: int, start_hex: H
     return city
 
 
-async def generate_map(game_session_id: str, map_type: MapType, width: int, height: int, seed: int):
-    """고도화된 맵 생성 함수 - 실제 DB 데이터 기반"""
-    random.seed(seed)
-    
-    # DB에서 지형 및 자원 정보 사전 로드
-    terrains = await prisma_client.terrain.find_many()
-    resources = await prisma_client.resource.find_many()
-    
-    # 지형별 자원 매핑 (지형 특성에 맞는 자원 타입)
-    terrain_resource_mapping = {
-        'Grassland': ['Wheat', 'Cattle', 'Sheep'],
-        'Plains': ['Wheat', 'Horses', 'Cattle'],
-        'Forest': ['Deer', 'Dyes', 'Ivory'],
-        'Hill': ['Iron', 'Horses', 'Gold'],
-        'Tundra': ['Deer'],
-        'Desert': ['Salt'],
-        'Jungle': ['Spices', 'Dyes', 'Incense'],
-        'Coast': ['Fish', 'Whale'],
-        'Mountain': ['Silver', 'Gems'],
-        'Oasis': ['Gems']
-    }
-    
-    # 맵 타입별 지형 분포 및 특징
-    map_type_terrain_distribution = {
-        MapType.CONTINENTS: {
-            "primary_terrains": ["Grassland", "Plains", "Forest"],
-            "secondary_terrains": ["Hill", "Tundra", "Coast"],
-            "water_terrains": ["Ocean"],
-            "continent_count": 2,
-            "continent_size_variance": 0.3
-        },
-        MapType.PANGAEA: {
-            "primary_terrains": ["Plains", "Grassland", "Jungle"],
-            "secondary_terrains": ["Hill", "Forest", "Tundra"],
-            "water_terrains": ["Ocean", "Coast"],
-            "continent_count": 1,
-            "continent_size_variance": 0.1
-        },
-        MapType.ARCHIPELAGO: {
-            "primary_terrains": ["Coast"],
-            "secondary_terrains": ["Plains", "Hill"],
-            "water_terrains": ["Ocean"],
-            "continent_count": 10,
-            "continent_size_variance": 0.8
-        },
-        MapType.SMALL_CONTINENTS: {
-            "primary_terrains": ["Grassland", "Plains"],
-            "secondary_terrains": ["Forest", "Hill", "Coast"],
-            "water_terrains": ["Ocean"],
-            "continent_count": 4,
-            "continent_size_variance": 0.5
-        }
-    }
-    
-    # 기본 설정으로 fallback
-    current_distribution = map_type_terrain_distribution.get(
-        map_type, 
-        map_type_terrain_distribution[MapType.CONTINENTS]
-    )
-    
-    # 대륙 생성 알고리즘
-    def generate_continent_seed(width, height):
-        """대륙의 중심점 생성"""
-        return (
-            random.randint(width // 4, width * 3 // 4),
-            random.randint(height // 4, height * 3 // 4)
-        )
-    
-    # 대륙 중심점들 생성
-    continent_seeds = [
-        generate_continent_seed(width, height) 
-        for _ in range(current_distribution["continent_count"])
-    ]
-    
-    hexagons = []
-    
-    for q in range(width):
-        for r in range(height):
-            s = -q - r
-            
-            # 대륙 중심으로부터의 거리 계산
-            distances = [
-                math.sqrt((q - seed_q)**2 + (r - seed_r)**2) 
-                for seed_q, seed_r in continent_seeds
-            ]
-            
-            # 가장 가까운 대륙 중심 선택
-            nearest_continent_index = distances.index(min(distances))
-            distance_to_continent = min(distances)
-            
-            # 대륙 크기와 변동성 고려
-            max_continent_radius = min(width, height) * (0.5 + current_distribution["continent_size_variance"])
-            normalized_distance = distance_to_continent / max_continent_radius
-            
-            # 지형 카테고리 결정
-            terrain_category = (
-                "primary" if normalized_distance < 0.3 else 
-                "secondary" if normalized_distance < 0.6 else 
-                "water"
-            )
-            
-            # 해당 카테고리의 지형 후보 선택
-            terrain_candidates = {
-                "primary": current_distribution.get("primary_terrains", []),
-                "secondary": current_distribution.get("secondary_terrains", []),
-                "water": current_distribution.get("water_terrains", [])
-            }.get(terrain_category, [])
-            
-            # 지형 선택
-            terrain_id = random.choice(terrain_candidates) if terrain_candidates else "Plains"
-            
-            # 자원 선택 로직
-            possible_resources = terrain_resource_mapping.get(terrain_id, [])
-            
-            # 자원 타입 선택 (보너스 > 사치 > 전략)
-            resource_type_priorities = ['Bonus', 'Luxury', 'Strategic']
-            suitable_resources = [
-                r.id for r in resources 
-                if r.id in possible_resources and 
-                   r.type in resource_type_priorities
-            ]
-            
-            # 랜덤 자원 선택 (일정 확률로 자원 없음)
-            resource_id = random.choices(
-                [None] + suitable_resources, 
-                weights=[0.7] + [0.3 / len(suitable_resources)] * len(suitable_resources)
-            )[0]
-            
-            # 헥사곤 생성
-            hexagon = await prisma_client.hexagon.create(
-                data={
-                    "session_id": game_session_id,
-                    "q": q,
-                    "r": r,
-                    "s": s,
-                    "terrain_id": terrain_id,
-                    "resource_id": resource_id
-                }
-            )
-            
-            hexagons.append(hexagon)
-    
-    return hexagons
-
 async def ensure_basic_game_data():
     """게임에 필요한 기본 데이터(유닛 타입, 지형, 자원 등)가 존재하는지 확인하고 없으면 생성"""
     # 기본 유닛 타입 정의
@@ -587,75 +519,6 @@ async def create_initial_city(game_session_id: str, player_id: int, start_hex: H
     
     return city
 
-def hex_distance(a: HexCoord, b: HexCoord) -> int:
-    """두 헥스 좌표 사이의 거리 계산"""
-    return max(abs(a[0] - b[0]), abs(a[1] - b[1]), abs(a[2] - b[2]))
-
-async def find_starting_position(
-    game_session_id: str, 
-    occupied_positions: Set[HexCoord],
-    min_distance: int = 5
-) -> Hexagon:
-    """적합한 시작 위치 찾기 (이미 점유된 위치와 일정 거리 이상 떨어진 위치)"""
-    # 시작 위치로 적합한 지형
-    suitable_terrains = ["grassland", "plains"]
-    
-    # 모든 적합한 타일 조회
-    suitable_hexes = await prisma_client.hexagon.find_many(
-        where={
-            "session_id": game_session_id,
-            "terrain_id": {"in": suitable_terrains}
-        }
-    )
-    
-    if not suitable_hexes:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="적합한 시작 위치를 찾을 수 없습니다."
-        )
-    
-    # 적합한 위치 중 이미 점유된 위치와 일정 거리 이상 떨어진 위치 찾기
-    for hex in suitable_hexes:
-        hex_coord = (hex.q, hex.r, hex.s)
-        
-        # 이미 점유된 위치와의 거리 확인
-        is_valid = True
-        for occupied in occupied_positions:
-            if hex_distance(hex_coord, occupied) < min_distance:
-                is_valid = False
-                break
-        
-        if is_valid:
-            # 근처에 좋은 자원이 있는지 확인 (보너스)
-            nearby_resources = await prisma_client.hexagon.find_many(
-                where={
-                    "session_id": game_session_id,
-                    "q": {"gte": hex.q - 2, "lte": hex.q + 2},
-                    "r": {"gte": hex.r - 2, "lte": hex.r + 2},
-                    "resource_id": {"not": None}
-                }
-            )
-            
-            # 자원이 있으면 가중치 더 높게
-            if nearby_resources and len(nearby_resources) >= 2:
-                return hex
-    
-    # 자원 주변 위치를 찾지 못했다면, 기본 조건만 만족하는 위치 반환
-    for hex in suitable_hexes:
-        hex_coord = (hex.q, hex.r, hex.s)
-        
-        is_valid = True
-        for occupied in occupied_positions:
-            if hex_distance(hex_coord, occupied) < min_distance:
-                is_valid = False
-                break
-        
-        if is_valid:
-            return hex
-    
-    # 최소 거리 조건을 만족하는 위치가 없다면, 그냥 아무 적합한 위치 반환
-    return random.choice(suitable_hexes)
-
 @router.post("/start", response_model=GameSessionResponse)
 async def create_game_session(request: GameSessionCreate):
     """게임 세션 생성"""
@@ -670,7 +533,22 @@ async def create_game_session(request: GameSessionCreate):
                 detail="문명 수는 5-10 사이여야 합니다."
             )
         
-        # 2. 게임 세션 생성
+        # 2. 맵 준비 (새 설정이면 맵 풀에서 꺼내고, 이미 있는 설정이면 같은 시드로 재현)
+        map_width, map_height = MAP_SIZE_DIMENSIONS[request.mapSize]
+        prepared_map = await resolve_prepared_map(request, map_width, map_height)
+        
+        # 시작 위치 균형 지표 기록 (맵 준비 단계에서 계산됨)
+        start_balance = prepared_map.balance.to_dict() if prepared_map.balance else None
+        if start_balance:
+            logger.info(
+                f"시작 위치 균형: 총 수확량 지니 {start_balance['gini']['total']} "
+                f"(목표 {start_balance['threshold']}, 조정 {start_balance['adjustments']}회, {start_balance['elapsedMs']}ms)"
+            )
+        
+        # 이후 문명 선택 등도 맵 시드 기준으로 결정되도록 random 초기화
+        random.seed(prepared_map.seed)
+        
+        # 3. 게임 세션 생성
         current_time = datetime.now()
         game_session = await prisma_client.gamesession.create(
             data={
@@ -679,7 +557,7 @@ async def create_game_session(request: GameSessionCreate):
                 "game_mode_id": request.gameSpeed,
                 "difficulty_id": request.difficulty.value,
                 "civ_count": request.civCount,
-                "seed": int(time.time() * 1000),
+                "seed": prepared_map.seed,
                 "current_turn": 1,
                 "current_player": 1,
                 "status": "ongoing",
@@ -688,17 +566,8 @@ async def create_game_session(request: GameSessionCreate):
             }
         )
         
-        # 3. 맵 생성
-        hexagons = await generate_map(
-            game_session.id, 
-            request.mapType, 
-            settings.DEFAULT_MAP_WIDTH, 
-            settings.DEFAULT_MAP_HEIGHT, 
-            game_session.seed
-        )
-        
-        # 이미 점유된 시작 위치 추적
-        occupied_positions: Set[HexCoord] = set()
+        # 맵 타일은 메모리 배치에 모아두고 마지막에 한 번에 저장
+        map_batch = HexagonWriteBatch(game_session.id, prepared_map.game_map)
         
         # 4. 플레이어 생성
         player = await prisma_client.player.create(
@@ -711,56 +580,13 @@ async def create_game_session(request: GameSessionCreate):
             }
         )
         
-        # 5. 플레이어 시작 위치를 왼쪽 상단으로 고정
-        # 맵의 왼쪽 상단 영역에서 적합한 시작 타일 찾기
-        map_width = settings.DEFAULT_MAP_WIDTH
-        map_height = settings.DEFAULT_MAP_HEIGHT
-        
-        # 왼쪽 상단 영역 정의 (맵의 1/4 영역)
-        left_upper_hexes = await prisma_client.hexagon.find_many(
-            where={
-                "session_id": game_session.id,
-                "q": {"lte": map_width // 3},
-                "r": {"lte": map_height // 3},
-                "terrain_id": {"in": ["grassland", "plains"]}
-            }
-        )
-        
-        if not left_upper_hexes:
-            # 왼쪽 상단에 적합한 타일이 없으면 일반적인 방법으로 시작 위치 찾기
-            start_hex = await find_starting_position(game_session.id, occupied_positions)
-        else:
-            # 왼쪽 상단 영역에서 가장 적합한 타일 선택 (자원이 인접해 있는 타일 우선)
-            best_hex = None
-            best_resource_count = -1
-            
-            for hex in left_upper_hexes:
-                # 주변 자원 확인
-                nearby_resources = await prisma_client.hexagon.find_many(
-                    where={
-                        "session_id": game_session.id,
-                        "q": {"gte": hex.q - 2, "lte": hex.q + 2},
-                        "r": {"gte": hex.r - 2, "lte": hex.r + 2},
-                        "resource_id": {"not": None}
-                    }
-                )
-                
-                if len(nearby_resources) > best_resource_count:
-                    best_resource_count = len(nearby_resources)
-                    best_hex = hex
-            
-            # 자원이 없는 경우에도 왼쪽 상단의 타일 하나 선택
-            start_hex = best_hex if best_hex else random.choice(left_upper_hexes)
-        
-        # 시작 위치 점유 표시
-        player_capital_coord = (start_hex.q, start_hex.r, start_hex.s)
-        occupied_positions.add(player_capital_coord)
-        
-        # 수도 타일 기본 수확량 설정
-        await setup_capital_yield(game_session.id, [player_capital_coord])
+        # 5. 플레이어 시작 위치 (맵 준비 단계에서 왼쪽 상단 영역으로 결정됨)
+        player_capital_coord = prepared_map.capital_coords[0]
+        start_hex = map_batch.get(player_capital_coord)
         
         # 6. 초기 도시 생성 (수도)
         initial_city = await create_initial_city(game_session.id, player.id, start_hex, request.playerCiv)
+        map_batch.update(player_capital_coord, {"city_id": initial_city.id})
         
         # 7. AI 문명 생성 및 배치
         ai_civs = [
@@ -777,11 +603,7 @@ async def create_game_session(request: GameSessionCreate):
         # AI 무작위 섞기
         random.shuffle(ai_civs)
         
-        # AI 시작 위치 간의 최소 거리 증가 (5칸 -> 7칸)
-        min_distance_between_ai = 5
-        min_distance_from_player = 7  # 플레이어로부터 최소 7칸 떨어지도록 설정
-        
-        ai_capital_coords = []  # AI 수도 좌표 리스트
+        ai_capital_coords = prepared_map.capital_coords[1:]  # AI 수도 좌표 리스트
         ai_players_data = []    # AI 플레이어 정보 리스트
         
         for i in range(1, request.civCount):
@@ -799,104 +621,48 @@ async def create_game_session(request: GameSessionCreate):
             
             ai_players_data.append(ai_player)
             
-            # 플레이어 위치에서 충분히 떨어진 위치 찾기
-            player_pos = player_capital_coord
-            
-            # 모든 적합한 타일 조회
-            suitable_hexes = await prisma_client.hexagon.find_many(
-                where={
-                    "session_id": game_session.id,
-                    "terrain_id": {"in": ["grassland", "plains"]}
-                }
-            )
-            
-            # 플레이어와 다른 AI로부터 충분히 떨어진 위치 찾기
-            valid_hexes = []
-            for hex in suitable_hexes:
-                hex_coord = (hex.q, hex.r, hex.s)
-                
-                # 플레이어로부터의 거리 확인
-                dist_to_player = hex_distance(hex_coord, player_pos)
-                if dist_to_player < min_distance_from_player:
-                    continue
-                
-                # 다른 AI로부터의 거리 확인
-                too_close = False
-                for occupied in occupied_positions:
-                    if hex_distance(hex_coord, occupied) < min_distance_between_ai:
-                        too_close = True
-                        break
-                
-                if not too_close:
-                    valid_hexes.append(hex)
-            
-            # 유효한 위치가 없으면 거리 제약 완화
-            if not valid_hexes:
-                for hex in suitable_hexes:
-                    hex_coord = (hex.q, hex.r, hex.s)
-                    
-                    # 플레이어로부터의 거리만 확인 (최소 5칸)
-                    dist_to_player = hex_distance(hex_coord, player_pos)
-                    if dist_to_player >= 5:
-                        valid_hexes.append(hex)
-            
-            # 그래도 위치가 없으면 일반적인 방법으로 찾기
-            if valid_hexes:
-                ai_start_hex = random.choice(valid_hexes)
-            else:
-                ai_start_hex = await find_starting_position(game_session.id, occupied_positions, min_distance=5)
-            
-            if ai_start_hex:
-                # 시작 위치 점유 표시
-                ai_capital_coord = (ai_start_hex.q, ai_start_hex.r, ai_start_hex.s)
-                occupied_positions.add(ai_capital_coord)
-                ai_capital_coords.append(ai_capital_coord)
-                
-                # 수도 타일 기본 수확량 설정
-                await setup_capital_yield(game_session.id, [ai_capital_coord])
+            if i - 1 < len(ai_capital_coords):
+                ai_capital_coord = ai_capital_coords[i - 1]
                 
                 # AI 초기 도시 생성
-                await create_initial_city(game_session.id, ai_player.id, ai_start_hex, ai_civ)
-        
-        # 모든 플레이어 수도 좌표 리스트
-        all_capital_coords = [player_capital_coord] + ai_capital_coords
-        
-        # 8. 각 수도 반경 2칸 내에 보장 자원 배치
-        await assign_guaranteed_resources(game_session.id, all_capital_coords)
-        
-        # 9. 전체 맵에 자원 분포
-        await distribute_map_resources(game_session.id)
+                ai_city = await create_initial_city(
+                    game_session.id, ai_player.id, map_batch.get(ai_capital_coord), ai_civ
+                )
+                map_batch.update(ai_capital_coord, {"city_id": ai_city.id})
         
-        # 10. 플레이어 초기 유닛 생성 - Scout와 Builder
+        # 8. 플레이어 초기 유닛 생성 - Scout와 Builder
         initial_units = await create_starting_units(game_session.id, player.id, start_hex)
+        map_batch.update(player_capital_coord, {"unit_id": initial_units[0].id})
         
-        # 11. AI 초기 유닛 생성
+        # 9. AI 초기 유닛 생성
         for i, ai_player in enumerate(ai_players_data):
             if i < len(ai_capital_coords):
-                ai_capital_hex = await prisma_client.hexagon.find_unique(
-                    where={
-                        "session_id_q_r_s": {
-                            "session_id": game_session.id,
-                            "q": ai_capital_coords[i][0],
-                            "r": ai_capital_coords[i][1],
-                            "s": ai_capital_coords[i][2]
-                        }
-                    }
-                )
+                ai_capital_hex = map_batch.get(ai_capital_coords[i])
                 
                 if ai_capital_hex:
-                    await create_starting_units(game_session.id, ai_player.id, ai_capital_hex)
+                    ai_units = await create_starting_units(game_session.id, ai_player.id, ai_capital_hex)
+                    map_batch.update(ai_capital_coords[i], {"unit_id": ai_units[0].id})
+        
+        # 10. 맵 타일 전체를 변경 사항과 함께 한 번에 저장
+        await map_batch.flush()
+        
+        # 저장한 행으로 세션 헥스 그리드를 바로 만들어 이후 조회가 DB를 다시 읽지 않도록 함
+        grid = HexGrid.from_rows(game_session.id, map_batch.rows())
+        if prepared_map.landmasses is not None:
+            grid.attach_landmasses(prepared_map.landmasses)
+        hex_grids.put(grid)
         
-        # 12. 초기 개선 추천 목록 생성
-        suggested_improvements = await get_suggested_improvements(game_session.id, player_capital_coord)
+        # 11. 초기 개선 추천 목록 생성
+        suggested_improvements = get_suggested_improvements(grid, player_capital_coord)
         
-        # 13. 초기 게임 상태 정의
+        # 12. 초기 게임 상태 정의
         initial_state = {
             "gameId": game_session.id,
             "turn": 1,
             "year": -4000,
             "playerId": str(player.id),
             "playerCiv": request.playerCiv,
+            "mapSize": {"id": request.mapSize.value, "width": map_width, "height": map_height},
             "resources": {
                 "food": 10,
                 "production": 5,
@@ -965,7 +731,8 @@ async def create_game_session(request: GameSessionCreate):
                 "foundedReligionId": None,
                 "followerReligionId": None
             },
-            "suggestedImprovements": suggested_improvements
+            "suggestedImprovements": suggested_improvements,
+            "startBalance": start_balance
         }
         
         # 프론트엔드가 기대하는 응답 형식으로 변경
@@ -983,6 +750,8 @@ async def create_game_session(request: GameSessionCreate):
         
         return game_session_response
     
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
@@ -1042,8 +811,18 @@ async def get_game_options():
             } for mode in game_modes
         ]
         
+        # 맵 크기 (DB 테이블 없이 고정 목록)
+        map_sizes_response = [
+            {
+                "id": map_size.value,
+                "name": map_size.name.capitalize(),
+                "description": f"{width}x{height}"
+            } for map_size, (width, height) in MAP_SIZE_DIMENSIONS.items()
+        ]
+        
         return {
             "mapTypes": map_types_response,
+            "mapSizes": map_sizes_response,
             "difficulties": difficulties_response,
             "civilizations": civilizations_response,
             "gameModes": game_modes_response
@@ -1054,6 +833,131 @@ async def get_game_options():
             detail=f"게임 옵션 조회 중 오류 발생: {str(e)}"
         )
 
+@router.get("/map-pool/stats")
+async def get_map_pool_stats():
+    """사전 생성 맵 풀 크기 및 적중률, CPU 프로세스 풀 작업 지표, 경로 캐시 적중률 조회"""
+    return {
+        "pool": map_pool.stats(),
+        "cache": map_cache.stats(),
+        "cpu_pool": cpu_pool.stats(),
+        "paths": path_finder.stats()
+    }
+
+@router.get("/map/{game_id}/chunks")
+async def get_session_map_chunks(
+    game_id: str,
+    chunks: Optional[str] = Query(None, description="청크 ID 목록 (예: 0:0,1:0)"),
+    q_min: Optional[int] = Query(None, description="뷰포트 q 최소값"),
+    q_max: Optional[int] = Query(None, description="뷰포트 q 최대값"),
+    r_min: Optional[int] = Query(None, description="뷰포트 r 최소값"),
+    r_max: Optional[int] = Query(None, description="뷰포트 r 최대값"),
+    versions: Optional[str] = Query(None, description="클라이언트가 가진 청크 버전 (예: 0:0=123,1:0=456)")
+):
+    """게임 세션의 Hexagon 행을 뷰포트/청크 단위로 조회 (버전이 같은 청크는 타일 생략)"""
+    chunk_size = settings.MAP_CHUNK_SIZE
+    try:
+        chunk_ids = resolve_chunk_request(
+            chunks, q_min, q_max, r_min, r_max, chunk_size, settings.MAP_CHUNK_MAX_PER_REQUEST
+        )
+        known_versions = parse_chunk_versions(versions)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"잘못된 청크 요청입니다: {str(e)}"
+        )
+    
+    try:
+        game_session = await prisma_client.gamesession.find_unique(where={"id": game_id})
+        if not game_session:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="존재하지 않는 게임입니다."
+            )
+        
+        # 요청 청크 영역의 타일만 한 번에 조회
+        rows = await prisma_client.hexagon.find_many(
+            where={
+                "session_id": game_id,
+                "OR": hexagon_chunk_filter(chunk_ids, chunk_size)
+            }
+        )
+        chunk_data = hexagon_chunks(rows, chunk_ids, chunk_size, known_versions)
+        
+        return {
+            "game_id": game_id,
+            "current_turn": game_session.current_turn,
+            "chunk_size": chunk_size,
+            "chunks": chunk_data,
+            "changed_chunks": sum(1 for chunk in chunk_data if not chunk["unchanged"])
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"맵 청크 조회 중 오류 발생: {str(e)}"
+        )
+
+def check_unit_move(grid: HexGrid, unit_class: str, from_index: int, target_index: int, movement: int):
+    """유닛 이동 규칙 검사 (지형, 대륙, 경로, 이동력) - 통과하면 경로, 위반이면 HTTPException (400)"""
+    # 이동 불가능한 타일 체크 (유닛 분류별 규칙 - 지상 유닛은 산/물, 해상 유닛은 땅)
+    if not terrain_move_cost(grid.terrain_id(target_index), unit_class):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이동할 수 없는 지형입니다."
+        )
+    
+    # 육상 유닛은 다른 대륙으로 이동할 수 없음 (대륙 라벨로 경로 탐색 없이 바로 거부)
+    if not UNIT_CLASS_RULES[unit_class].naval and not grid.same_landmass(from_index, target_index):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="다른 대륙으로는 육로로 이동할 수 없습니다."
+        )
+    
+    # 지형 이동 비용을 반영한 최소 비용 경로 (지형 버전별 캐시)
+    path = path_finder.find(grid, unit_class, from_index, target_index)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이동할 수 있는 경로가 없습니다."
+        )
+    
+    # 이동 가능 거리 확인 (경로 이동 비용 합계)
+    if path.cost > movement:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"이동 가능한 거리를 초과했습니다. (가능: {movement}, 필요: {path.cost})"
+        )
+    return path
+
+def unit_move_data(to: Hex, movement: int) -> Dict[str, Any]:
+    """이동 후 Unit 행 변경 값 (movement는 이동 후 남은 이동력)"""
+    return {
+        "loc_q": to.q,
+        "loc_r": to.r,
+        "loc_s": to.s,
+        "movement": movement,
+        "status": "이동 중" if movement > 0 else "대기"
+    }
+
+def unit_response(unit) -> Dict[str, Any]:
+    """유닛 이동 응답 데이터"""
+    return {
+        "id": unit.id,
+        "name": unit.unit_type_id,
+        "type": unit.unit_type_id,
+        "typeName": unit.unit_type_id,
+        "hp": unit.hp,
+        "movement": unit.movement,
+        "maxMovement": unit.max_movement,
+        "status": unit.status,
+        "location": {
+            "q": unit.loc_q,
+            "r": unit.loc_r,
+            "s": unit.loc_s
+        }
+    }
+
 # 유닛 이동 처리 함수
 async def move_unit(game_id: str, unit_id: str, to_q: int, to_r: int, to_s: int):
     """유닛을 새로운 위치로 이동시키는 함수"""
@@ -1070,10 +974,10 @@ async def move_unit(game_id: str, unit_id: str, to_q: int, to_r: int, to_s: int)
             detail="존재하지 않는 게임입니다."
         )
     
-    # 유닛 정보 조회
+    # 유닛 정보 조회 (유닛 타입 카테고리로 이동 규칙 결정)
     unit = await prisma_client.unit.find_unique(
         where={"id": unit_id},
-        include={"owner": True}
+        include={"owner": True, "unit_type": True}
     )
     
     if not unit:
@@ -1089,78 +993,52 @@ async def move_unit(game_id: str, unit_id: str, to_q: int, to_r: int, to_s: int)
             detail="이 게임에 속한 유닛이 아닙니다."
         )
     
-    # 목적지 타일 확인
-    target_hex = await prisma_client.hexagon.find_unique(
-        where={
-            "session_id_q_r_s": {
-                "session_id": game_id,
-                "q": to_q,
-                "r": to_r,
-                "s": to_s
-            }
-        }
-    )
+    # 목적지 타일 확인 (세션 헥스 그리드에서 조회)
+    grid = await hex_grids.get(prisma_client, game_id)
+    target_index = grid.index_of(to_q, to_r, to_s) if grid else NO_VALUE
     
-    if not target_hex:
+    if target_index == NO_VALUE:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="이동할 타일이.존재하지 않습니다."
         )
     
-    # 이동 불가능한 타일 체크 (산, 바다 등)
-    impassable_terrains = ["Ocean", "Mountain"]
-    if target_hex.terrain_id in impassable_terrains:
+    from_index = grid.index_of(unit.loc_q, unit.loc_r, unit.loc_s)
+    if from_index == NO_VALUE:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="이동할 수 없는 지형입니다."
+            detail="유닛의 현재 위치가 맵 밖입니다."
         )
     
-    # 현재 위치와 목적지 간의 거리 계산
-    current_pos = (unit.loc_q, unit.loc_r, unit.loc_s)
-    target_pos = (to_q, to_r, to_s)
-    
-    # hex_distance 함수 호출 (이미 정의되어 있음)
-    distance = hex_distance(current_pos, target_pos)
+    # 이동 규칙 검사 (유닛 타입 카테고리별 지형 비용/이동 불가 지형, 대륙, 남은 이동력)
+    unit_class = unit_class_of(unit.unit_type.category if unit.unit_type else None)
+    path = check_unit_move(grid, unit_class, from_index, target_index, unit.movement or 0)
     
-    # 이동 가능 거리 확인
-    if distance > unit.movement:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"이동 가능한 거리를 초과했습니다. (가능: {unit.movement}, 필요: {distance})"
-        )
-    
-    # 목적지에 다른 아군 유닛이 있는지 확인
-    other_unit = await prisma_client.unit.find_first(
+    # 목적지와 출발지의 다른 유닛 조회 (목적지 점유 확인, 출발지에 남는 유닛 확인을 한 번에)
+    other_units = await prisma_client.unit.find_many(
         where={
             "session_id": game_id,
-            "loc_q": to_q,
-            "loc_r": to_r,
-            "loc_s": to_s,
+            "OR": [
+                {"loc_q": to_q, "loc_r": to_r, "loc_s": to_s},
+                {"loc_q": unit.loc_q, "loc_r": unit.loc_r, "loc_s": unit.loc_s}
+            ],
             "NOT": {
                 "id": unit_id
             }
         }
     )
     
-    if other_unit:
+    if any((other.loc_q, other.loc_r) == (to_q, to_r) for other in other_units):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 다른 유닛이 있는 타일입니다."
         )
     
-    # 출발지 타일에서 유닛 제거
-    from_hex = await prisma_client.hexagon.find_unique(
-        where={
-            "session_id_q_r_s": {
-                "session_id": game_id,
-                "q": unit.loc_q,
-                "r": unit.loc_r,
-                "s": unit.loc_s
-            }
-        }
-    )
-    
-    if from_hex:
+    # 출발지 타일에서 유닛 제거 - 같은 타일에 남는 유닛이 있으면 그 유닛을 타일 점유 유닛으로 유지
+    remaining = {other.id for other in other_units}
+    current = grid.unit_at(from_index)
+    origin_unit = current if current in remaining else (min(remaining) if remaining else None)
+    if origin_unit != current:
         await prisma_client.hexagon.update(
             where={
                 "session_id_q_r_s": {
@@ -1171,20 +1049,15 @@ async def move_unit(game_id: str, unit_id: str, to_q: int, to_r: int, to_s: int)
                 }
             },
             data={
-                "unit_id": None
+                "unit_id": origin_unit
             }
         )
+        grid.set_unit(from_index, origin_unit)
     
     # 유닛의 위치 업데이트
     updated_unit = await prisma_client.unit.update(
         where={"id": unit_id},
-        data={
-            "loc_q": to_q,
-            "loc_r": to_r,
-            "loc_s": to_s,
-            "movement": unit.movement - distance,
-            "status": "이동 중" if unit.movement - distance > 0 else "대기"
-        }
+        data=unit_move_data(grid.coord(target_index), (unit.movement or 0) - path.cost)
     )
     
     # 도착지 타일에 유닛 배치
@@ -1201,87 +1074,214 @@ async def move_unit(game_id: str, unit_id: str, to_q: int, to_r: int, to_s: int)
             "unit_id": unit_id
         }
     )
+    grid.set_unit(target_index, updated_unit.id)
     
-    # 시야 업데이트 - 유닛이 이동한 새 위치 주변 타일을 탐험됨/보임으로 설정
-    # 유닛 주변 1칸까지 모두 보이도록 설정
-    # 모든 인접 타일 가져오기
-    neighboring_hexes = await prisma_client.hexagon.find_many(
-        where={
-            "session_id": game_id,
-            "OR": [
-                {"AND": [
-                    {"q": to_q + dq},
-                    {"r": to_r + dr},
-                    {"s": to_s + ds}
-                ]} for dq, dr, ds in [
-                    (1, 0, -1), (1, -1, 0), (0, -1, 1), 
-                    (-1, 0, 1), (-1, 1, 0), (0, 1, -1)
-                ]
-            ]
-        }
-    )
-    
-    # 시야 업데이트
-    for hex in neighboring_hexes:
-        await prisma_client.hexagon.update(
-            where={
-                "session_id_q_r_s": {
-                    "session_id": game_id,
-                    "q": hex.q,
-                    "r": hex.r,
-                    "s": hex.s
-                }
-            },
-            data={
-                "visible": True,
-                "explored": True
-            }
-        )
-    
-    # 목적지 타일 자체도 보이도록 설정
-    await prisma_client.hexagon.update(
-        where={
-            "session_id_q_r_s": {
-                "session_id": game_id,
-                "q": to_q,
-                "r": to_r,
-                "s": to_s
-            }
-        },
-        data={
-            "visible": True,
-            "explored": True
-        }
-    )
+    # 시야 업데이트 - 목적지와 인접 타일을 탐험됨/보임으로 설정
+    # Hexagon 테이블에는 시야 컬럼이 없으므로 세션 그리드에만 기록
+    grid.reveal(grid.within(to_q, to_r, 1))
     
     # 응답 데이터 구성
-    return {
-        "id": updated_unit.id,
-        "name": updated_unit.unit_type_id,
-        "type": updated_unit.unit_type_id,
-        "typeName": updated_unit.unit_type_id,
-        "hp": updated_unit.hp,
-        "movement": updated_unit.movement,
-        "maxMovement": updated_unit.max_movement,
-        "status": updated_unit.status,
-        "location": {
-            "q": updated_unit.loc_q,
-            "r": updated_unit.loc_r,
-            "s": updated_unit.loc_s
-        }
-    }
+    return unit_response(updated_unit)
 
 # 유닛 이동 API 엔드포인트
 @router.post("/unit/move", response_model=UnitResponse)
 async def unit_move(request: UnitMoveRequest):
     """유닛 이동 처리 API"""
+    target = Hex.of(request.to)
     return await move_unit(
         request.gameId,
         request.unitId,
-        request.to.q,
-        request.to.r,
-        request.to.s
+        target.q,
+        target.r,
+        target.s
+    )
+
+# 유닛 일괄 이동 API 엔드포인트
+@router.post("/unit/move-batch", response_model=UnitBatchMoveResponse)
+async def unit_move_batch(request: UnitBatchMoveRequest):
+    """여러 유닛 이동 처리 API
+
+    세션 유닛을 한 번 읽어 만든 메모리 점유 상태로 요청 순서대로 검증하고(앞선 이동 결과 반영),
+    통과한 이동의 유닛/헥사곤 쓰기는 한 트랜잭션으로 적용합니다. 시야는 세션 그리드에만 기록합니다.
+    실패한 이동은 다른 이동에 영향을 주지 않고 결과 목록에 사유와 함께 담깁니다.
+    """
+    game_id = request.gameId
+    if len(request.moves) > settings.UNIT_BATCH_MOVE_MAX:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 이동할 수 있는 유닛은 최대 {settings.UNIT_BATCH_MOVE_MAX}개입니다."
+        )
+    
+    game_session = await prisma_client.gamesession.find_unique(where={"id": game_id})
+    grid = await hex_grids.get(prisma_client, game_id) if game_session else None
+    if not game_session or grid is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="존재하지 않는 게임입니다."
+        )
+    
+    # 세션 유닛 전체를 한 번에 읽어 유닛 상태와 타일별 점유 구성
+    units = {
+        unit.id: unit for unit in await prisma_client.unit.find_many(
+            where={"session_id": game_id},
+            include={"unit_type": True}
+        )
+    }
+    locations: Dict[int, Hex] = {unit_id: hex_at(unit.loc_q, unit.loc_r) for unit_id, unit in units.items()}
+    movements: Dict[int, int] = {unit_id: unit.movement or 0 for unit_id, unit in units.items()}
+    occupants: Dict[Tuple[int, int], Set[int]] = {}
+    for unit_id, location in locations.items():
+        occupants.setdefault((location.q, location.r), set()).add(unit_id)
+    
+    results: List[Dict[str, Any]] = []
+    unit_updates: Dict[int, Dict[str, Any]] = {}   # 유닛별 최종 변경 값
+    touched_tiles: Set[int] = set()
+    revealed: List[np.ndarray] = []
+    for order in request.moves:
+        try:
+            if order.unitId not in units:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="유닛을 찾을 수 없습니다."
+                )
+            target = Hex.of(order.to)
+            target_index = grid.index_of(target.q, target.r, target.s)
+            if target_index == NO_VALUE:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="이동할 타일이 존재하지 않습니다."
+                )
+            origin = locations[order.unitId]
+            from_index = grid.index_of(origin.q, origin.r)
+            if from_index == NO_VALUE:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="유닛의 현재 위치가 맵 밖입니다."
+                )
+            unit_type = units[order.unitId].unit_type
+            unit_class = unit_class_of(unit_type.category if unit_type else None)
+            path = check_unit_move(grid, unit_class, from_index, target_index, movements[order.unitId])
+            if occupants.get((target.q, target.r), set()) - {order.unitId}:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="이미 다른 유닛이 있는 타일입니다."
+                )
+        except HTTPException as e:
+            results.append({"unitId": order.unitId, "success": False, "error": e.detail})
+            continue
+        
+        # 메모리 상태 반영 (이후 이동은 바뀐 위치/이동력/점유로 검증)
+        occupants[(origin.q, origin.r)].discard(order.unitId)
+        occupants.setdefault((target.q, target.r), set()).add(order.unitId)
+        locations[order.unitId] = target
+        movements[order.unitId] -= path.cost
+        unit_updates[order.unitId] = unit_move_data(target, movements[order.unitId])
+        touched_tiles.update((from_index, target_index))
+        revealed.append(grid.within(target.q, target.r, 1))
+        results.append({"unitId": order.unitId, "success": True})
+    
+    # 바뀐 타일의 Hexagon.unit_id - 남은 유닛이 있으면 기존 값을 유지하거나 그중 하나로, 없으면 None
+    tile_units: Dict[int, Optional[int]] = {}
+    for index in touched_tiles:
+        remaining = occupants.get((int(grid.q[index]), int(grid.r[index])), set())
+        current = grid.unit_at(index)
+        new_unit = current if current in remaining else (min(remaining) if remaining else None)
+        if new_unit != current:
+            tile_units[index] = new_unit
+    
+    updated_units = {}
+    if unit_updates:
+        try:
+            async with prisma_client.tx(
+                timeout=timedelta(seconds=settings.HEXAGON_WRITE_TIMEOUT_SECONDS)
+            ) as transaction:
+                for unit_id, data in unit_updates.items():
+                    updated_units[unit_id] = await transaction.unit.update(where={"id": unit_id}, data=data)
+                for index, unit_id in tile_units.items():
+                    q, r, s = grid.coords([index])[0]
+                    await transaction.hexagon.update(
+                        where={"session_id_q_r_s": {"session_id": game_id, "q": q, "r": r, "s": s}},
+                        data={"unit_id": unit_id}
+                    )
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"유닛 일괄 이동 중 오류 발생: {str(e)}"
+            )
+        
+        # 커밋 후 세션 그리드 반영 (점유, 시야)
+        for index, unit_id in tile_units.items():
+            grid.set_unit(index, unit_id)
+        grid.reveal(np.concatenate(revealed))
+    
+    # 성공한 이동은 유닛의 최종 상태를 함께 반환
+    for result in results:
+        if result["success"]:
+            result["unit"] = unit_response(updated_units[result["unitId"]])
+    
+    moved = sum(1 for result in results if result["success"])
+    return {
+        "gameId": game_id,
+        "moved": moved,
+        "failed": len(results) - moved,
+        "results": results
+    }
+
+async def load_unit_on_grid(game_id: str, unit_id: int) -> Tuple[Any, HexGrid, int, str]:
+    """이동 조회용 유닛 - (유닛, 세션 그리드, 유닛 타일 인덱스, 이동 규칙 분류)"""
+    unit = await prisma_client.unit.find_unique(
+        where={"id": unit_id},
+        include={"unit_type": True}
     )
+    if not unit or unit.session_id != game_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="유닛을 찾을 수 없습니다."
+        )
+    
+    grid = await hex_grids.get(prisma_client, game_id)
+    unit_index = grid.index_of(unit.loc_q, unit.loc_r) if grid else NO_VALUE
+    if unit_index == NO_VALUE:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="유닛이 있는 타일이 존재하지 않습니다."
+        )
+    
+    unit_class = unit_class_of(unit.unit_type.category if unit.unit_type else None)
+    return unit, grid, unit_index, unit_class
+
+# 유닛 경로 조회 엔드포인트 (이동 미리보기)
+@router.get("/unit/path")
+async def get_unit_path(
+    game_id: str = Query(..., description="게임 ID"),
+    unit_id: int = Query(..., description="유닛 ID"),
+    q: int = Query(..., description="목적지 q"),
+    r: int = Query(..., description="목적지 r")
+):
+    """유닛의 목적지까지 최소 비용 경로와 턴별 도착 지점 조회 (같은 그리드의 반복 조회는 캐시에서 반환)"""
+    unit, grid, start_index, unit_class = await load_unit_on_grid(game_id, unit_id)
+    target_index = grid.index_of(q, r)
+    if target_index == NO_VALUE:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="타일이 존재하지 않습니다."
+        )
+    
+    path = path_finder.find(grid, unit_class, start_index, target_index)
+    if path is None:
+        return {"unitClass": unit_class, "reachable": False}
+    return {"unitClass": unit_class, **path.to_dict(unit.movement or 0, unit.max_movement or 0)}
+
+# 유닛 이동 범위 조회 엔드포인트 (이동 가능 타일 강조 표시)
+@router.get("/unit/reachable")
+async def get_unit_reachable(
+    game_id: str = Query(..., description="게임 ID"),
+    unit_id: int = Query(..., description="유닛 ID")
+):
+    """유닛이 남은 이동력으로 이번 턴에 갈 수 있는 타일과 타일별 이동 비용 조회 (유닛/도시 배치가 바뀌기 전까지 캐시)"""
+    unit, grid, start_index, unit_class = await load_unit_on_grid(game_id, unit_id)
+    reach = path_finder.reachable(grid, unit_class, start_index, unit.movement or 0)
+    return {"unitId": unit.id, "unitClass": unit_class, **reach.to_dict()}
 
 # 턴 종료 엔드포인트
 @router.post("/turn/end-turn", response_model=TurnEndResponse)
@@ -1327,29 +1327,24 @@ async def get_game_state(game_id: str):
         current_phase, objectives, recommended_actions = get_turn_info(scenario, current_turn)
         turn_year = calculate_turn_year(current_turn, speed)
         
-        # 플레이어 정보 조회
+        # 플레이어 정보 조회 (도시/유닛은 세션 전체를 한 번씩 읽어 플레이어별로 집계)
+        cities = await prisma_client.city.find_many(where={"session_id": game_id})
+        units = await prisma_client.unit.find_many(where={"session_id": game_id})
+        city_counts: Dict[int, int] = {}
+        for city in cities:
+            city_counts[city.owner_player_id] = city_counts.get(city.owner_player_id, 0) + 1
+        unit_counts: Dict[int, int] = {}
+        for unit in units:
+            unit_counts[unit.owner_player_id] = unit_counts.get(unit.owner_player_id, 0) + 1
+        
         player_data = []
         for player in game_session.players:
-            cities = await prisma_client.city.find_many(
-                where={
-                    "session_id": game_id,
-                    "owner_player_id": player.id
-                }
-            )
-            
-            units = await prisma_client.unit.find_many(
-                where={
-                    "session_id": game_id,
-                    "owner_player_id": player.id
-                }
-            )
-            
             player_data.append({
                 "id": player.id,
                 "name": player.civ_type,
                 "is_ai": player.is_ai,
-                "cities": len(cities),
-                "units": len(units)
+                "cities": city_counts.get(player.id, 0),
+                "units": unit_counts.get(player.id, 0)
             })
         
         # 턴 정보 구성
@@ -1,12 +1,21 @@
 from fastapi import APIRouter, HTTPException, status, Query
-from typing import List, Dict, Any, Optional
-from models.hexmap import HexTile, TerrainType, ResourceType, GameMapState, HexCoord, Civilization
+from typing import Dict, Any, Optional
+from models.hexmap import (
+    HexTile, TerrainType, ResourceType, GameMapState, HexCoord, Civilization,
+    TileStore, TERRAIN_CODE_INDEX, RESOURCE_CODE_INDEX, NO_RESOURCE_CODE
+)
 import random
 import math
+import numpy as np
 import uuid
 from datetime import datetime
 from prisma import Prisma
 import json
+from utils.state_snapshot import dumps_state
+from utils.state_history import turn_state_history, keyframe_turn_for, to_state_data
+from utils.map_chunks import resolve_chunk_request, parse_chunk_versions, store_chunks
+from utils.map_utils import hex_radius_mask
+from core.config import settings
 
 # Prisma 클라이언트 인스턴스
 prisma = Prisma()
@@ -79,9 +88,16 @@ async def get_map_data(user_id: Optional[str] = Query(None, description="사용
                 where={"gameId": existing_game.id, "turn": existing_game.currentTurn}
             )
             
+            # 키프레임/변경분에서 최신 턴 상태 복원
+            latest_state = None
             if latest_game_state:
+                latest_state = await turn_state_history.load(
+                    prisma, existing_game.id, existing_game.currentTurn, row=latest_game_state
+                )
+            
+            if latest_state:
                 # 게임 상태 데이터 가져오기
-                game_map_state_data = latest_game_state.stateData
+                game_map_state_data = to_state_data(latest_state)
                 
                 # 플레이어 정보 조회
                 player = await prisma.player.find_first(
@@ -193,8 +209,8 @@ async def get_map_data(user_id: Optional[str] = Query(None, description="사용
         # Prisma를 사용해 DB에 게임 상태 저장
         try:
             
-            # 게임 맵 상태를 JSON으로 직렬화
-            state_data_json = json.dumps(game_map_state.dict())
+            # 게임 맵 상태를 압축 스냅샷으로 직렬화
+            state_data_json = dumps_state(game_map_state)
             
             # 게임 생성
             new_game = await prisma.game.create(
@@ -401,182 +417,155 @@ async def get_map_data(user_id: Optional[str] = Query(None, description="사용
         }
 
 
-def generate_inland_sea_map(width: int, height: int) -> List[HexTile]:
-    """내륙 바다 맵 생성 함수"""
-    hexagons = []
-    
-    # 중심점 계산
+# 내륙 바다 맵 문명 시작 위치 (도시 / 첫 유닛)
+INLAND_SEA_CIV_POSITIONS = {
+    "Korea": {"q": 4, "r": 3, "city_id": "city_korea", "unit_id": "warrior-1", "unit_q": 5, "unit_r": 3},
+    "Japan": {"q": 16, "r": 3, "city_id": "city_japan", "unit_id": "warrior-2", "unit_q": 17, "unit_r": 3},
+    "China": {"q": 4, "r": 15, "city_id": "city_china", "unit_id": "warrior-3", "unit_q": 5, "unit_r": 15},
+    "Mongolia": {"q": 16, "r": 15, "city_id": "city_mongolia", "unit_id": "warrior-4", "unit_q": 17, "unit_r": 15},
+    "Russia": {"q": 10, "r": 2, "city_id": "city_russia", "unit_id": "warrior-5", "unit_q": 11, "unit_r": 2},
+    "Rome": {"q": 10, "r": 16, "city_id": "city_rome", "unit_id": "warrior-6", "unit_q": 11, "unit_r": 16}
+}
+INLAND_SEA_PLAYER_CIV = "Korea"
+
+# 육지 지형별 확률
+INLAND_SEA_LAND_TERRAINS = [
+    TerrainType.PLAINS, TerrainType.GRASSLAND,
+    TerrainType.HILLS, TerrainType.FOREST,
+    TerrainType.DESERT
+]
+INLAND_SEA_LAND_WEIGHTS = [0.3, 0.3, 0.15, 0.15, 0.1]
+
+# 육지 자원 후보 (None은 자원 없음, 후보 중 균등 선택)
+INLAND_SEA_LAND_RESOURCES = {
+    TerrainType.PLAINS: [ResourceType.WHEAT, ResourceType.HORSES, None, None],
+    TerrainType.GRASSLAND: [ResourceType.CATTLE, ResourceType.SHEEP, None, None],
+    TerrainType.HILLS: [ResourceType.IRON, ResourceType.COAL, None, None],
+    TerrainType.DESERT: [ResourceType.GOLD, None, None]
+}
+
+# 문명 시작 주변(2칸 이내) 지형/자원 후보
+INLAND_SEA_GOOD_TERRAINS = [
+    TerrainType.PLAINS, TerrainType.GRASSLAND,
+    TerrainType.FOREST, TerrainType.HILLS
+]
+INLAND_SEA_GOOD_RESOURCES = [
+    ResourceType.WHEAT, ResourceType.HORSES,
+    ResourceType.CATTLE, ResourceType.IRON
+]
+
+# 자원 배치 확률
+INLAND_SEA_RESOURCE_PROBABILITY = 0.2
+
+
+def _terrain_code(terrain: TerrainType) -> int:
+    return TERRAIN_CODE_INDEX[terrain]
+
+
+def _resource_code(resource: Optional[ResourceType]) -> int:
+    return NO_RESOURCE_CODE if resource is None else RESOURCE_CODE_INDEX[resource]
+
+
+def _hex_distance_grid(q: np.ndarray, r: np.ndarray, target_q: int, target_r: int) -> np.ndarray:
+    """모든 타일에서 (target_q, target_r)까지의 헥스 거리 배열"""
+    dq = q - target_q
+    dr = r - target_r
+    return np.maximum(np.maximum(np.abs(dq), np.abs(dr)), np.abs(dq + dr))
+
+
+def generate_inland_sea_map(width: int, height: int, seed: Optional[int] = None) -> TileStore:
+    """내륙 바다 맵 생성 함수
+
+    바다/가장자리/문명 주변/플레이어 시야 영역을 맵 단위 배열 마스크로 한 번 계산한 뒤
+    배열 그대로 TileStore를 만들어 O(타일 수)로 동작합니다.
+    """
+    rng = np.random.default_rng(seed)
+    shape = (width, height)
+    q = np.arange(width)[:, None]
+    r = np.arange(height)[None, :]
+
+    # 중심점으로부터의 거리와 내륙 바다 반경
     center_q = width // 2
     center_r = height // 2
-    
-    # 내륙 바다 반경
+    distance = _hex_distance_grid(q, r, center_q, center_r)
     sea_radius = min(width, height) // 3
-    
-    # 문명 시작 위치 정의
-    civ_positions = {
-        "Korea": {"q": 4, "r": 3, "city_id": "city_korea", "unit_id": "warrior-1", "unit_q": 5, "unit_r": 3},
-        "Japan": {"q": 16, "r": 3, "city_id": "city_japan", "unit_id": "warrior-2", "unit_q": 17, "unit_r": 3},
-        "China": {"q": 4, "r": 15, "city_id": "city_china", "unit_id": "warrior-3", "unit_q": 5, "unit_r": 15},
-        "Mongolia": {"q": 16, "r": 15, "city_id": "city_mongolia", "unit_id": "warrior-4", "unit_q": 17, "unit_r": 15},
-        "Russia": {"q": 10, "r": 2, "city_id": "city_russia", "unit_id": "warrior-5", "unit_q": 11, "unit_r": 2},
-        "Rome": {"q": 10, "r": 16, "city_id": "city_rome", "unit_id": "warrior-6", "unit_q": 11, "unit_r": 16}
-    }
-    
-    # 각 타일 생성
-    for q in range(width):
-        for r in range(height):
-            s = -q - r  # 큐브 좌표 제약: q + r + s = 0
-            
-            # 중심점으로부터의 거리 계산
-            distance = max(
-                abs(q - center_q),
-                abs(r - center_r),
-                abs(s - (-center_q - center_r))
-            )
-            
-            # 내륙 바다 영역 판단 (중심에 바다)
-            is_sea = distance < sea_radius
-            
-            # 맵 가장자리 설정 (대양)
-            is_edge = q == 0 or r == 0 or q == width - 1 or r == height - 1
-            
-            # 지형 결정 (내륙 바다, 해안, 육지)
-            if is_edge:
-                # 가장자리는 산
-                terrain = TerrainType.MOUNTAIN
-                resource = None
-                explored = False
-                visible = False
-            elif is_sea:
-                # 중앙 내륙 바다
-                terrain = TerrainType.OCEAN if distance < sea_radius - 1 else TerrainType.COAST
-                resource = ResourceType.FISH if random.random() < 0.2 and terrain == TerrainType.COAST else None
-                explored = random.random() < 0.3
-                visible = random.random() < 0.2 and explored
-            else:
-                # 육지 지형 랜덤 선택
-                land_terrains = [
-                    TerrainType.PLAINS, TerrainType.GRASSLAND, 
-                    TerrainType.HILLS, TerrainType.FOREST,
-                    TerrainType.DESERT
-                ]
-                terrain_weights = [0.3, 0.3, 0.15, 0.15, 0.1]  # 지형별 확률
-                terrain = random.choices(land_terrains, weights=terrain_weights)[0]
-                
-                # 자원 배치 (20% 확률)
-                if random.random() < 0.2:
-                    if terrain == TerrainType.PLAINS:
-                        resource = random.choice([ResourceType.WHEAT, ResourceType.HORSES, None, None])
-                    elif terrain == TerrainType.GRASSLAND:
-                        resource = random.choice([ResourceType.CATTLE, ResourceType.SHEEP, None, None])
-                    elif terrain == TerrainType.HILLS:
-                        resource = random.choice([ResourceType.IRON, ResourceType.COAL, None, None])
-                    elif terrain == TerrainType.FOREST:
-                        resource = None
-                    elif terrain == TerrainType.DESERT:
-                        resource = random.choice([ResourceType.GOLD, None, None])
-                    else:
-                        resource = None
-                else:
-                    resource = None
-                
-                # 가시성/탐험 상태
-                distance_from_center = distance - sea_radius
-                explored = random.random() < (0.8 - distance_from_center * 0.1)
-                visible = random.random() < (0.6 - distance_from_center * 0.1) and explored
-            
-            # 헥스 타일 생성
-            hexagon = HexTile(
-                q=q,
-                r=r,
-                s=s,
-                terrain=terrain,
-                resource=resource,
-                visible=False,  # 기본값: 보이지 않음
-                explored=False   # 기본값: 탐험되지 않음
-            )
-            
-            # 문명 시작 위치에 도시와 유닛 배치
-            for civ_name, pos in civ_positions.items():
-                # 도시 위치
-                if q == pos["q"] and r == pos["r"]:
-                    hexagon.city_id = pos["city_id"]
-                    hexagon.occupant = civ_name
-                    hexagon.terrain = TerrainType.PLAINS  # 도시는 평원에 위치
-                    # 플레이어(한국)만 초기에 볼 수 있음
-                    if civ_name == "Korea":
-                        hexagon.visible = True
-                        hexagon.explored = True
-                    else:
-                        hexagon.visible = False
-                        hexagon.explored = False
-                
-                # 유닛 위치
-                if q == pos["unit_q"] and r == pos["unit_r"]:
-                    hexagon.unit_id = pos["unit_id"]
-                    hexagon.occupant = civ_name
-                    # 플레이어(한국)만 초기에 볼 수 있음
-                    if civ_name == "Korea":
-                        hexagon.visible = True
-                        hexagon.explored = True
-                    else:
-                        hexagon.visible = False
-                        hexagon.explored = False
-            
-            # 문명 시작 주변 지형 조정 (평원, 초원, 숲 등으로 적절히 배치)
-            for civ_name, pos in civ_positions.items():
-                # 도시 근처 타일(2칸 이내)은 적절한 지형으로 설정
-                dist_to_city = max(
-                    abs(q - pos["q"]), 
-                    abs(r - pos["r"]), 
-                    abs(s - (-pos["q"] - pos["r"]))
-                )
-                
-                if dist_to_city <= 2 and dist_to_city > 0 and not is_sea and not is_edge:
-                    # 랜덤하게 좋은 지형 선택 (평원/초원/숲 등)
-                    good_terrains = [
-                        TerrainType.PLAINS, TerrainType.GRASSLAND, 
-                        TerrainType.FOREST, TerrainType.HILLS
-                    ]
-                    hexagon.terrain = random.choice(good_terrains)
-                    
-                    # 좋은 자원도 배치 (20% 확률)
-                    if random.random() < 0.2:
-                        good_resources = [
-                            ResourceType.WHEAT, ResourceType.HORSES, 
-                            ResourceType.CATTLE, ResourceType.IRON
-                        ]
-                        hexagon.resource = random.choice(good_resources)
-            
-            # 플레이어 위치는 시야 범위가 넓게 탐험됨
-            dist_to_player_city = max(
-                abs(q - civ_positions["Korea"]["q"]), 
-                abs(r - civ_positions["Korea"]["r"]), 
-                abs(s - (-civ_positions["Korea"]["q"] - civ_positions["Korea"]["r"]))
-            )
-            
-            dist_to_player_unit = max(
-                abs(q - civ_positions["Korea"]["unit_q"]), 
-                abs(r - civ_positions["Korea"]["unit_r"]), 
-                abs(s - (-civ_positions["Korea"]["unit_q"] - civ_positions["Korea"]["unit_r"]))
-            )
-            
-            # 도시 주변 2칸 이내는 완전히 보임
-            if dist_to_player_city <= 2:
-                hexagon.visible = True
-                hexagon.explored = True
-            # 유닛 주변 1칸 이내는 완전히 보임 (도시 시야와 중복되지 않는 경우)
-            elif dist_to_player_unit <= 1:
-                hexagon.visible = True
-                hexagon.explored = True
-            # 나머지는 안보임
-            else:
-                hexagon.visible = False
-                # 탐험 여부는 기존 설정 유지 (도시, 유닛 위치는 이미 앞에서 설정됨)
-            
-            hexagons.append(hexagon)
-    
-    return hexagons
+
+    # 맵 가장자리(산), 중앙 내륙 바다, 나머지 육지 마스크
+    edge_mask = np.zeros(shape, dtype=bool)
+    edge_mask[[0, -1], :] = True
+    edge_mask[:, [0, -1]] = True
+    sea_mask = (distance < sea_radius) & ~edge_mask
+    ocean_mask = sea_mask & (distance < sea_radius - 1)
+    coast_mask = sea_mask & ~ocean_mask
+    land_mask = ~edge_mask & ~sea_mask
+
+    # 육지 지형과 지형별 자원
+    land_codes = np.array([_terrain_code(t) for t in INLAND_SEA_LAND_TERRAINS], dtype=np.int8)
+    terrain = land_codes[rng.choice(len(land_codes), size=shape, p=INLAND_SEA_LAND_WEIGHTS)]
+    terrain[edge_mask] = _terrain_code(TerrainType.MOUNTAIN)
+    terrain[ocean_mask] = _terrain_code(TerrainType.OCEAN)
+    terrain[coast_mask] = _terrain_code(TerrainType.COAST)
+
+    resource = np.full(shape, NO_RESOURCE_CODE, dtype=np.int8)
+    resource_roll = rng.random(shape) < INLAND_SEA_RESOURCE_PROBABILITY
+    for land_terrain, candidates in INLAND_SEA_LAND_RESOURCES.items():
+        candidate_codes = np.array([_resource_code(c) for c in candidates], dtype=np.int8)
+        mask = land_mask & resource_roll & (terrain == _terrain_code(land_terrain))
+        resource[mask] = candidate_codes[rng.integers(len(candidate_codes), size=int(mask.sum()))]
+
+    # 해안에는 물고기
+    fish_mask = coast_mask & (rng.random(shape) < INLAND_SEA_RESOURCE_PROBABILITY)
+    resource[fish_mask] = _resource_code(ResourceType.FISH)
+
+    # 문명 시작 주변(1~2칸) 육지는 좋은 지형과 자원으로 조정
+    capital_centers = np.array([(pos["q"], pos["r"]) for pos in INLAND_SEA_CIV_POSITIONS.values()])
+    near_capital_mask = hex_radius_mask(width, height, capital_centers, 2, include_center=False) & land_mask
+
+    good_terrain_codes = np.array([_terrain_code(t) for t in INLAND_SEA_GOOD_TERRAINS], dtype=np.int8)
+    terrain[near_capital_mask] = good_terrain_codes[
+        rng.integers(len(good_terrain_codes), size=int(near_capital_mask.sum()))
+    ]
+    good_resource_mask = near_capital_mask & (rng.random(shape) < INLAND_SEA_RESOURCE_PROBABILITY)
+    good_resource_codes = np.array([_resource_code(c) for c in INLAND_SEA_GOOD_RESOURCES], dtype=np.int8)
+    resource[good_resource_mask] = good_resource_codes[
+        rng.integers(len(good_resource_codes), size=int(good_resource_mask.sum()))
+    ]
+
+    # 플레이어 시야: 도시 주변 2칸, 유닛 주변 1칸
+    player = INLAND_SEA_CIV_POSITIONS[INLAND_SEA_PLAYER_CIV]
+    vision_mask = (
+        hex_radius_mask(width, height, [(player["q"], player["r"])], 2)
+        | hex_radius_mask(width, height, [(player["unit_q"], player["unit_r"])], 1)
+    )
+
+    # 도시/유닛 배치 (유닛이 같은 타일에 있으면 유닛 문명이 점유자, 타일 인덱스 = q * height + r)
+    occupant: Dict[int, str] = {}
+    city_ids: Dict[int, str] = {}
+    unit_ids: Dict[int, str] = {}
+    for civ_name, pos in INLAND_SEA_CIV_POSITIONS.items():
+        if 0 <= pos["q"] < width and 0 <= pos["r"] < height:
+            index = pos["q"] * height + pos["r"]
+            city_ids[index] = pos["city_id"]
+            occupant.setdefault(index, civ_name)
+            # 도시는 평원에 위치
+            terrain[pos["q"], pos["r"]] = _terrain_code(TerrainType.PLAINS)
+    for civ_name, pos in INLAND_SEA_CIV_POSITIONS.items():
+        if 0 <= pos["unit_q"] < width and 0 <= pos["unit_r"] < height:
+            index = pos["unit_q"] * height + pos["unit_r"]
+            unit_ids[index] = pos["unit_id"]
+            occupant[index] = civ_name
+
+    return TileStore(
+        q=np.broadcast_to(q, shape),
+        r=np.broadcast_to(r, shape),
+        terrain=terrain,
+        resource=resource,
+        visible=vision_mask,
+        explored=vision_mask,
+        occupant=occupant,
+        city_id=city_ids,
+        unit_id=unit_ids
+    )
 
 # 턴 진행 API 엔드포인트 추가
 @router.post("/turn/next")
@@ -642,7 +631,7 @@ async def next_turn(game_id: str, user_id: str):
                 "message": "현재 턴의 게임 상태를 찾을 수 없습니다."
             }
         
-        current_state = game_states[0]
+        current_state = max(game_states, key=lambda state: state.id)
         
         # 다음 턴으로 게임 상태 업데이트 (실제로는 턴 진행 로직 필요)
         # 여기서 AI들의 턴 처리, 자원 생산, 유닛 이동 등의 로직 처리
@@ -650,9 +639,10 @@ async def next_turn(game_id: str, user_id: str):
         # 다음 턴 번호
         next_turn_number = current_turn + 1
         
-        # 새로운 게임 상태 생성 (이전 상태 복사 후 변경)
-        new_state_data = current_state.stateData
-        new_state_data["turn"] = next_turn_number
+        # 새로운 게임 상태 생성 (이전 상태 복원 후 변경 - 타일 저장소는 바뀐 경우에만 새로 만듦)
+        previous_state = await turn_state_history.load(prisma, game_id, current_turn, row=current_state)
+        tiles, previous_meta = previous_state
+        new_state = (tiles, {**previous_meta, "turn": next_turn_number})
         
         # TODO: 여기서 게임 상태 업데이트 로직 구현
         # (자원 증가, AI 문명 움직임, 등)
@@ -665,14 +655,22 @@ async def next_turn(game_id: str, user_id: str):
             }
         )
         
-        # 새로운 게임 상태 별도 생성
+        # 새로운 게임 상태 별도 생성 (키프레임 턴이 아니면 이전 턴 대비 변경분만 저장)
+        state_value = turn_state_history.encode(
+            next_turn_number,
+            new_state,
+            previous=previous_state,
+            keyframe_turn=keyframe_turn_for(current_state.stateData, current_turn)
+        )
         await prisma.gamestate.create(
             data={
                 "gameId": game_id,
                 "turn": next_turn_number,
-                "stateData": json.dumps(new_state_data)
+                "stateData": json.dumps(state_value)
             }
         )
+        turn_state_history.remember(game_id, next_turn_number, new_state)
+        new_state_data = to_state_data(new_state)
     
         
         return {
@@ -763,11 +761,14 @@ async def get_game_state(game_id: str, user_id: str, turn: Optional[int] = None)
                 "message": f"턴 {query_turn}의 게임 상태를 찾을 수 없습니다."
             }
         
+        # 키프레임부터 변경분을 적용해 해당 턴 상태 복원 (최근 복원한 턴은 캐시 사용)
+        state = await turn_state_history.load(prisma, game_id, query_turn, row=game_state)
+        
         return {
             "success": True,
             "status_code": 200,
             "message": f"턴 {query_turn}의 게임 상태를 조회했습니다.",
-            "data": game_state.stateData,
+            "data": to_state_data(state),
             "meta": {
                 "game_id": game_id,
                 "turn": query_turn,
@@ -788,6 +789,112 @@ async def get_game_state(game_id: str, user_id: str, turn: Optional[int] = None)
             }
         }
 
+@router.get("/game/{game_id}/chunks")
+async def get_map_chunks(
+    game_id: str,
+    user_id: str,
+    turn: Optional[int] = None,
+    chunks: Optional[str] = Query(None, description="청크 ID 목록 (예: 0:0,1:0)"),
+    q_min: Optional[int] = Query(None, description="뷰포트 q 최소값"),
+    q_max: Optional[int] = Query(None, description="뷰포트 q 최대값"),
+    r_min: Optional[int] = Query(None, description="뷰포트 r 최소값"),
+    r_max: Optional[int] = Query(None, description="뷰포트 r 최대값"),
+    versions: Optional[str] = Query(None, description="클라이언트가 가진 청크 버전 (예: 0:0=123,1:0=456)")
+):
+    """게임 상태 스냅샷에서 뷰포트/청크 단위로 타일 조회
+
+    버전이 클라이언트가 가진 값과 같은 청크는 타일 없이 unchanged로만 응답합니다.
+    """
+    try:
+        chunk_size = settings.MAP_CHUNK_SIZE
+        try:
+            chunk_ids = resolve_chunk_request(
+                chunks, q_min, q_max, r_min, r_max, chunk_size, settings.MAP_CHUNK_MAX_PER_REQUEST
+            )
+            known_versions = parse_chunk_versions(versions)
+        except ValueError as e:
+            return {
+                "success": False,
+                "status_code": 400,
+                "message": f"잘못된 청크 요청입니다: {str(e)}"
+            }
+        
+        # 연결이 필요한 경우에만 연결
+        try:
+            await prisma.connect()
+        except Exception as e:
+            if "Already connected" not in str(e) and "Could not connect" in str(e):
+                return {
+                    "success": False,
+                    "status_code": 500,
+                    "message": f"데이터베이스 연결 오류: {str(e)}",
+                    "error": {
+                        "type": type(e).__name__,
+                        "detail": str(e)
+                    }
+                }
+        
+        game = await prisma.game.find_unique(
+            where={"id": game_id}
+        )
+        
+        if not game:
+            return {
+                "success": False,
+                "status_code": 404,
+                "message": "해당 게임을 찾을 수 없습니다."
+            }
+        
+        if game.userId != user_id:
+            return {
+                "success": False,
+                "status_code": 403,
+                "message": "해당 게임에 대한 권한이 없습니다."
+            }
+        
+        # 키프레임/변경분에서 해당 턴 상태 복원 (최근 턴은 캐시 사용)
+        query_turn = turn if turn is not None else game.currentTurn
+        state = await turn_state_history.load(prisma, game_id, query_turn)
+        
+        if not state:
+            return {
+                "success": False,
+                "status_code": 404,
+                "message": f"턴 {query_turn}의 게임 상태를 찾을 수 없습니다."
+            }
+        
+        tiles, _ = state
+        chunk_data = store_chunks(tiles, chunk_ids, chunk_size, known_versions)
+        
+        return {
+            "success": True,
+            "status_code": 200,
+            "message": f"청크 {len(chunk_data)}개를 조회했습니다.",
+            "data": {
+                "chunks": chunk_data
+            },
+            "meta": {
+                "game_id": game_id,
+                "turn": query_turn,
+                "current_turn": game.currentTurn,
+                "chunk_size": chunk_size,
+                "width": game.width,
+                "height": game.height,
+                "changed_chunks": sum(1 for chunk in chunk_data if not chunk["unchanged"])
+            }
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "status_code": 500,
+            "message": f"청크 조회 중 오류가 발생했습니다: {str(e)}",
+            "error": {
+                "type": type(e).__name__,
+                "detail": str(e)
+            }
+        }
+
 @router.get("/adjacent")
 async def get_adjacent_tiles(q: int, r: int):
     """지정된 타일 주변의 인접 타일 정보 반환"""
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CpuPoolBusyError(RuntimeError):
+    """실행 대기 작업이 한도를 넘은 경우"""
+
+
+def _timed_call(func: Callable, args: tuple, kwargs: dict) -> Tuple[Any, float, int]:
+    """워커 프로세스에서 실행 - (결과, 실제 실행 시간(초), 워커 pid)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start, os.getpid()
+
+
+class TaskStats:
+    """작업 이름별 소요 시간 집계"""
+
+    def __init__(self):
+        self.count = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = 0.0
+        self.run_ms = 0.0
+        self.wait_ms = 0.0
+
+    def record(self, total_ms: float, run_ms: float):
+        self.count += 1
+        self.total_ms += total_ms
+        self.run_ms += run_ms
+        self.wait_ms += max(0.0, total_ms - run_ms)
+        self.last_ms = total_ms
+        self.max_ms = max(self.max_ms, total_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "avg_run_ms": round(self.run_ms / self.count, 3) if self.count else 0.0,
+            "avg_queue_ms": round(self.wait_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "last_ms": round(self.last_ms, 3)
+        }
+
+
+class CpuPool:
+    """CPU 연산(맵 생성, 시작 위치 탐색, 자원 배치 등)을 이벤트 루프 밖에서 실행하는 프로세스 풀
+
+    작업 결과는 인자(시드 포함)만으로 결정되어야 하며, 어느 워커가 실행하든 같은 결과가 나옵니다.
+    동시에 실행/대기할 수 있는 작업 수를 제한하고 작업 이름별 소요 시간(대기 + 실행)을 집계합니다.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int, task_timeout: Optional[float] = None):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.task_timeout = task_timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._active = 0
+        self._waiting = 0
+        self._stats: Dict[str, TaskStats] = {}
+        self.restarts = 0
+        self.rejected = 0
+
+    @property
+    def running(self) -> bool:
+        return self._executor is not None
+
+    def start(self):
+        """워커 프로세스 풀 시작 (max_workers가 0이면 현재 프로세스에서 직접 실행)"""
+        if self.running or self.max_workers <= 0:
+            return
+        self._slots = asyncio.Semaphore(self.max_workers)
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # 이벤트 루프와 DB 연결을 물려받지 않도록 spawn으로 워커 생성
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+
+    async def stop(self):
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def run(self, func: Callable, *args, label: Optional[str] = None, timeout: Optional[float] = None, **kwargs) -> Any:
+        """func(*args, **kwargs)를 워커에서 실행하고 결과를 기다림
+
+        func와 인자는 pickle 가능해야 합니다 (모듈 최상위 함수).
+        풀이 시작되지 않았으면 현재 프로세스에서 바로 실행합니다. 이 경우 작업이 끝날 때까지
+        이벤트 루프가 멈추며, 작업이 전역 random을 시드로 초기화해도 실행 전 상태로 되돌립니다.
+        시간 초과된 작업은 워커에서 강제로 멈출 수 없으므로 실제로 끝날 때까지 실행 슬롯을 차지합니다.
+        """
+        label = label or getattr(func, "__name__", "task")
+        stats = self._stats.setdefault(label, TaskStats())
+        start = time.perf_counter()
+
+        if not self.running:
+            # 작업(prepare_map 등)의 random.seed 호출이 이 프로세스의 다른 난수 사용에 영향을 주지 않도록 복원
+            random_state = random.getstate()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                stats.failed += 1
+                raise
+            finally:
+                random.setstate(random_state)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats.record(elapsed_ms, elapsed_ms)
+            return result
+
+        if self._waiting >= self.max_queue:
+            self.rejected += 1
+            raise CpuPoolBusyError(f"CPU 작업 대기열이 가득 찼습니다 (대기 {self._waiting}개).")
+
+        timeout = timeout if timeout is not None else self.task_timeout
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._active += 1
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, _timed_call, func, args, kwargs)
+        except BaseException:
+            self._release_slot()
+            raise
+        # 대기가 시간 초과/취소되어도 워커는 계속 실행되므로 슬롯은 실제 작업이 끝날 때 반환
+        future.add_done_callback(self._on_task_done)
+
+        try:
+            result, run_seconds, _ = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            stats.timed_out += 1
+            stats.failed += 1
+            logger.error(f"CPU 작업 시간 초과: {label} ({timeout}초) - 워커 작업이 끝날 때까지 슬롯 유지")
+            raise
+        except BrokenProcessPool:
+            stats.failed += 1
+            self._restart()
+            raise
+        except Exception:
+            stats.failed += 1
+            raise
+
+        stats.record((time.perf_counter() - start) * 1000, run_seconds * 1000)
+        return result
+
+    def _on_task_done(self, future: asyncio.Future):
+        # 기다리던 쪽이 먼저 포기한 작업의 예외가 "retrieved되지 않음" 경고로 남지 않도록 확인
+        if not future.cancelled():
+            future.exception()
+        self._release_slot()
+
+    def _release_slot(self):
+        self._active -= 1
+        self._slots.release()
+
+    def _restart(self):
+        """워커가 비정상 종료되어 풀이 깨진 경우 새 풀로 교체"""
+        logger.error("CPU 프로세스 풀이 손상되어 다시 시작합니다.")
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = self._create_executor()
+        self.restarts += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """풀 크기, 실행/대기 작업 수, 작업별 소요 시간"""
+        return {
+            "running": self.running,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "active": self._active,
+            "queued": self._waiting,
+            "rejected": self.rejected,
+            "restarts": self.restarts,
+            "tasks": {label: stats.to_dict() for label, stats in self._stats.items()}
+        }
+
+
+# 전역 CPU 프로세스 풀 인스턴스
+cpu_pool = CpuPool(
+    max_workers=settings.CPU_POOL_WORKERS,
+    max_queue=settings.CPU_POOL_MAX_QUEUE,
+    task_timeout=settings.CPU_POOL_TASK_TIMEOUT_SECONDS
+)
@@ -0,0 +1,293 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import itertools
+import numpy as np
+from cachetools import LRUCache
+from core.config import settings
+from models.hexmap import Hex, hex_at
+from utils.landmass import NO_COMPONENT, Landmasses
+from utils.map_utils import NEIGHBOR_DIRECTIONS, WATER_TERRAINS, radius_offsets, ring_offsets
+
+# 헥스 좌표 저장을 위한 튜플 타입
+HexCoord = Tuple[int, int, int]
+
+# 값이 없는 칸 (자원/도시/유닛 없음, 맵 밖 좌표)
+NO_VALUE = -1
+
+# 그리드 버전 번호 (프로세스 전체에서 단조 증가 - 세션 그리드를 다시 읽어도 이전 버전 값과 겹치지 않음)
+_versions = itertools.count(1)
+
+
+def _row_value(row: Any, field: str) -> Any:
+    """Hexagon 모델/딕셔너리 행에서 필드 값 읽기"""
+    return row.get(field) if isinstance(row, dict) else getattr(row, field, None)
+
+
+class HexGrid:
+    """게임 세션 하나의 Hexagon 타일을 (q, r) -> 평면 인덱스로 매핑한 메모리 공간 인덱스
+
+    지형/자원/도시/유닛/시야를 타일 순서 배열로 보관하고,
+    인접/링/반경 조회는 오프셋 배열 연산 한 번으로 평면 인덱스 배열을 반환합니다.
+    DB에 쓰는 쪽이 같은 변경을 set_* 메서드로 반영하며, 변경마다 version이 올라갑니다.
+    유닛/도시 배치가 바뀔 때는 occupancy_version도 함께 올라갑니다.
+    지형은 그리드를 만든 뒤 바뀌지 않으므로 terrain_version은 그리드마다 한 번만 정해집니다 (지형 기반 경로 캐시 키).
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        q: np.ndarray,
+        r: np.ndarray,
+        terrain_ids: List[Optional[str]],
+        resource_ids: List[Optional[str]],
+        city_ids: List[Optional[int]],
+        unit_ids: List[Optional[int]]
+    ):
+        self.session_id = session_id
+        self.q = np.asarray(q, dtype=np.int32)
+        self.r = np.asarray(r, dtype=np.int32)
+        count = len(self.q)
+
+        # 지형/자원 id는 세션별 목록의 코드로 저장
+        self.terrain_names: List[Optional[str]] = []
+        self._terrain_codes: Dict[Optional[str], int] = {}
+        self.terrain = np.array([self._terrain_code(t) for t in terrain_ids], dtype=np.int16).reshape(count)
+        self.resource_names: List[str] = []
+        self._resource_codes: Dict[str, int] = {}
+        self.resource = np.array([self._resource_code(res) for res in resource_ids], dtype=np.int16).reshape(count)
+
+        self.city_id = np.array([NO_VALUE if c is None else c for c in city_ids], dtype=np.int64).reshape(count)
+        self.unit_id = np.array([NO_VALUE if u is None else u for u in unit_ids], dtype=np.int64).reshape(count)
+        self.visible = np.zeros(count, dtype=bool)
+        self.explored = np.zeros(count, dtype=bool)
+        self.version = next(_versions)
+        self.occupancy_version = next(_versions)
+        self.terrain_version = next(_versions)
+
+        # (q, r) -> 평면 인덱스 조회 테이블 (타일이 없는 칸은 NO_VALUE)
+        self.q_min = int(self.q.min()) if count else 0
+        self.r_min = int(self.r.min()) if count else 0
+        q_span = int(self.q.max()) - self.q_min + 1 if count else 0
+        r_span = int(self.r.max()) - self.r_min + 1 if count else 0
+        self._index = np.full((q_span, r_span), NO_VALUE, dtype=np.int32)
+        self._index[self.q - self.q_min, self.r - self.r_min] = np.arange(count, dtype=np.int32)
+
+        # 대륙/수역 라벨 (처음 조회할 때 계산하거나 맵 준비 단계의 라벨을 연결)
+        self._landmasses: Optional[Landmasses] = None
+        self._continent: Optional[np.ndarray] = None
+        self._water_body: Optional[np.ndarray] = None
+        self._neighbor_table: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_rows(cls, session_id: str, rows: Iterable[Any]) -> "HexGrid":
+        """Hexagon 행(모델 또는 create_many용 딕셔너리)으로 그리드 생성"""
+        rows = list(rows)
+        return cls(
+            session_id,
+            q=np.array([_row_value(row, "q") for row in rows], dtype=np.int32),
+            r=np.array([_row_value(row, "r") for row in rows], dtype=np.int32),
+            terrain_ids=[_row_value(row, "terrain_id") for row in rows],
+            resource_ids=[_row_value(row, "resource_id") for row in rows],
+            city_ids=[_row_value(row, "city_id") for row in rows],
+            unit_ids=[_row_value(row, "unit_id") for row in rows]
+        )
+
+    def __len__(self) -> int:
+        return len(self.q)
+
+    def _terrain_code(self, terrain_id: Optional[str]) -> int:
+        code = self._terrain_codes.get(terrain_id)
+        if code is None:
+            code = self._terrain_codes[terrain_id] = len(self.terrain_names)
+            self.terrain_names.append(terrain_id)
+        return code
+
+    def _resource_code(self, resource_id: Optional[str]) -> int:
+        if not resource_id:
+            return NO_VALUE
+        code = self._resource_codes.get(resource_id)
+        if code is None:
+            code = self._resource_codes[resource_id] = len(self.resource_names)
+            self.resource_names.append(resource_id)
+        return code
+
+    # ---- 좌표 <-> 인덱스 ----
+
+    def lookup(self, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+        """좌표 배열의 평면 인덱스 배열 (맵 밖이면 NO_VALUE)"""
+        dq = np.asarray(q, dtype=np.int64) - self.q_min
+        dr = np.asarray(r, dtype=np.int64) - self.r_min
+        inside = (dq >= 0) & (dq < self._index.shape[0]) & (dr >= 0) & (dr < self._index.shape[1])
+        result = np.full(dq.shape, NO_VALUE, dtype=np.int32)
+        result[inside] = self._index[dq[inside], dr[inside]]
+        return result
+
+    def index_of(self, q: int, r: int, s: Optional[int] = None) -> int:
+        """좌표의 평면 인덱스 (맵 밖이거나 s가 q + r + s = 0을 만족하지 않으면 NO_VALUE)"""
+        if s is not None and q + r + s != 0:
+            return NO_VALUE
+        dq, dr = q - self.q_min, r - self.r_min
+        if 0 <= dq < self._index.shape[0] and 0 <= dr < self._index.shape[1]:
+            return int(self._index[dq, dr])
+        return NO_VALUE
+
+    def coord(self, index: int) -> Hex:
+        return hex_at(int(self.q[index]), int(self.r[index]))
+
+    def coords(self, indices: np.ndarray) -> List[HexCoord]:
+        return [(q, r, -q - r) for q, r in zip(self.q[indices].tolist(), self.r[indices].tolist())]
+
+    # ---- 공간 조회 (맵 안에 있는 타일의 평면 인덱스 배열 반환) ----
+
+    def around(self, q: int, r: int, offsets: np.ndarray) -> np.ndarray:
+        """(q, r)에 오프셋 배열을 더한 좌표 중 맵 안에 있는 타일 인덱스 (오프셋 순서 유지)"""
+        indices = self.lookup(offsets[:, 0] + q, offsets[:, 1] + r)
+        return indices[indices != NO_VALUE]
+
+    def neighbors(self, q: int, r: int) -> np.ndarray:
+        return self.around(q, r, NEIGHBOR_DIRECTIONS)
+
+    def ring(self, q: int, r: int, radius: int) -> np.ndarray:
+        """반경 radius 링 타일 인덱스 (radius <= 0이면 중심 타일)"""
+        if radius <= 0:
+            return self.around(q, r, radius_offsets(0))
+        return self.around(q, r, ring_offsets(radius))
+
+    def within(self, q: int, r: int, radius: int) -> np.ndarray:
+        """반경 radius 이내 (중심 포함) 타일 인덱스"""
+        return self.around(q, r, radius_offsets(radius))
+
+    @property
+    def neighbor_table(self) -> np.ndarray:
+        """타일별 인접 타일 인덱스 (len, 6) - 맵 밖 방향은 NO_VALUE (타일 배치는 바뀌지 않으므로 한 번만 계산)"""
+        if self._neighbor_table is None:
+            self._neighbor_table = self.lookup(
+                self.q[:, None] + NEIGHBOR_DIRECTIONS[None, :, 0],
+                self.r[:, None] + NEIGHBOR_DIRECTIONS[None, :, 1]
+            )
+        return self._neighbor_table
+
+    # ---- 타일 값 ----
+
+    def terrain_id(self, index: int) -> Optional[str]:
+        return self.terrain_names[self.terrain[index]]
+
+    def resource_id(self, index: int) -> Optional[str]:
+        code = int(self.resource[index])
+        return self.resource_names[code] if code != NO_VALUE else None
+
+    def with_resource(self, indices: np.ndarray) -> np.ndarray:
+        """인덱스 중 자원이 있는 타일만 (순서 유지)"""
+        return indices[self.resource[indices] != NO_VALUE]
+
+    def terrain_mask(self, terrain_ids: Iterable[str]) -> np.ndarray:
+        """지정한 지형인 타일의 bool 마스크 (전체 타일 순서)"""
+        codes = [self._terrain_codes[t] for t in terrain_ids if t in self._terrain_codes]
+        return np.isin(self.terrain, codes)
+
+    def unit_at(self, index: int) -> Optional[int]:
+        unit_id = int(self.unit_id[index])
+        return unit_id if unit_id != NO_VALUE else None
+
+    def city_at(self, index: int) -> Optional[int]:
+        city_id = int(self.city_id[index])
+        return city_id if city_id != NO_VALUE else None
+
+    # ---- 대륙/수역 (지형은 바뀌지 않으므로 세션당 한 번만 계산) ----
+
+    def attach_landmasses(self, landmasses: Landmasses, q_origin: int = 0, r_origin: int = 0):
+        """이미 계산된 대륙/수역 라벨 연결 (라벨 배열 인덱스는 [q - q_origin, r - r_origin])"""
+        self._landmasses = landmasses
+        self._continent = landmasses.continent[self.q - q_origin, self.r - r_origin]
+        self._water_body = landmasses.water_body[self.q - q_origin, self.r - r_origin]
+
+    @property
+    def landmasses(self) -> Landmasses:
+        if self._landmasses is None:
+            # 타일이 없는 칸은 땅도 물도 아닌 것으로 보고 조회 테이블 좌표계에서 라벨링
+            present = self._index != NO_VALUE
+            water = np.zeros(self._index.shape, dtype=bool)
+            water[self.q - self.q_min, self.r - self.r_min] = self.terrain_mask(WATER_TERRAINS)
+            self.attach_landmasses(Landmasses.from_masks(present & ~water, water), self.q_min, self.r_min)
+        return self._landmasses
+
+    @property
+    def continent(self) -> np.ndarray:
+        """타일별 대륙 id (물 타일은 NO_COMPONENT)"""
+        if self._continent is None:
+            self.landmasses
+        return self._continent
+
+    @property
+    def water_body(self) -> np.ndarray:
+        """타일별 수역 id (땅 타일은 NO_COMPONENT)"""
+        if self._water_body is None:
+            self.landmasses
+        return self._water_body
+
+    def continent_of(self, index: int) -> int:
+        return int(self.continent[index])
+
+    def same_landmass(self, a: int, b: int) -> bool:
+        """두 타일이 같은 대륙 위에 있는지 (하나라도 물이면 False)"""
+        continent = self.continent_of(a)
+        return continent != NO_COMPONENT and continent == self.continent_of(b)
+
+    # ---- 변경 (DB에 같은 변경을 쓴 뒤 호출) ----
+
+    def set_resource(self, index: int, resource_id: Optional[str]):
+        self.resource[index] = self._resource_code(resource_id)
+        self.version = next(_versions)
+
+    def set_unit(self, index: int, unit_id: Optional[int]):
+        self.unit_id[index] = NO_VALUE if unit_id is None else unit_id
+        self.version = self.occupancy_version = next(_versions)
+
+    def set_city(self, index: int, city_id: Optional[int]):
+        self.city_id[index] = NO_VALUE if city_id is None else city_id
+        self.version = self.occupancy_version = next(_versions)
+
+    def reveal(self, indices: np.ndarray):
+        """타일을 보임/탐험됨으로 표시"""
+        self.visible[indices] = True
+        self.explored[indices] = True
+        self.version = next(_versions)
+
+
+class HexGridRegistry:
+    """게임 세션별 HexGrid 캐시 - 세션당 한 번만 Hexagon 테이블을 읽음"""
+
+    def __init__(self, max_entries: int):
+        self._grids: LRUCache = LRUCache(maxsize=max_entries)
+        self.hits = 0
+        self.loads = 0
+
+    def put(self, grid: HexGrid):
+        self._grids[grid.session_id] = grid
+
+    def forget(self, session_id: str):
+        self._grids.pop(session_id, None)
+
+    async def get(self, db, session_id: str) -> Optional[HexGrid]:
+        """세션의 그리드 반환 (캐시에 없으면 Hexagon 행을 한 번 읽어 생성, 타일이 없으면 None)"""
+        grid = self._grids.get(session_id)
+        if grid is not None:
+            self.hits += 1
+            return grid
+        rows = await db.hexagon.find_many(where={"session_id": session_id})
+        if not rows:
+            return None
+        self.loads += 1
+        grid = HexGrid.from_rows(session_id, rows)
+        self.put(grid)
+        return grid
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._grids),
+            "hits": self.hits,
+            "loads": self.loads
+        }
+
+
+# 전역 헥스 그리드 캐시 인스턴스
+hex_grids = HexGridRegistry(settings.HEX_GRID_CACHE_SIZE)
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+import numpy as np
+from utils.map_generator import GeneratedMap
+from utils.map_utils import WATER_TERRAINS
+
+# 라벨이 없는 칸 (대륙 라벨에서는 물/맵 밖, 수역 라벨에서는 땅/맵 밖)
+NO_COMPONENT = -1
+
+# 연결 판정에 쓰는 인접 방향 절반 (반대 방향은 같은 간선) - (dq, dr)
+_HALF_NEIGHBOR_DIRECTIONS = ((1, 0), (0, 1), (1, -1))
+
+
+def _neighbor_pairs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """마스크 안에서 서로 인접한 두 칸의 평면 인덱스 쌍 배열"""
+    width, height = mask.shape
+    index = np.arange(width * height).reshape(width, height)
+    sources, targets = [], []
+    for dq, dr in _HALF_NEIGHBOR_DIRECTIONS:
+        q_src = slice(0, width - dq)
+        q_dst = slice(dq, width)
+        r_src = slice(max(0, -dr), height - max(0, dr))
+        r_dst = slice(max(0, dr), height - max(0, -dr))
+        both = mask[q_src, r_src] & mask[q_dst, r_dst]
+        sources.append(index[q_src, r_src][both])
+        targets.append(index[q_dst, r_dst][both])
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+def label_regions(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """헥스 인접(6방향)으로 연결된 마스크 영역 라벨링 - (라벨 (width, height), 영역별 크기)
+
+    배열 기반 유니온 파인드: 간선마다 큰 루트를 작은 루트에 붙이고 포인터 점프로 경로를 압축하는 과정을
+    더 이상 합쳐지지 않을 때까지 반복합니다. 라벨은 영역의 첫 타일(q, r 오름차순) 순서로 0부터 매깁니다.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    sources, targets = _neighbor_pairs(mask)
+    parent = np.arange(mask.size)
+    while True:
+        root_a, root_b = parent[sources], parent[targets]
+        merge = root_a != root_b
+        if not merge.any():
+            break
+        np.minimum.at(parent, np.maximum(root_a, root_b)[merge], np.minimum(root_a, root_b)[merge])
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    labels = np.full(mask.shape, NO_COMPONENT, dtype=np.int32)
+    _, inverse, sizes = np.unique(parent[mask.ravel()], return_inverse=True, return_counts=True)
+    labels[mask] = inverse
+    return labels, sizes.astype(np.int32)
+
+
+@dataclass
+class Landmasses:
+    """대륙(연결된 땅)과 수역(연결된 물) 라벨 (배열 인덱스 [q, r])"""
+    continent: np.ndarray         # (width, height) int32 - 대륙 id, 물/맵 밖은 NO_COMPONENT
+    water_body: np.ndarray        # (width, height) int32 - 수역 id, 땅/맵 밖은 NO_COMPONENT
+    continent_sizes: np.ndarray   # 대륙 id별 타일 수
+    water_body_sizes: np.ndarray  # 수역 id별 타일 수
+
+    @classmethod
+    def from_masks(cls, land: np.ndarray, water: np.ndarray) -> "Landmasses":
+        continent, continent_sizes = label_regions(land)
+        water_body, water_body_sizes = label_regions(water)
+        return cls(continent, water_body, continent_sizes, water_body_sizes)
+
+    def continent_size(self, continent_id: int) -> int:
+        return int(self.continent_sizes[continent_id]) if continent_id != NO_COMPONENT else 0
+
+    def continent_size_grid(self) -> np.ndarray:
+        """타일별 소속 대륙 크기 (width, height) - 물/맵 밖은 0"""
+        sizes = np.append(self.continent_sizes, 0)
+        return sizes[self.continent]
+
+    def same_landmass(self, a: Tuple[int, ...], b: Tuple[int, ...]) -> bool:
+        """두 좌표가 같은 대륙 위에 있는지 (둘 중 하나라도 물/맵 밖이면 False)"""
+        if not (self._inside(a) and self._inside(b)):
+            return False
+        continent = self.continent[a[0], a[1]]
+        return continent != NO_COMPONENT and continent == self.continent[b[0], b[1]]
+
+    def _inside(self, coord: Tuple[int, ...]) -> bool:
+        return 0 <= coord[0] < self.continent.shape[0] and 0 <= coord[1] < self.continent.shape[1]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "continents": len(self.continent_sizes),
+            "largest_continent": int(self.continent_sizes.max()) if len(self.continent_sizes) else 0,
+            "water_bodies": len(self.water_body_sizes),
+            "largest_water_body": int(self.water_body_sizes.max()) if len(self.water_body_sizes) else 0
+        }
+
+
+def label_landmasses(game_map: GeneratedMap) -> Landmasses:
+    """생성된 맵의 대륙/수역 라벨 계산"""
+    water = game_map.terrain_mask(WATER_TERRAINS)
+    return Landmasses.from_masks(~water, water)
@@ -0,0 +1,173 @@
+import hashlib
+import io
+import logging
+import os
+from typing import Iterable, Optional, Tuple
+import numpy as np
+import zstandard
+from cachetools import LRUCache
+from core.config import settings
+from models.map import MapType
+from utils.map_generator import GeneratedMap
+from utils.terrain_engines import generate_map_grid, resolve_terrain_engine
+
+logger = logging.getLogger(__name__)
+
+# 생성 알고리즘이 바뀌면 올려서 이전 캐시 파일을 무효화
+MAP_GENERATOR_VERSION = 1
+
+# (seed, map_type, width, height, 사용 가능 자원 목록 요약) 캐시 키
+MapCacheKey = Tuple[int, str, int, int, str]
+
+# available_resources가 None(모든 자원 허용)일 때의 자원 목록 요약 값
+ALL_RESOURCES_DIGEST = "all"
+
+
+def resources_digest(available_resources: Optional[Iterable[str]]) -> str:
+    """사용 가능 자원 목록의 순서 무관 요약 (같은 시드라도 자원 목록이 다르면 다른 맵이므로 캐시 키에 포함)"""
+    if available_resources is None:
+        return ALL_RESOURCES_DIGEST
+    joined = ",".join(sorted(set(available_resources)))
+    return hashlib.sha256(joined.encode()).hexdigest()[:16]
+
+
+class MapCache:
+    """생성된 지형/자원 그리드 캐시 (프로세스 내 LRU + zstd 압축 디스크 저장소)
+
+    같은 설정(generate_deterministic_seed)은 같은 시드를 쓰므로
+    반복되는 설정의 게임은 맵 생성을 건너뛰고 바로 일괄 저장 단계로 넘어갈 수 있습니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str], max_entries: int):
+        self.cache_dir = cache_dir
+        self._memory: LRUCache = LRUCache(maxsize=max_entries)
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        seed: int,
+        map_type,
+        width: int,
+        height: int,
+        available_resources: Optional[Iterable[str]] = None
+    ) -> MapCacheKey:
+        return (
+            int(seed),
+            getattr(map_type, "value", map_type),
+            int(width),
+            int(height),
+            resources_digest(available_resources)
+        )
+
+    def _path(self, key: MapCacheKey) -> str:
+        # 같은 키라도 지형 생성기가 다르면 다른 맵이므로 파일 이름에 포함
+        engine = resolve_terrain_engine(key[2], key[3])
+        digest = hashlib.sha256(f"v{MAP_GENERATOR_VERSION}:{engine}:{key}".encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.npz.zst")
+
+    def _load(self, key: MapCacheKey) -> Optional[GeneratedMap]:
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "rb") as f:
+                arrays = np.load(io.BytesIO(self._decompressor.decompress(f.read())))
+                terrain, resource = arrays["terrain"], arrays["resource"]
+        except Exception as e:
+            logger.warning(f"맵 캐시 파일 로드 실패 ({path}): {str(e)}")
+            return None
+        seed, map_type, width, height, _ = key
+        return GeneratedMap(map_type, width, height, seed, terrain, resource)
+
+    def _store(self, key: MapCacheKey, game_map: GeneratedMap):
+        if not self.cache_dir:
+            return
+        buffer = io.BytesIO()
+        np.savez(buffer, terrain=game_map.terrain, resource=game_map.resource)
+        path = self._path(key)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 임시 파일에 쓴 뒤 교체하여 다른 워커가 쓰다 만 파일을 읽지 않도록 함
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(self._compressor.compress(buffer.getvalue()))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"맵 캐시 파일 저장 실패 ({path}): {str(e)}")
+
+    def get(
+        self,
+        seed: int,
+        map_type,
+        width: int,
+        height: int,
+        available_resources: Optional[Iterable[str]] = None
+    ) -> Optional[GeneratedMap]:
+        """캐시된 맵의 복사본 반환 (없으면 None)"""
+        key = self.make_key(seed, map_type, width, height, available_resources)
+        game_map = self._memory.get(key)
+        if game_map is not None:
+            self.hits += 1
+        else:
+            game_map = self._load(key)
+            if game_map is None:
+                return None
+            self.disk_hits += 1
+            self._memory[key] = game_map
+        return copy_map(game_map)
+
+    def put(self, game_map: GeneratedMap, available_resources: Optional[Iterable[str]] = None):
+        """맵을 메모리와 디스크 캐시에 저장 (available_resources는 맵을 생성할 때 쓴 자원 목록)"""
+        key = self.make_key(game_map.seed, game_map.map_type, game_map.width, game_map.height, available_resources)
+        stored = copy_map(game_map)
+        self._memory[key] = stored
+        self._store(key, stored)
+
+    def get_or_generate(
+        self,
+        map_type: MapType,
+        width: int,
+        height: int,
+        seed: int,
+        available_resources: Optional[Iterable[str]] = None
+    ) -> GeneratedMap:
+        """캐시에 있으면 복사본을, 없으면 새로 생성하여 캐시에 저장 후 반환"""
+        if available_resources is not None:
+            available_resources = list(available_resources)
+        game_map = self.get(seed, map_type, width, height, available_resources)
+        if game_map is not None:
+            return game_map
+        self.misses += 1
+        game_map = generate_map_grid(map_type, width, height, seed, available_resources)
+        self.put(game_map, available_resources)
+        return game_map
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses
+        }
+
+
+def copy_map(game_map: GeneratedMap) -> GeneratedMap:
+    """배열을 복사한 GeneratedMap (배치 단계의 자원 변경이 캐시에 섞이지 않도록)"""
+    return GeneratedMap(
+        map_type=game_map.map_type,
+        width=game_map.width,
+        height=game_map.height,
+        seed=game_map.seed,
+        terrain=game_map.terrain.copy(),
+        resource=game_map.resource.copy()
+    )
+
+
+# 전역 맵 캐시 인스턴스
+map_cache = MapCache(settings.MAP_CACHE_DIR or None, settings.MAP_CACHE_SIZE)
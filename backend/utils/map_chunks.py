@@ -0,0 +1,181 @@
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from models.hexmap import TileStore, SPARSE_TILE_FIELDS
+
+# 청크 ID: (cq, cr) = (q // chunk_size, r // chunk_size), API에서는 "cq:cr" 문자열
+ChunkId = Tuple[int, int]
+
+# 청크 버전 계산에 쓰는 Hexagon 행 필드
+HEXAGON_CHUNK_FIELDS = ("q", "r", "s", "terrain_id", "resource_id", "city_id", "unit_id")
+
+
+def format_chunk_id(chunk_id: ChunkId) -> str:
+    return f"{chunk_id[0]}:{chunk_id[1]}"
+
+
+def parse_chunk_ids(value: str) -> List[ChunkId]:
+    """'0:0,1:0' 형식의 청크 ID 목록 파싱 (잘못된 형식이면 ValueError)"""
+    chunk_ids = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        cq, cr = part.split(":")
+        chunk_ids.append((int(cq), int(cr)))
+    return list(dict.fromkeys(chunk_ids))
+
+
+def parse_chunk_versions(value: Optional[str]) -> Dict[ChunkId, int]:
+    """클라이언트가 가진 청크 버전 '0:0=123,1:0=456' 파싱"""
+    versions: Dict[ChunkId, int] = {}
+    if not value:
+        return versions
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        chunk, version = part.split("=")
+        cq, cr = chunk.split(":")
+        versions[(int(cq), int(cr))] = int(version)
+    return versions
+
+
+def chunk_ids_for_rect(q_min: int, q_max: int, r_min: int, r_max: int, chunk_size: int) -> List[ChunkId]:
+    """q/r 사각형(양 끝 포함)과 겹치는 청크 ID 목록"""
+    if q_min > q_max or r_min > r_max:
+        raise ValueError("사각형 범위가 올바르지 않습니다 (min <= max).")
+    return [
+        (cq, cr)
+        for cq in range(q_min // chunk_size, q_max // chunk_size + 1)
+        for cr in range(r_min // chunk_size, r_max // chunk_size + 1)
+    ]
+
+
+def resolve_chunk_request(
+    chunks: Optional[str],
+    q_min: Optional[int],
+    q_max: Optional[int],
+    r_min: Optional[int],
+    r_max: Optional[int],
+    chunk_size: int,
+    max_chunks: int
+) -> List[ChunkId]:
+    """청크 ID 목록 또는 q/r 사각형 요청을 청크 ID 목록으로 변환 (잘못된 요청이면 ValueError)"""
+    if chunks:
+        chunk_ids = parse_chunk_ids(chunks)
+    elif None not in (q_min, q_max, r_min, r_max):
+        chunk_ids = chunk_ids_for_rect(q_min, q_max, r_min, r_max, chunk_size)
+    else:
+        raise ValueError("chunks 또는 q_min/q_max/r_min/r_max 중 하나를 지정해야 합니다.")
+    if not chunk_ids:
+        raise ValueError("요청한 청크가 없습니다.")
+    if len(chunk_ids) > max_chunks:
+        raise ValueError(f"한 번에 요청할 수 있는 청크는 최대 {max_chunks}개입니다 (요청: {len(chunk_ids)}개).")
+    return chunk_ids
+
+
+def chunk_bounds(chunk_id: ChunkId, chunk_size: int) -> Dict[str, int]:
+    cq, cr = chunk_id
+    return {
+        "q_min": cq * chunk_size,
+        "q_max": (cq + 1) * chunk_size - 1,
+        "r_min": cr * chunk_size,
+        "r_max": (cr + 1) * chunk_size - 1
+    }
+
+
+def build_chunk(
+    chunk_id: ChunkId,
+    chunk_size: int,
+    version: int,
+    tile_count: int,
+    tiles: Optional[List[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """청크 응답 항목 - tiles가 None이면 클라이언트 버전과 같아 타일 없이 unchanged로 표시"""
+    chunk = {
+        "id": format_chunk_id(chunk_id),
+        "version": version,
+        "bounds": chunk_bounds(chunk_id, chunk_size),
+        "tile_count": tile_count,
+        "unchanged": tiles is None
+    }
+    if tiles is not None:
+        chunk["tiles"] = tiles
+    return chunk
+
+
+def store_chunks(
+    store: TileStore,
+    chunk_ids: Iterable[ChunkId],
+    chunk_size: int,
+    known_versions: Optional[Dict[ChunkId, int]] = None
+) -> List[Dict[str, Any]]:
+    """TileStore(스냅샷)에서 청크별 타일과 버전 추출
+
+    버전은 청크 타일 내용의 CRC32이므로 내용이 같으면 턴이 바뀌어도 같은 값이고,
+    클라이언트는 버전이 달라진 청크만 다시 받으면 됩니다.
+    """
+    known_versions = known_versions or {}
+    # 청크 키로 한 번 정렬해 두고 청크마다 이진 탐색으로 타일 범위 찾기
+    keys = _chunk_keys(store.q // chunk_size, store.r // chunk_size)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    visible, explored = store.visible, store.explored
+    sparse = [store.sparse_values(field) for field in SPARSE_TILE_FIELDS]
+
+    chunks = []
+    for chunk_id in chunk_ids:
+        key = _chunk_keys(np.array([chunk_id[0]]), np.array([chunk_id[1]]))[0]
+        lo, hi = np.searchsorted(sorted_keys, [key, key + 1])
+        indices = order[lo:hi]
+
+        checksum = 0
+        for array in (store.q, store.r, store.terrain, store.resource, visible, explored):
+            checksum = zlib.crc32(np.ascontiguousarray(array[indices]).tobytes(), checksum)
+        for values in sparse:
+            entries = [(index, values[index]) for index in indices.tolist() if index in values]
+            checksum = zlib.crc32(repr(entries).encode("utf-8"), checksum)
+
+        tiles = None if known_versions.get(chunk_id) == checksum else store.to_dicts(indices)
+        chunks.append(build_chunk(chunk_id, chunk_size, checksum, int(indices.size), tiles))
+    return chunks
+
+
+def hexagon_chunk_filter(chunk_ids: Iterable[ChunkId], chunk_size: int) -> List[Dict[str, Any]]:
+    """요청 청크 영역만 읽는 Hexagon 조회 조건 (OR로 묶어 한 번에 조회)"""
+    filters = []
+    for chunk_id in chunk_ids:
+        bounds = chunk_bounds(chunk_id, chunk_size)
+        filters.append({
+            "q": {"gte": bounds["q_min"], "lte": bounds["q_max"]},
+            "r": {"gte": bounds["r_min"], "lte": bounds["r_max"]}
+        })
+    return filters
+
+
+def hexagon_chunks(
+    rows: Iterable[Any],
+    chunk_ids: Iterable[ChunkId],
+    chunk_size: int,
+    known_versions: Optional[Dict[ChunkId, int]] = None
+) -> List[Dict[str, Any]]:
+    """세션 Hexagon 행들을 청크로 묶고 청크별 버전(행 내용의 CRC32) 계산"""
+    known_versions = known_versions or {}
+    grouped: Dict[ChunkId, List[Dict[str, Any]]] = {}
+    for row in rows:
+        tile = {field: getattr(row, field, None) for field in HEXAGON_CHUNK_FIELDS}
+        grouped.setdefault((tile["q"] // chunk_size, tile["r"] // chunk_size), []).append(tile)
+
+    chunks = []
+    for chunk_id in chunk_ids:
+        tiles = sorted(grouped.get(chunk_id, []), key=lambda tile: (tile["q"], tile["r"]))
+        checksum = zlib.crc32(repr([tuple(tile.values()) for tile in tiles]).encode("utf-8"))
+        unchanged = known_versions.get(chunk_id) == checksum
+        chunks.append(build_chunk(chunk_id, chunk_size, checksum, len(tiles), None if unchanged else tiles))
+    return chunks
+
+
+def _chunk_keys(cq: np.ndarray, cr: np.ndarray) -> np.ndarray:
+    # 음수 청크가 없다는 가정 없이 정렬 가능한 64비트 키로 결합
+    return (cq.astype(np.int64) << 32) + (cr.astype(np.int64) + (1 << 31))
@@ -0,0 +1,273 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from models.map import MapType
+
+# Terrain 테이블(ensure_basic_game_data)과 동일한 지형 ID - 배열에는 이 튜플의 인덱스가 저장됨
+TERRAIN_IDS: Tuple[str, ...] = (
+    "plains", "grassland", "desert", "hills", "mountain", "forest",
+    "tundra", "ocean", "coast", "lake", "jungle"
+)
+TERRAIN_INDEX: Dict[str, int] = {terrain_id: i for i, terrain_id in enumerate(TERRAIN_IDS)}
+
+# 수확량 종류 (수확량 배열의 마지막 축 순서)
+YIELD_TYPES: Tuple[str, ...] = ("food", "production", "gold")
+
+# Terrain 테이블 기본 수확량 (ensure_basic_game_data의 yield_json과 동일) - DB 값을 받지 못한 경우에 사용
+DEFAULT_TERRAIN_YIELDS: Dict[str, Dict[str, int]] = {
+    "plains": {"food": 1, "production": 1},
+    "grassland": {"food": 2, "production": 0},
+    "desert": {"food": 0, "production": 0},
+    "hills": {"food": 0, "production": 2},
+    "mountain": {"food": 0, "production": 0},
+    "forest": {"food": 1, "production": 1},
+    "tundra": {"food": 1, "production": 0},
+    "ocean": {"food": 1, "production": 0},
+    "coast": {"food": 1, "production": 0},
+    "lake": {"food": 2, "production": 0},
+    "jungle": {"food": 2, "production": 0}
+}
+
+
+def terrain_yield_table(terrain_yields: Optional[Dict[str, Dict[str, int]]] = None) -> np.ndarray:
+    """지형 인덱스별 수확량 표 (len(TERRAIN_IDS), len(YIELD_TYPES)) - terrain_yields가 없으면 기본값"""
+    terrain_yields = terrain_yields or DEFAULT_TERRAIN_YIELDS
+    table = np.zeros((len(TERRAIN_IDS), len(YIELD_TYPES)), dtype=np.int32)
+    for terrain_id, yields in terrain_yields.items():
+        if terrain_id in TERRAIN_INDEX:
+            table[TERRAIN_INDEX[terrain_id]] = [int((yields or {}).get(y, 0)) for y in YIELD_TYPES]
+    return table
+
+
+# Resource 테이블 기본 자원 종류 (ensure_basic_game_data의 type과 동일) - DB 값을 받지 못한 경우에 사용
+DEFAULT_RESOURCE_TYPES: Dict[str, str] = {
+    "wheat": "food", "cattle": "food", "sheep": "food", "rice": "food", "deer": "food", "fish": "food",
+    "iron": "production", "stone": "production", "copper": "production",
+    "gold": "gold", "silver": "gold", "gems": "gold",
+    "horses": "strategic", "coal": "strategic", "oil": "strategic"
+}
+
+# 지형별 자원 매핑 (지형 특성에 맞는 자원 타입)
+TERRAIN_RESOURCE_MAPPING: Dict[str, List[str]] = {
+    "grassland": ["wheat", "cattle", "sheep"],
+    "plains": ["wheat", "horses", "cattle"],
+    "forest": ["deer", "dyes", "ivory"],
+    "hills": ["iron", "horses", "gold"],
+    "tundra": ["deer"],
+    "desert": ["salt"],
+    "jungle": ["spices", "dyes", "incense"],
+    "coast": ["fish", "whale"],
+    "mountain": ["silver", "gems"]
+}
+
+# 맵 생성 이후 배치 단계(보장 자원, 전체 자원 분포)에서만 쓰이는 자원
+PLACEMENT_ONLY_RESOURCE_IDS = ("rice", "stone", "copper", "coal", "oil")
+
+# 자원 ID 목록 (배열에는 이 튜플의 인덱스가 저장되며 -1은 자원 없음)
+RESOURCE_IDS: Tuple[str, ...] = tuple(sorted({
+    resource_id
+    for resources in TERRAIN_RESOURCE_MAPPING.values()
+    for resource_id in resources
+} | set(PLACEMENT_ONLY_RESOURCE_IDS)))
+RESOURCE_INDEX: Dict[str, int] = {resource_id: i for i, resource_id in enumerate(RESOURCE_IDS)}
+NO_RESOURCE = -1
+
+# 자원이 배치되지 않을 확률
+RESOURCE_EMPTY_PROBABILITY = 0.7
+
+# 맵 타입별 지형 분포 및 특징
+MAP_TYPE_TERRAIN_DISTRIBUTION = {
+    MapType.CONTINENTS: {
+        "primary_terrains": ["grassland", "plains", "forest"],
+        "secondary_terrains": ["hills", "tundra", "coast"],
+        "water_terrains": ["ocean"],
+        "continent_count": 2,
+        "continent_size_variance": 0.3
+    },
+    MapType.PANGAEA: {
+        "primary_terrains": ["plains", "grassland", "jungle"],
+        "secondary_terrains": ["hills", "forest", "tundra"],
+        "water_terrains": ["ocean", "coast"],
+        "continent_count": 1,
+        "continent_size_variance": 0.1
+    },
+    MapType.ARCHIPELAGO: {
+        "primary_terrains": ["coast"],
+        "secondary_terrains": ["plains", "hills"],
+        "water_terrains": ["ocean"],
+        "continent_count": 10,
+        "continent_size_variance": 0.8
+    },
+    MapType.SMALL_CONTINENTS: {
+        "primary_terrains": ["grassland", "plains"],
+        "secondary_terrains": ["forest", "hills", "coast"],
+        "water_terrains": ["ocean"],
+        "continent_count": 4,
+        "continent_size_variance": 0.5
+    }
+}
+
+# 대륙 중심으로부터의 정규화 거리 경계 (primary < 0.3 <= secondary < 0.6 <= water)
+CATEGORY_THRESHOLDS = (0.3, 0.6)
+
+
+@dataclass
+class GeneratedMap:
+    """생성된 맵 그리드 (배열 인덱스 [q, r], s = -q - r)"""
+    map_type: str
+    width: int
+    height: int
+    seed: int
+    terrain: np.ndarray   # (width, height) int8 - TERRAIN_IDS 인덱스
+    resource: np.ndarray  # (width, height) int16 - RESOURCE_IDS 인덱스, 없으면 -1
+
+    @property
+    def tile_count(self) -> int:
+        return self.width * self.height
+
+    def terrain_id(self, q: int, r: int) -> str:
+        return TERRAIN_IDS[self.terrain[q, r]]
+
+    def resource_id(self, q: int, r: int) -> Optional[str]:
+        index = self.resource[q, r]
+        return RESOURCE_IDS[index] if index != NO_RESOURCE else None
+
+    def set_resource(self, q: int, r: int, resource_id: Optional[str]):
+        self.resource[q, r] = RESOURCE_INDEX[resource_id] if resource_id else NO_RESOURCE
+
+    def contains(self, coord: Tuple[int, ...]) -> bool:
+        return 0 <= coord[0] < self.width and 0 <= coord[1] < self.height
+
+    def terrain_mask(self, terrain_ids: Iterable[str]) -> np.ndarray:
+        """지정한 지형인 타일의 (width, height) 불리언 마스크"""
+        return np.isin(self.terrain, [TERRAIN_INDEX[t] for t in terrain_ids if t in TERRAIN_INDEX])
+
+    @staticmethod
+    def coords(mask: np.ndarray) -> List[Tuple[int, int, int]]:
+        """마스크가 참인 타일의 큐브 좌표 목록 (q, r 오름차순)"""
+        return [(q, r, -q - r) for q, r in np.argwhere(mask).tolist()]
+
+    def iter_tiles(self) -> Iterator[Tuple[int, int, int, str, Optional[str]]]:
+        """(q, r, s, terrain_id, resource_id) 순회 - 기존 이중 루프와 같은 q, r 순서"""
+        terrain_ids = [TERRAIN_IDS[i] for i in self.terrain.ravel().tolist()]
+        resource_ids = [
+            RESOURCE_IDS[i] if i != NO_RESOURCE else None
+            for i in self.resource.ravel().tolist()
+        ]
+        index = 0
+        for q in range(self.width):
+            for r in range(self.height):
+                yield q, r, -q - r, terrain_ids[index], resource_ids[index]
+                index += 1
+
+
+def get_terrain_distribution(map_type: MapType) -> Dict:
+    """맵 타입별 지형 분포 반환 (정의되지 않은 타입은 대륙형)"""
+    return MAP_TYPE_TERRAIN_DISTRIBUTION.get(
+        map_type,
+        MAP_TYPE_TERRAIN_DISTRIBUTION[MapType.CONTINENTS]
+    )
+
+
+def _candidate_table(candidates: List[List[int]]) -> Tuple[np.ndarray, np.ndarray]:
+    """가변 길이 후보 목록을 (행 수, 최대 길이) 조회 테이블과 길이 배열로 변환"""
+    max_len = max(1, max(len(c) for c in candidates))
+    table = np.full((len(candidates), max_len), NO_RESOURCE, dtype=np.int16)
+    lengths = np.zeros(len(candidates), dtype=np.int16)
+    for i, c in enumerate(candidates):
+        table[i, :len(c)] = c
+        lengths[i] = len(c)
+    return table, lengths
+
+
+def continent_distance_field(
+    width: int,
+    height: int,
+    continent_seeds: np.ndarray
+) -> np.ndarray:
+    """각 타일에서 가장 가까운 대륙 중심까지의 거리 (width, height)"""
+    q = np.arange(width, dtype=np.float32)[:, None, None]
+    r = np.arange(height, dtype=np.float32)[None, :, None]
+    dq = q - continent_seeds[:, 0].astype(np.float32)
+    dr = r - continent_seeds[:, 1].astype(np.float32)
+    return np.sqrt(dq * dq + dr * dr).min(axis=2)
+
+
+def roll_resources(
+    terrain: np.ndarray,
+    rng: np.random.Generator,
+    available_resources: Optional[Iterable[str]] = None
+) -> np.ndarray:
+    """지형 배열에 맞는 자원을 타일마다 굴림 (일정 확률로 없음, 나머지는 후보 자원에 균등 분배)"""
+    # 지형별 자원 후보 (DB에 존재하는 자원만)
+    allowed = set(RESOURCE_IDS) if available_resources is None else {
+        resource_id.lower() for resource_id in available_resources
+    }
+    resource_table, resource_lengths = _candidate_table([
+        [RESOURCE_INDEX[res] for res in TERRAIN_RESOURCE_MAPPING.get(terrain_id, []) if res in allowed]
+        for terrain_id in TERRAIN_IDS
+    ])
+
+    tile_lengths = resource_lengths[terrain]
+    has_resource = (rng.random(terrain.shape) >= RESOURCE_EMPTY_PROBABILITY) & (tile_lengths > 0)
+    resource_pick = (rng.random(terrain.shape) * tile_lengths).astype(np.intp)
+    return np.where(
+        has_resource,
+        resource_table[terrain, resource_pick],
+        NO_RESOURCE
+    ).astype(np.int16)
+
+
+def generate_terrain_grid(
+    map_type: MapType,
+    width: int,
+    height: int,
+    seed: int,
+    available_resources: Optional[Iterable[str]] = None
+) -> GeneratedMap:
+    """세션 시드로부터 지형/자원 그리드를 배열 연산으로 생성
+
+    같은 seed와 인자에 대해서는 항상 같은 결과를 반환합니다.
+    available_resources가 주어지면 해당 자원만 배치합니다 (DB Resource 테이블 기준).
+    """
+    rng = np.random.default_rng(seed)
+    distribution = get_terrain_distribution(map_type)
+
+    # 대륙 중심점들 생성 (맵 중앙 1/2 영역)
+    continent_count = distribution["continent_count"]
+    continent_seeds = np.stack([
+        rng.integers(width // 4, width * 3 // 4, size=continent_count, endpoint=True),
+        rng.integers(height // 4, height * 3 // 4, size=continent_count, endpoint=True)
+    ], axis=1)
+
+    # 대륙 크기와 변동성 고려한 정규화 거리
+    distance = continent_distance_field(width, height, continent_seeds)
+    max_continent_radius = min(width, height) * (0.5 + distribution["continent_size_variance"])
+    normalized_distance = distance / max_continent_radius
+
+    # 지형 카테고리 결정 (0: primary, 1: secondary, 2: water)
+    category = np.searchsorted(
+        np.asarray(CATEGORY_THRESHOLDS, dtype=np.float32),
+        normalized_distance,
+        side="right"
+    )
+
+    # 카테고리별 지형 후보에서 균등 선택
+    category_table, category_lengths = _candidate_table([
+        [TERRAIN_INDEX[t] for t in distribution["primary_terrains"]],
+        [TERRAIN_INDEX[t] for t in distribution["secondary_terrains"]],
+        [TERRAIN_INDEX[t] for t in distribution["water_terrains"]]
+    ])
+    pick = (rng.random((width, height)) * category_lengths[category]).astype(np.intp)
+    terrain = category_table[category, pick].astype(np.int8)
+
+    resource = roll_resources(terrain, rng, available_resources)
+
+    return GeneratedMap(
+        map_type=getattr(map_type, "value", map_type),
+        width=width,
+        height=height,
+        seed=seed,
+        terrain=terrain,
+        resource=resource
+    )
@@ -0,0 +1,103 @@
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+from prisma.models import Hexagon
+from core.config import prisma_client, settings
+from utils.map_generator import GeneratedMap
+
+logger = logging.getLogger(__name__)
+
+# 헥스 좌표 저장을 위한 튜플 타입
+HexCoord = Tuple[int, int, int]
+
+
+class HexagonWriteBatch:
+    """게임 생성 중 맵 타일을 메모리에 모아두었다가 한 번에 기록하는 배치
+
+    지형/자원은 GeneratedMap 배열에, 그 외 변경 사항(도시/유닛 배치 등)은
+    좌표별 덮어쓰기로 보관하고 flush() 시점에 하나의 create_many 쓰기로 합쳐집니다.
+    """
+
+    def __init__(self, session_id: str, game_map: GeneratedMap):
+        self.session_id = session_id
+        self.game_map = game_map
+        self._overrides: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    @property
+    def width(self) -> int:
+        return self.game_map.width
+
+    @property
+    def height(self) -> int:
+        return self.game_map.height
+
+    def contains(self, coord: HexCoord) -> bool:
+        return self.game_map.contains(coord)
+
+    def row(self, coord: HexCoord) -> Dict[str, Any]:
+        """좌표의 현재 타일 데이터 (Hexagon 테이블 행 형태)"""
+        q, r = coord[0], coord[1]
+        row = {
+            "session_id": self.session_id,
+            "q": q,
+            "r": r,
+            "s": -q - r,
+            "terrain_id": self.game_map.terrain_id(q, r),
+            "resource_id": self.game_map.resource_id(q, r)
+        }
+        row.update(self._overrides.get((q, r), {}))
+        return row
+
+    def get(self, coord: HexCoord) -> Optional[Hexagon]:
+        """좌표의 타일을 Hexagon 모델로 반환 (맵 밖이면 None)"""
+        if not self.contains(coord):
+            return None
+        return Hexagon(**self.row(coord))
+
+    def update(self, coord: HexCoord, data: Dict[str, Any]):
+        """타일 변경 사항 기록 (flush 전까지 DB에 쓰지 않음)"""
+        q, r = coord[0], coord[1]
+        data = dict(data)
+        if "resource_id" in data:
+            self.game_map.set_resource(q, r, data.pop("resource_id"))
+        if data:
+            self._overrides.setdefault((q, r), {}).update(data)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """create_many에 전달할 전체 타일 행 목록"""
+        rows = []
+        for q, r, s, terrain_id, resource_id in self.game_map.iter_tiles():
+            row = {
+                "session_id": self.session_id,
+                "q": q,
+                "r": r,
+                "s": s,
+                "terrain_id": terrain_id,
+                "resource_id": resource_id
+            }
+            overrides = self._overrides.get((q, r))
+            if overrides:
+                row.update(overrides)
+            rows.append(row)
+        return rows
+
+    async def flush(self, batch_size: Optional[int] = None) -> int:
+        """모든 타일을 한 트랜잭션 안에서 일괄 저장"""
+        return await bulk_create_hexagons(self.rows(), batch_size)
+
+
+async def bulk_create_hexagons(rows: List[Dict[str, Any]], batch_size: Optional[int] = None) -> int:
+    """헥사곤 행들을 batch_size 단위 create_many로 나누어 하나의 트랜잭션에서 저장"""
+    batch_size = batch_size or settings.HEXAGON_BATCH_SIZE
+    created = 0
+
+    async with prisma_client.tx(
+        timeout=timedelta(seconds=settings.HEXAGON_WRITE_TIMEOUT_SECONDS)
+    ) as transaction:
+        for start in range(0, len(rows), batch_size):
+            created += await transaction.hexagon.create_many(
+                data=rows[start:start + batch_size]
+            )
+
+    logger.info(f"헥사곤 일괄 저장 완료: {created}개 (batch_size={batch_size})")
+    return created
@@ -0,0 +1,322 @@
+import asyncio
+import logging
+import random
+import secrets
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from cachetools import LRUCache
+from core.config import settings
+from models.map import MapType
+from utils.map_generator import GeneratedMap
+from utils.map_cache import map_cache, copy_map
+from utils.cpu_pool import cpu_pool
+from utils.map_utils import assign_guaranteed_resources, distribute_map_resources
+from utils.start_positions import place_capitals
+from utils.start_balance import StartBalanceReport, balance_starts
+from utils.landmass import Landmasses, label_landmasses
+
+logger = logging.getLogger(__name__)
+
+# 헥스 좌표 저장을 위한 튜플 타입
+HexCoord = Tuple[int, int, int]
+
+# 미리 생성해 둘 맵 타입
+POOLED_MAP_TYPES = [
+    MapType.CONTINENTS,
+    MapType.PANGAEA,
+    MapType.ARCHIPELAGO,
+    MapType.SMALL_CONTINENTS
+]
+
+# 풀 키: (map_type, civ_count)
+PoolKey = Tuple[str, int]
+
+# 최근 배치 맵 키: (seed, map_type, width, height, civ_count)
+RecentKey = Tuple[int, str, int, int, int]
+
+
+@dataclass
+class PreparedMap:
+    """시작 위치와 자원 배치까지 끝난 맵 (DB 저장 전 상태)"""
+    game_map: GeneratedMap
+    capital_coords: List[HexCoord]  # 0번은 플레이어 수도
+    civ_count: int
+    balance: Optional[StartBalanceReport] = None  # 수도별 시작 수확량 지표
+    landmasses: Optional[Landmasses] = None       # 대륙/수역 라벨
+
+    @property
+    def seed(self) -> int:
+        return self.game_map.seed
+
+    def copy(self) -> "PreparedMap":
+        """맵 배열을 복사한 PreparedMap (게임 생성 중 자원 변경이 보관본에 섞이지 않도록 - 균형 지표/대륙 라벨은 읽기 전용으로 공유)"""
+        return PreparedMap(
+            game_map=copy_map(self.game_map),
+            capital_coords=list(self.capital_coords),
+            civ_count=self.civ_count,
+            balance=self.balance,
+            landmasses=self.landmasses
+        )
+
+
+def prepare_map(
+    game_map: GeneratedMap,
+    civ_count: int,
+    terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+    resource_types: Optional[Dict[str, str]] = None
+) -> PreparedMap:
+    """생성된 맵에 대륙 라벨링, 수도 위치, 보장 자원, 전체 자원 분포, 시작 위치 균형 조정을 적용 (DB 접근 없음)
+
+    맵 시드로 random을 초기화하므로 같은 맵과 문명 수에 대해 항상 같은 결과가 나옵니다.
+    terrain_yields/resource_types는 Terrain.yield_json/Resource.type 값이며, 없으면 기본 데이터 값을 씁니다.
+    """
+    random.seed(game_map.seed)
+
+    # 대륙/수역 라벨은 지형만으로 정해지므로 한 번 계산해 수도 배치와 세션 헥스 그리드에서 함께 사용
+    landmasses = label_landmasses(game_map)
+    capital_coords = place_capitals(
+        game_map,
+        civ_count,
+        terrain_yields,
+        landmasses,
+        settings.START_PLACEMENT_TIME_BUDGET_MS / 1000
+    )
+
+    # 각 수도 반경 2칸 내에 보장 자원 배치 후 전체 맵에 자원 분포
+    assign_guaranteed_resources(game_map, capital_coords)
+    distribute_map_resources(game_map)
+
+    # 수도별 도시 반경 수확량 편차가 목표 이하가 되도록 자원 조정
+    balance = balance_starts(
+        game_map,
+        capital_coords,
+        settings.START_BALANCE_GINI_THRESHOLD,
+        settings.START_BALANCE_TIME_BUDGET_MS / 1000,
+        terrain_yields,
+        resource_types
+    )
+
+    return PreparedMap(
+        game_map=game_map,
+        capital_coords=capital_coords,
+        civ_count=civ_count,
+        balance=balance,
+        landmasses=landmasses
+    )
+
+
+def build_prepared_map(
+    map_type: MapType,
+    width: int,
+    height: int,
+    seed: int,
+    civ_count: int,
+    available_resources: Optional[Iterable[str]] = None,
+    terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+    resource_types: Optional[Dict[str, str]] = None
+) -> PreparedMap:
+    """맵 생성부터 배치까지 한 번에 수행 (CPU 프로세스 풀 작업 단위)
+
+    같은 시드의 지형은 워커 프로세스의 맵 캐시(디스크 캐시는 프로세스 간 공유)에서 재사용합니다.
+    """
+    game_map = map_cache.get_or_generate(map_type, width, height, seed, available_resources)
+    return prepare_map(game_map, civ_count, terrain_yields, resource_types)
+
+
+class MapPool:
+    """맵 타입/문명 수별로 미리 만들어 둔 맵 풀
+
+    /game/start는 새 설정일 때 풀에서 맵을 꺼내 플레이어별 배치만 수행하고,
+    꺼낸 자리는 CPU 프로세스 풀(cpu_pool)에서 비동기로 다시 채웁니다.
+    채우기 작업은 별도 세마포어로 동시 실행 수를 cpu_pool 대기열 한도보다 작게 묶어 요청 작업이 거부되지 않게 하고,
+    실패한 키는 지수 백오프로 다시 시도합니다.
+    이미 MapSeed가 기록된 설정은 풀 대신 최근 배치한 맵 LRU(remember/recall)에서 같은 시드의 맵을 재사용합니다.
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        width: int,
+        height: int,
+        civ_counts: Iterable[int] = range(5, 11),
+        refill_concurrency: int = 1,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+        recent_size: int = 64
+    ):
+        self.pool_size = pool_size
+        self.width = width
+        self.height = height
+        self.civ_counts = list(civ_counts)
+        self.refill_concurrency = refill_concurrency
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.available_resources: Optional[List[str]] = None
+        self.terrain_yields: Optional[Dict[str, Dict[str, int]]] = None
+        self.resource_types: Optional[Dict[str, str]] = None
+        self._maps: Dict[PoolKey, List[PreparedMap]] = {}
+        self._pending: Dict[PoolKey, int] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._refill_slots: Optional[asyncio.Semaphore] = None
+        self._recent: LRUCache = LRUCache(maxsize=max(1, recent_size))
+        self._running = False
+        self.hits = 0
+        self.misses = 0
+        self.refilled = 0
+        self.failed = 0
+        self.retries = 0
+        self.recent_hits = 0
+        self.recent_misses = 0
+
+    @staticmethod
+    def make_key(map_type, civ_count: int) -> PoolKey:
+        return (getattr(map_type, "value", map_type), int(civ_count))
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(
+        self,
+        available_resources: Optional[Iterable[str]] = None,
+        terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+        resource_types: Optional[Dict[str, str]] = None
+    ):
+        """모든 키에 대해 채우기 시작 (cpu_pool이 먼저 시작되어 있어야 함)"""
+        if self.running or self.pool_size <= 0:
+            return
+        if not cpu_pool.running:
+            # 이벤트 루프에서 직접 맵을 만들지 않도록 CPU 풀 없이는 채우지 않음
+            logger.warning("CPU 프로세스 풀이 비활성화되어 맵 풀을 채우지 않습니다.")
+            return
+        self.available_resources = list(available_resources) if available_resources is not None else None
+        self.terrain_yields = terrain_yields
+        self.resource_types = resource_types
+        # 채우기 작업이 cpu_pool 대기열을 모두 차지하지 않도록 대기열 한도보다 작게 제한
+        self._refill_slots = asyncio.Semaphore(max(1, min(self.refill_concurrency, cpu_pool.max_queue - 1)))
+        self._running = True
+        for map_type in POOLED_MAP_TYPES:
+            for civ_count in self.civ_counts:
+                self._schedule_refill(self.make_key(map_type, civ_count))
+
+    async def stop(self):
+        """진행 중인 채우기 작업 취소"""
+        self._running = False
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def claim(self, map_type, civ_count: int) -> Optional[PreparedMap]:
+        """풀에서 맵 하나를 꺼냄 (없으면 None) - 꺼낸 자리는 백그라운드에서 다시 채움"""
+        key = self.make_key(map_type, civ_count)
+        maps = self._maps.get(key)
+        prepared = maps.pop() if maps else None
+        if prepared is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if self.running and self._is_pooled(key):
+            self._schedule_refill(key)
+        return prepared
+
+    @staticmethod
+    def make_recent_key(seed: int, map_type, width: int, height: int, civ_count: int) -> RecentKey:
+        return (int(seed), getattr(map_type, "value", map_type), int(width), int(height), int(civ_count))
+
+    def remember(self, prepared: PreparedMap):
+        """배치 완료 맵의 복사본을 최근 맵 LRU에 보관 (같은 시드 설정의 다음 게임에서 재사용)"""
+        game_map = prepared.game_map
+        key = self.make_recent_key(prepared.seed, game_map.map_type, game_map.width, game_map.height, prepared.civ_count)
+        self._recent[key] = prepared.copy()
+
+    def recall(self, seed: int, map_type, width: int, height: int, civ_count: int) -> Optional[PreparedMap]:
+        """최근 맵 LRU에서 같은 시드/맵 타입/크기/문명 수의 맵 복사본 반환 (없으면 None)"""
+        prepared = self._recent.get(self.make_recent_key(seed, map_type, width, height, civ_count))
+        if prepared is None:
+            self.recent_misses += 1
+            return None
+        self.recent_hits += 1
+        return prepared.copy()
+
+    def clear_recent(self):
+        self._recent.clear()
+
+    def _is_pooled(self, key: PoolKey) -> bool:
+        map_type, civ_count = key
+        return map_type in {t.value for t in POOLED_MAP_TYPES} and civ_count in self.civ_counts
+
+    def _schedule_refill(self, key: PoolKey):
+        missing = self.pool_size - len(self._maps.get(key, [])) - self._pending.get(key, 0)
+        for _ in range(max(0, missing)):
+            self._pending[key] = self._pending.get(key, 0) + 1
+            task = asyncio.create_task(self._refill_one(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _refill_one(self, key: PoolKey):
+        """키 하나에 맵 하나를 채움 - 실패하면 성공하거나 풀이 멈출 때까지 대기 시간을 늘려가며 재시도"""
+        map_type, civ_count = key
+        attempt = 0
+        try:
+            while self.running:
+                try:
+                    async with self._refill_slots:
+                        prepared = await cpu_pool.run(
+                            build_prepared_map,
+                            MapType(map_type),
+                            self.width,
+                            self.height,
+                            secrets.randbits(63),
+                            civ_count,
+                            self.available_resources,
+                            self.terrain_yields,
+                            self.resource_types,
+                            label="map_pool_refill"
+                        )
+                    self._maps.setdefault(key, []).append(prepared)
+                    self.refilled += 1
+                    return
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.failed += 1
+                    delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** attempt)
+                    attempt += 1
+                    logger.warning(f"맵 풀 채우기 실패 {key}: {str(e)} - {delay:.1f}초 후 재시도")
+                await asyncio.sleep(delay)
+                self.retries += 1
+        finally:
+            self._pending[key] -= 1
+
+    def stats(self) -> Dict:
+        """풀 크기와 적중률 지표"""
+        claims = self.hits + self.misses
+        return {
+            "running": self.running,
+            "target_size": self.pool_size,
+            "ready": sum(len(maps) for maps in self._maps.values()),
+            "pending": sum(self._pending.values()),
+            "sizes": {f"{map_type}:{civ_count}": len(maps) for (map_type, civ_count), maps in self._maps.items()},
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / claims if claims else 0.0,
+            "refilled": self.refilled,
+            "failed": self.failed,
+            "retries": self.retries,
+            "recent": len(self._recent),
+            "recent_hits": self.recent_hits,
+            "recent_misses": self.recent_misses
+        }
+
+
+# 전역 맵 풀 인스턴스
+map_pool = MapPool(
+    pool_size=settings.MAP_POOL_SIZE,
+    width=settings.DEFAULT_MAP_WIDTH,
+    height=settings.DEFAULT_MAP_HEIGHT,
+    refill_concurrency=settings.MAP_POOL_REFILL_CONCURRENCY,
+    backoff_seconds=settings.MAP_POOL_REFILL_BACKOFF_SECONDS,
+    max_backoff_seconds=settings.MAP_POOL_REFILL_MAX_BACKOFF_SECONDS,
+    recent_size=settings.MAP_POOL_RECENT_SIZE
+)
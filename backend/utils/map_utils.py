@@ -1,50 +1,137 @@
 import random
 import math
-from typing import List, Tuple, Dict, Set, Optional, Any
+from functools import lru_cache
+from typing import List, Tuple, Dict, Set, Optional, Any, TYPE_CHECKING
+import numpy as np
 from models.hexmap import HexTile, TerrainType, ResourceType, HexCoord
 from prisma.models import Hexagon
 from core.config import prisma_client
 from models.game import GameSpeed
+from utils.map_generator import NO_RESOURCE, RESOURCE_IDS, RESOURCE_INDEX, TERRAIN_IDS
+
+if TYPE_CHECKING:
+    from utils.hex_grid import HexGrid
+    from utils.map_generator import GeneratedMap
 
 def cube_distance(a: HexCoord, b: HexCoord) -> int:
     """큐브 좌표 간의 거리 계산"""
     return max(abs(a[0] - b[0]), abs(a[1] - b[1]), abs(a[2] - b[2]))
 
+# 인접 6방향 (q, r, s)
+NEIGHBOR_DIRECTIONS = np.array([
+    (1, 0, -1), (1, -1, 0), (0, -1, 1),
+    (-1, 0, 1), (-1, 1, 0), (0, 1, -1)
+], dtype=np.int32)
+NEIGHBOR_DIRECTIONS.setflags(write=False)
+_NEIGHBOR_TUPLES = tuple(tuple(d) for d in NEIGHBOR_DIRECTIONS.tolist())
+
+# 링을 도는 6방향 (시계 방향: 동, 남동, 남서, 서, 북서, 북동) - 링은 북서 방향 radius칸에서 시작
+RING_DIRECTIONS = np.array([
+    (1, 0, -1), (0, 1, -1), (-1, 1, 0),
+    (-1, 0, 1), (0, -1, 1), (1, -1, 0)
+], dtype=np.int32)
+RING_DIRECTIONS.setflags(write=False)
+
+
+@lru_cache(maxsize=None)
+def ring_offsets(radius: int) -> np.ndarray:
+    """반경 radius 링의 (q, r, s) 오프셋 배열 (k, 3) - get_ring과 같은 순서, 읽기 전용 캐시"""
+    offsets = []
+    hex_offset = RING_DIRECTIONS[4] * radius
+    for direction in RING_DIRECTIONS:
+        for _ in range(radius):
+            offsets.append(hex_offset)
+            hex_offset = hex_offset + direction
+    table = np.array(offsets, dtype=np.int32).reshape(-1, 3)
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def spiral_offsets(radius: int) -> np.ndarray:
+    """중심부터 radius 링까지 나선 순서의 오프셋 배열 - get_spiral과 같은 순서"""
+    table = np.concatenate([np.zeros((1, 3), dtype=np.int32)] + [ring_offsets(r) for r in range(1, radius + 1)])
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=None)
+def radius_offsets(radius: int) -> np.ndarray:
+    """반경 radius 이내 오프셋 배열 - get_tiles_in_radius와 같은 (dq, dr) 오름차순"""
+    offsets = [
+        (dq, dr, -dq - dr)
+        for dq in range(-radius, radius + 1)
+        for dr in range(max(-radius, -dq - radius), min(radius, -dq + radius) + 1)
+    ]
+    table = np.array(offsets, dtype=np.int32).reshape(-1, 3)
+    table.setflags(write=False)
+    return table
+
+
+HEX_OFFSET_TABLES = {
+    "ring": ring_offsets,
+    "spiral": spiral_offsets,
+    "radius": radius_offsets
+}
+
+
+@lru_cache(maxsize=None)
+def _offset_tuples(kind: str, radius: int) -> Tuple[Tuple[int, int, int], ...]:
+    return tuple(tuple(row) for row in HEX_OFFSET_TABLES[kind](radius).tolist())
+
+
+def _apply_offsets(center: HexCoord, kind: str, radius: int) -> List[HexCoord]:
+    q, r, s = center[0], center[1], center[2]
+    return [(q + dq, r + dr, s + ds) for dq, dr, ds in _offset_tuples(kind, radius)]
+
+
 def get_ring(center: HexCoord, radius: int) -> List[HexCoord]:
     """중심 헥스 좌표에서 특정 반경에 있는 모든 헥스 좌표 반환"""
-    results = []
-    
-    # 링의 6개 방향 (시계 방향)
-    directions = [
-        (1, 0, -1),  # 동
-        (0, 1, -1),  # 남동
-        (-1, 1, 0),  # 남서
-        (-1, 0, 1),  # 서
-        (0, -1, 1),  # 북서
-        (1, -1, 0)   # 북동
-    ]
-    
-    # 특정 방향으로 radius만큼 이동한 시작점
-    hex_coord = HexCoord(q=center[0] + directions[4][0] * radius,
-                        r=center[1] + directions[4][1] * radius,
-                        s=center[2] + directions[4][2] * radius)
-    
-    # 각 방향으로 radius만큼 이동하며 헥스 추가
-    for direction in directions:
-        for i in range(radius):
-            results.append(hex_coord)
-            hex_coord = HexCoord(q=hex_coord[0] + direction[0],
-                                r=hex_coord[1] + direction[1],
-                                s=hex_coord[2] + direction[2])
-    
-    return results
+    return _apply_offsets(center, "ring", radius)
 
 def get_spiral(center: HexCoord, radius: int) -> List[HexCoord]:
     """중심으로부터 나선형으로 헥스 좌표 반환 (중심부터 radius까지)"""
-    results = [center]
-    for r in range(1, radius + 1):
-        results.extend(get_ring(center, r))
-    return results
+    return _apply_offsets(center, "spiral", radius)
+
+def offset_coords(centers: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """여러 중심 (n, 2 또는 3) 각각에 오프셋 (k, 3)을 더한 큐브 좌표 배열 (n, k, 3)"""
+    centers = np.asarray(centers, dtype=np.int32).reshape(len(centers), -1)
+    q = centers[:, 0:1] + offsets[None, :, 0]
+    r = centers[:, 1:2] + offsets[None, :, 1]
+    return np.stack([q, r, -q - r], axis=-1)
+
+def batch_ring(centers: np.ndarray, radius: int) -> np.ndarray:
+    """여러 중심의 반경 radius 링 좌표 (n, 6 * radius, 3)"""
+    return offset_coords(centers, ring_offsets(radius))
+
+def batch_spiral(centers: np.ndarray, radius: int) -> np.ndarray:
+    """여러 중심의 나선 좌표 (n, 1 + 3 * radius * (radius + 1), 3)"""
+    return offset_coords(centers, spiral_offsets(radius))
+
+def batch_tiles_in_radius(centers: np.ndarray, radius: int) -> np.ndarray:
+    """여러 중심의 반경 radius 이내 좌표 (n, 1 + 3 * radius * (radius + 1), 3)"""
+    return offset_coords(centers, radius_offsets(radius))
+
+def hex_radius_mask(
+    width: int,
+    height: int,
+    centers: np.ndarray,
+    radius: int,
+    include_center: bool = True
+) -> np.ndarray:
+    """(width, height) 그리드에서 어느 중심으로부터든 반경 radius 이내인 타일 마스크 (배열 인덱스 [q, r])
+
+    include_center가 False면 각 중심에서 거리 1 ~ radius인 타일만 포함합니다.
+    """
+    mask = np.zeros((width, height), dtype=bool)
+    if len(centers) == 0:
+        return mask
+    offsets = radius_offsets(radius) if include_center else spiral_offsets(radius)[1:]
+    coords = offset_coords(centers, offsets).reshape(-1, 3)
+    q, r = coords[:, 0], coords[:, 1]
+    inside = (q >= 0) & (q < width) & (r >= 0) & (r < height)
+    mask[q[inside], r[inside]] = True
+    return mask
 
 def get_terrain_distribution(map_type: str) -> Dict[str, float]:
     """맵 타입에 따른 지형 분포 확률 반환"""
@@ -115,8 +202,8 @@ def get_starting_position_score(tile: HexTile, tiles: List[HexTile], width: int,
     center_q = 0
     center_r = 0
     distance_to_center = cube_distance(
-        HexCoord(q=tile.q, r=tile.r, s=tile.s),
-        HexCoord(q=center_q, r=center_r, s=-center_q-center_r)
+        (tile.q, tile.r, tile.s),
+        (center_q, center_r, -center_q-center_r)
     )
     max_distance = max(width, height) / 2
     center_factor = 1.0 - (distance_to_center / max_distance)
@@ -138,12 +225,12 @@ def find_suitable_starting_positions(
                  if t.terrain not in [TerrainType.OCEAN, TerrainType.MOUNTAIN]
                  and (t.q != player_position[0] or t.r != player_position[1])]
     
+    # 플레이어 위치까지의 거리는 모든 땅 타일에 대해 한 번에 계산
+    distance_to_player = min_hex_distance([(t.q, t.r) for t in land_tiles], [player_position])
+    
     # 플레이어 위치로부터 최소 거리 이상 떨어진 타일만 필터링
-    candidates = [t for t in land_tiles 
-                 if cube_distance(
-                     HexCoord(q=t.q, r=t.r, s=t.s),
-                     player_position
-                 ) >= min_distance]
+    candidates = [t for t, distance in zip(land_tiles, distance_to_player.tolist())
+                 if distance >= min_distance]
     
     # 적합성 점수 계산 및 정렬
     scored_positions = [(t, get_starting_position_score(t, tiles, width, height)) 
@@ -161,15 +248,12 @@ def find_suitable_starting_positions(
         remaining_count = ai_count - len(best_positions)
         
         # 이미 선택된 위치 리스트
-        selected_coords = set((pos[0], pos[1]) for pos in best_positions)
+        selected_coords = set((pos.q, pos.r) for pos in best_positions)
         selected_coords.add((player_position[0], player_position[1]))
         
         # 최소 거리 조건 완화하여 재검색
-        new_candidates = [t for t in land_tiles 
-                         if cube_distance(
-                             HexCoord(q=t.q, r=t.r, s=t.s),
-                             player_position
-                         ) >= min_distance
+        new_candidates = [t for t, distance in zip(land_tiles, distance_to_player.tolist())
+                         if distance >= min_distance
                          and (t.q, t.r) not in selected_coords]
         
         new_scored = [(t, get_starting_position_score(t, tiles, width, height)) 
@@ -234,209 +318,183 @@ def initialize_resources(tiles: List[HexTile], resource_percentage: float = 0.1)
     
     return tiles
 
+def hex_radius_sum(values: np.ndarray, radius: int) -> np.ndarray:
+    """(width, height) 배열 (인덱스 [q, r])의 각 칸에 대해 반경 radius 이내 값의 합 (맵 밖은 0으로 취급)
+
+    헥스 반경 안의 각 q 열은 연속된 r 구간이므로 r 방향 누적합(summed-area)으로 열마다 한 번의 뺄셈으로 구합니다.
+    """
+    width, height = values.shape
+    padded = np.pad(values, radius)
+    cumulative = np.zeros((padded.shape[0], padded.shape[1] + 1), dtype=np.result_type(values.dtype, np.int64))
+    np.cumsum(padded, axis=1, out=cumulative[:, 1:])
+    total = np.zeros((width, height), dtype=cumulative.dtype)
+    for dq in range(-radius, radius + 1):
+        low = max(-radius, -dq - radius)
+        high = min(radius, -dq + radius)
+        rows = cumulative[radius + dq:radius + dq + width]
+        total += rows[:, radius + high + 1:radius + high + 1 + height] - rows[:, radius + low:radius + low + height]
+    return total
+
 def hex_distance(a: HexCoord, b: HexCoord) -> int:
     """두 헥스 좌표 사이의 거리 계산"""
     return max(abs(a[0] - b[0]), abs(a[1] - b[1]), abs(a[2] - b[2]))
 
+def as_coord_array(coords) -> np.ndarray:
+    """좌표 목록 (튜플/배열, (q, r) 또는 (q, r, s))을 (n, 2) int32 배열로 변환"""
+    array = np.asarray(coords, dtype=np.int32)
+    if array.size == 0:
+        return np.zeros((0, 2), dtype=np.int32)
+    return array.reshape(len(array), -1)[:, :2]
+
+def hex_distance_matrix(a, b) -> np.ndarray:
+    """a의 각 좌표와 b의 각 좌표 사이 헥스 거리 행렬 (len(a), len(b))"""
+    a, b = as_coord_array(a), as_coord_array(b)
+    dq = a[:, None, 0] - b[None, :, 0]
+    dr = a[:, None, 1] - b[None, :, 1]
+    return np.maximum(np.maximum(np.abs(dq), np.abs(dr)), np.abs(dq + dr))
+
+def min_hex_distance(coords, others) -> np.ndarray:
+    """각 좌표에서 others 중 가장 가까운 좌표까지의 거리 (others가 비어 있으면 int32 최댓값)"""
+    coords = as_coord_array(coords)
+    if len(as_coord_array(others)) == 0:
+        return np.full(len(coords), np.iinfo(np.int32).max, dtype=np.int32)
+    return hex_distance_matrix(coords, others).min(axis=1)
+
+def far_enough_mask(coords, others, min_distance: int) -> np.ndarray:
+    """others의 모든 좌표와 min_distance 이상 떨어진 좌표의 마스크"""
+    return min_hex_distance(coords, others) >= min_distance
+
 def get_neighbors(q: int, r: int, s: int) -> List[HexCoord]:
     """주어진 헥스 좌표의 인접한 6개 타일 좌표 반환"""
-    directions = [
-        (1, 0, -1), (1, -1, 0), (0, -1, 1),
-        (-1, 0, 1), (-1, 1, 0), (0, 1, -1)
-    ]
-    return [(q + dq, r + dr, s + ds) for dq, dr, ds in directions]
+    return [(q + dq, r + dr, s + ds) for dq, dr, ds in _NEIGHBOR_TUPLES]
 
 def get_tiles_in_radius(center: HexCoord, radius: int) -> List[HexCoord]:
     """중심점으로부터 특정 반경 내의 모든 타일 좌표 반환"""
-    results = []
-    q, r, s = center
-    
-    for dq in range(-radius, radius + 1):
-        for dr in range(max(-radius, -dq - radius), min(radius, -dq + radius) + 1):
-            ds = -dq - dr
-            if abs(ds) <= radius:
-                results.append((q + dq, r + dr, s + ds))
-    
-    return results
+    return _apply_offsets(center, "radius", radius)
 
-async def assign_guaranteed_resources(game_id: str, capital_coords: List[HexCoord]):
-    """각 수도 반경 2칸 내에 보장된 자원 배치"""
-    for capital in capital_coords:
-        # 수도 좌표
-        q, r, s = capital
-        
-        # 반경 2칸 내 모든 타일 가져오기
-        tiles_in_radius = get_tiles_in_radius(capital, 2)
-        
-        # 수도 타일 자체는 제외
-        tiles_in_radius.remove(capital)
-        
-        # 물 타일이 아닌 타일만 선택
-        land_tiles = []
-        for tile_coord in tiles_in_radius:
-            tq, tr, ts = tile_coord
-            tile = await prisma_client.hexagon.find_unique(
-                where={
-                    "session_id_q_r_s": {
-                        "session_id": game_id,
-                        "q": tq,
-                        "r": tr,
-                        "s": ts
-                    }
-                }
-            )
-            if tile and tile.terrain_id not in ["ocean", "coast", "lake"]:
-                land_tiles.append(tile)
+# 자원을 배치하지 않는 물 지형
+WATER_TERRAINS = ["ocean", "coast", "lake"]
+
+# 각 수도 반경 2칸 내에 보장하는 자원 목록
+GUARANTEED_RESOURCES = [
+    {"id": "wheat", "category": "food"},
+    {"id": "iron", "category": "production"},
+    {"id": "gold", "category": "gold"}
+]
+
+def assign_guaranteed_resources(game_map: "GeneratedMap", capital_coords: List[HexCoord]):
+    """각 수도 반경 2칸 내에 보장된 자원 배치 (메모리 맵에 기록)"""
+    if not capital_coords:
+        return
+    
+    # 모든 수도의 반경 2칸 좌표(수도 타일 제외, 기존 get_tiles_in_radius 순서)를 한 번에 계산하고 맵 안의 땅 타일만 표시
+    offsets = radius_offsets(2)
+    tiles_in_radius = offset_coords(
+        np.array([capital[:2] for capital in capital_coords]),
+        offsets[np.any(offsets != 0, axis=1)]
+    )
+    q, r = tiles_in_radius[..., 0], tiles_in_radius[..., 1]
+    inside = (q >= 0) & (q < game_map.width) & (r >= 0) & (r < game_map.height)
+    water = game_map.terrain_mask(WATER_TERRAINS)
+    land = inside & ~water[np.clip(q, 0, game_map.width - 1), np.clip(r, 0, game_map.height - 1)]
+    
+    for capital_index in range(len(capital_coords)):
+        land_tiles = tiles_in_radius[capital_index][land[capital_index]]
         
         # 충분한 타일이 없으면 가능한 만큼만 처리
-        if not land_tiles:
+        if not len(land_tiles):
             continue
         
-        # 보장 자원 목록
-        guaranteed_resources = [
-            {"id": "wheat", "category": "food"},
-            {"id": "iron", "category": "production"},
-            {"id": "gold", "category": "gold"}
-        ]
-        
-        # 자원 없는 타일 섞기
-        empty_tiles = [t for t in land_tiles if not t.resource_id]
+        # 자원 없는 타일 섞기 (앞선 수도가 배치한 자원도 반영)
+        empty_mask = game_map.resource[land_tiles[:, 0], land_tiles[:, 1]] == NO_RESOURCE
+        empty_tiles = [tuple(t) for t in land_tiles[empty_mask].tolist()]
         random.shuffle(empty_tiles)
         
         # 보장 자원 배치
-        for i, resource in enumerate(guaranteed_resources):
+        for i, resource in enumerate(GUARANTEED_RESOURCES):
             if i < len(empty_tiles):
-                # 자원 배치
-                await prisma_client.hexagon.update(
-                    where={
-                        "session_id_q_r_s": {
-                            "session_id": game_id,
-                            "q": empty_tiles[i].q,
-                            "r": empty_tiles[i].r,
-                            "s": empty_tiles[i].s
-                        }
-                    },
-                    data={"resource_id": resource["id"]}
-                )
-
-async def distribute_map_resources(game_id: str):
-    """전체 맵에 자원 분포 로직"""
-    # 모든 땅 타일 조회
-    land_tiles = await prisma_client.hexagon.find_many(
-        where={
-            "session_id": game_id,
-            "terrain_id": {"not_in": ["ocean", "coast", "lake"]}
-        }
-    )
-    
-    # 이미 자원이 있는 타일은 제외
-    empty_land_tiles = [t for t in land_tiles if not t.resource_id]
-    
-    # 자원 배치할 타일 수 계산 (땅 타일의 10%)
-    resource_count = int(len(land_tiles) * 0.10)
-    
-    # 이미 배치된 자원 개수를 빼서 추가 배치할 수 조정
-    already_assigned = len(land_tiles) - len(empty_land_tiles)
-    resource_count = max(0, resource_count - already_assigned)
-    
-    # 자원 유형별 배치 수량
-    resource_distribution = {
-        "food": int(resource_count * 0.4),      # Wheat, Cattle 등
-        "production": int(resource_count * 0.3), # Stone, Copper 등
-        "gold": int(resource_count * 0.2),      # Gold, Gems 등
-        "strategic": int(resource_count * 0.1)   # Horses 등
-    }
-    
-    # 자원 매핑
-    resource_mapping = {
-        "food": ["wheat", "cattle", "sheep", "rice"],
-        "production": ["stone", "iron", "copper"],
-        "gold": ["gold", "silver", "gems"],
-        "strategic": ["horses"]
-    }
-    
-    # 지형에 맞는 자원 매핑
-    terrain_resource_mapping = {
-        "grassland": ["wheat", "cattle", "sheep"],
-        "plains": ["wheat", "horses", "cattle"],
-        "forest": ["deer", "iron"],
-        "hill": ["stone", "iron", "gold"],
-        "tundra": ["deer"],
-        "desert": ["gold", "silver"],
-        "jungle": ["gems", "rice"],
-        "mountain": ["stone", "silver", "gems"]
-    }
-    
-    # 비어있는 땅 타일 섞기
-    random.shuffle(empty_land_tiles)
-    
-    # 각 자원 유형별로 처리
-    for category, count in resource_distribution.items():
-        # 해당 카테고리의 자원 목록
-        resources = resource_mapping[category]
-        
-        # 배치할 수 만큼 반복
-        for _ in range(count):
-            if not empty_land_tiles:
-                break
-                
-            # 다음 타일 선택
-            tile = empty_land_tiles.pop()
-            
-            # 지형에 맞는 자원 선택
-            suitable_resources = terrain_resource_mapping.get(tile.terrain_id, [])
-            
-            # 지형에 맞는 자원이 없으면 카테고리 내 아무 자원이나 선택
-            if not suitable_resources:
-                suitable_resources = resources
-            
-            # 두 목록의 교집합 찾기 (지형에 맞으면서 해당 카테고리인 자원)
-            compatible_resources = [r for r in suitable_resources if r in resources]
-            
-            # 호환 가능한 자원이 없으면 카테고리 내에서 선택
-            selected_resource = random.choice(compatible_resources if compatible_resources else resources)
-            
-            # 자원 배치
-            await prisma_client.hexagon.update(
-                where={
-                    "session_id_q_r_s": {
-                        "session_id": game_id,
-                        "q": tile.q,
-                        "r": tile.r,
-                        "s": tile.s
-                    }
-                },
-                data={"resource_id": selected_resource}
-            )
-
-async def setup_capital_yield(game_id: str, capital_coords: List[HexCoord]):
-    """수도 타일에 기본 수확량 설정"""
-    for capital in capital_coords:
-        q, r, s = capital
-        
-        # 기본 수확량: 식량 2, 생산 1, 골드 1
-        yield_data = {
-            "food": 2,
-            "production": 1,
-            "gold": 1
-        }
-        
-        # 수도 타일 업데이트
-        await prisma_client.hexagon.update(
-            where={
-                "session_id_q_r_s": {
-                    "session_id": game_id,
-                    "q": q,
-                    "r": r,
-                    "s": s
-                }
-            },
-            data={
-                "yield_food": yield_data["food"],
-                "yield_production": yield_data["production"],
-                "yield_gold": yield_data["gold"]
-            }
-        )
+                game_map.set_resource(empty_tiles[i][0], empty_tiles[i][1], resource["id"])
+
+# 전체 맵 자원 분포 - 땅 타일 중 자원 타일 비율과 자원 유형별 배치 비율 (배치 순서 유지)
+MAP_RESOURCE_RATIO = 0.10
+RESOURCE_CATEGORY_SHARES = (
+    ("food", 0.4),        # Wheat, Cattle 등
+    ("production", 0.3),  # Stone, Copper 등
+    ("gold", 0.2),        # Gold, Gems 등
+    ("strategic", 0.1)    # Horses 등
+)
+
+# 자원 유형별 자원 목록
+CATEGORY_RESOURCES: Dict[str, List[str]] = {
+    "food": ["wheat", "cattle", "sheep", "rice"],
+    "production": ["stone", "iron", "copper"],
+    "gold": ["gold", "silver", "gems"],
+    "strategic": ["horses"]
+}
+
+# 전체 자원 분포에서 지형에 맞는 자원 매핑
+DISTRIBUTION_TERRAIN_RESOURCES: Dict[str, List[str]] = {
+    "grassland": ["wheat", "cattle", "sheep"],
+    "plains": ["wheat", "horses", "cattle"],
+    "forest": ["deer", "iron"],
+    "hills": ["stone", "iron", "gold"],
+    "tundra": ["deer"],
+    "desert": ["gold", "silver"],
+    "jungle": ["gems", "rice"],
+    "mountain": ["stone", "silver", "gems"]
+}
+
+@lru_cache(maxsize=None)
+def category_weight_table(category: str) -> np.ndarray:
+    """자원 유형의 지형별 누적 가중치 표 (len(TERRAIN_IDS), len(RESOURCE_IDS))
+
+    지형에 맞으면서 해당 유형인 자원에 같은 가중치를 주고, 그런 자원이 없는 지형은 유형 내 모든 자원에 같은 가중치를 줍니다.
+    """
+    resources = CATEGORY_RESOURCES[category]
+    weights = np.zeros((len(TERRAIN_IDS), len(RESOURCE_IDS)), dtype=np.float64)
+    for terrain_index, terrain_id in enumerate(TERRAIN_IDS):
+        compatible = [res for res in DISTRIBUTION_TERRAIN_RESOURCES.get(terrain_id, []) if res in resources]
+        for resource_id in compatible or resources:
+            weights[terrain_index, RESOURCE_INDEX[resource_id]] = 1.0
+    table = weights.cumsum(axis=1)
+    table.flags.writeable = False
+    return table
+
+
+def draw_category_resources(terrain: np.ndarray, category: str, rng: np.random.Generator) -> np.ndarray:
+    """지형 인덱스 배열의 타일마다 category 자원을 가중치 추첨 (RESOURCE_IDS 인덱스 배열)"""
+    cumulative = category_weight_table(category)[terrain]
+    draw = rng.random(len(terrain)) * cumulative[:, -1]
+    return (cumulative <= draw[:, None]).sum(axis=1)
+
+
+def distribute_map_resources(game_map: "GeneratedMap"):
+    """전체 맵에 자원 분포 로직 (메모리 맵에 기록)
+
+    빈 땅 타일을 한 번 섞어 자원 유형별 수량만큼 나눈 뒤, 유형마다 지형별 가중치 표로 자원을 한 번에 추첨합니다.
+    random 모듈 상태에서 난수 생성기 시드를 뽑으므로 prepare_map의 맵 시드 초기화로 결과가 재현됩니다.
+    """
+    rng = np.random.default_rng(random.getrandbits(64))
+
+    # 모든 땅 타일과 그중 자원이 없는 타일
+    land = ~game_map.terrain_mask(WATER_TERRAINS)
+    empty_land = np.argwhere(land & (game_map.resource == NO_RESOURCE))
+    
+    # 자원 배치할 타일 수 계산 (땅 타일의 10%) - 이미 배치된 자원 개수를 빼서 추가 배치할 수 조정
+    land_count = int(land.sum())
+    already_assigned = land_count - len(empty_land)
+    resource_count = max(0, int(land_count * MAP_RESOURCE_RATIO) - already_assigned)
+    
+    # 비어있는 땅 타일을 섞어 자원 유형별로 앞에서부터 나눠 가짐
+    empty_land = empty_land[rng.permutation(len(empty_land))]
+    offset = 0
+    for category, share in RESOURCE_CATEGORY_SHARES:
+        tiles = empty_land[offset:offset + int(resource_count * share)]
+        offset += len(tiles)
+        if not len(tiles):
+            continue
+        q, r = tiles[:, 0], tiles[:, 1]
+        game_map.resource[q, r] = draw_category_resources(game_map.terrain[q, r], category, rng)
 
 async def create_starting_units(game_id: str, player_id: int, capital_hex: Hexagon):
     """플레이어 초기 유닛 생성 - 정찰병과 개척자"""
@@ -492,42 +550,25 @@ def get_resource_improvements(resource_id: str) -> str:
     else:
         return "farm"  # 기본값
 
-async def get_suggested_improvements(game_id: str, capital_coord: HexCoord) -> List[Dict[str, Any]]:
-    """수도 반경 2칸 내 자원 타일에 대한 개선 추천 목록 반환"""
+def get_suggested_improvements(grid: "HexGrid", capital_coord: HexCoord) -> List[Dict[str, Any]]:
+    """수도 반경 2칸 내 자원 타일에 대한 개선 추천 목록 반환 (세션 헥스 그리드에서 조회)"""
     q, r, s = capital_coord
     
-    # 반경 2칸 내 모든 타일 가져오기
-    tiles_in_radius = get_tiles_in_radius((q, r, s), 2)
+    # 반경 2칸 내 타일 중 자원이 있는 타일만 처리
+    resource_tiles = grid.with_resource(grid.within(q, r, 2))
     
     suggested_improvements = []
     
-    for tile_coord in tiles_in_radius:
-        tq, tr, ts = tile_coord
-        
-        # 타일 정보 조회
-        tile = await prisma_client.hexagon.find_unique(
-            where={
-                "session_id_q_r_s": {
-                    "session_id": game_id,
-                    "q": tq,
-                    "r": tr,
-                    "s": ts
-                }
-            }
-        )
-        
-        # 자원이 있는 타일만 처리
-        if tile and tile.resource_id:
-            improvement = get_resource_improvements(tile.resource_id)
-            
-            suggested_improvements.append({
-                "tile": {
-                    "q": tile.q,
-                    "r": tile.r,
-                    "s": tile.s
-                },
-                "resource": tile.resource_id,
-                "improvement": improvement
-            })
+    for index, (tq, tr, ts) in zip(resource_tiles.tolist(), grid.coords(resource_tiles)):
+        resource_id = grid.resource_id(index)
+        suggested_improvements.append({
+            "tile": {
+                "q": tq,
+                "r": tr,
+                "s": ts
+            },
+            "resource": resource_id,
+            "improvement": get_resource_improvements(resource_id)
+        })
     
-    return suggested_improvements
\ No newline at end of file
+    return suggested_improvements
@@ -0,0 +1,307 @@
+from dataclasses import dataclass
+import heapq
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from cachetools import LRUCache
+from core.config import settings
+from utils.hex_grid import HexGrid, NO_VALUE
+from utils.landmass import NO_COMPONENT
+from utils.map_utils import WATER_TERRAINS
+
+# 헥스 좌표 저장을 위한 튜플 타입
+HexCoord = Tuple[int, int, int]
+
+# 지형별 이동 비용 (타일에 들어갈 때 소모하는 이동력) - 산은 모든 유닛이 지날 수 없음
+TERRAIN_MOVE_COSTS: Dict[str, int] = {
+    "plains": 1,
+    "grassland": 1,
+    "desert": 1,
+    "tundra": 1,
+    "hills": 2,
+    "forest": 2,
+    "jungle": 2,
+    "ocean": 1,
+    "coast": 1,
+    "lake": 1
+}
+
+# 이동 비용이 1보다 큰 험지 (정찰 유닛은 평지와 같은 비용)
+ROUGH_TERRAINS = ["hills", "forest", "jungle"]
+
+
+@dataclass(frozen=True)
+class MovementRules:
+    """유닛 분류별 이동 규칙"""
+    passable: Tuple[str, ...]     # 들어갈 수 있는 지형
+    ignores_rough: bool = False   # 험지도 비용 1
+    naval: bool = False           # 수역 단위로 연결 판정 (아니면 대륙 단위)
+
+
+LAND_TERRAINS = tuple(t for t in TERRAIN_MOVE_COSTS if t not in WATER_TERRAINS)
+
+UNIT_CLASS_RULES: Dict[str, MovementRules] = {
+    "land": MovementRules(passable=LAND_TERRAINS),
+    "recon": MovementRules(passable=LAND_TERRAINS, ignores_rough=True),
+    "naval": MovementRules(passable=tuple(WATER_TERRAINS), naval=True)
+}
+
+# UnitType.category -> 이동 규칙 분류 (없는 카테고리는 지상 유닛)
+UNIT_CATEGORY_CLASSES: Dict[str, str] = {
+    "civilian": "land",
+    "melee": "land",
+    "ranged": "land",
+    "recon": "recon",
+    "naval": "naval"
+}
+DEFAULT_UNIT_CLASS = "land"
+
+
+def unit_class_of(category: Optional[str]) -> str:
+    return UNIT_CATEGORY_CLASSES.get(category or "", DEFAULT_UNIT_CLASS)
+
+
+def terrain_move_cost(terrain_id: Optional[str], unit_class: str) -> int:
+    """지형 하나의 이동 비용 (들어갈 수 없으면 0)"""
+    rules = UNIT_CLASS_RULES[unit_class]
+    if terrain_id not in rules.passable:
+        return 0
+    if rules.ignores_rough and terrain_id in ROUGH_TERRAINS:
+        return 1
+    return TERRAIN_MOVE_COSTS[terrain_id]
+
+
+def move_cost_grid(grid: HexGrid, unit_class: str) -> np.ndarray:
+    """타일별 이동 비용 배열 (전체 타일 순서, 들어갈 수 없으면 0)"""
+    table = np.array([terrain_move_cost(t, unit_class) for t in grid.terrain_names], dtype=np.int32)
+    return table[grid.terrain]
+
+
+@dataclass(frozen=True)
+class Path:
+    """출발지부터 목적지까지의 경로 (좌표라서 그리드를 다시 읽어도 유효)"""
+    coords: Tuple[HexCoord, ...]     # 출발지 포함
+    step_costs: Tuple[int, ...]      # coords[i] -> coords[i + 1] 이동 비용
+
+    @property
+    def cost(self) -> int:
+        return sum(self.step_costs)
+
+    def waypoints(self, movement: int, max_movement: int) -> List[Tuple[int, int]]:
+        """턴별 도착 지점 - (턴 번호, coords 위치) 목록 (1턴 = 현재 턴, 남은 이동력 movement로 시작)
+
+        남은 이동력보다 비싼 타일은 다음 턴에 들어가며, 최대 이동력보다 비싼 타일은 한 턴의 이동력을 모두 써서 들어갑니다.
+        """
+        turn, remaining = 1, movement
+        waypoints = []
+        for position, cost in enumerate(self.step_costs):
+            if cost > remaining and remaining < max_movement:
+                waypoints.append((turn, position))
+                turn, remaining = turn + 1, max_movement
+            remaining -= min(cost, remaining)
+        waypoints.append((turn, len(self.coords) - 1))
+        return waypoints
+
+    def to_dict(self, movement: int, max_movement: int) -> Dict[str, Any]:
+        waypoints = self.waypoints(movement, max_movement)
+        return {
+            "reachable": True,
+            "cost": self.cost,
+            "turns": waypoints[-1][0],
+            "path": [{"q": q, "r": r, "s": s} for q, r, s in self.coords],
+            "waypoints": [
+                {"turn": turn, "q": self.coords[position][0], "r": self.coords[position][1], "s": self.coords[position][2]}
+                for turn, position in waypoints
+            ]
+        }
+
+
+@dataclass(frozen=True)
+class Reach:
+    """출발지에서 남은 이동력으로 갈 수 있는 타일과 각 타일까지의 최소 이동 비용"""
+    origin: HexCoord
+    movement: int
+    tiles: Tuple[Tuple[HexCoord, int], ...]   # (좌표, 비용) - 비용, 좌표 오름차순
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "origin": {"q": self.origin[0], "r": self.origin[1], "s": self.origin[2]},
+            "movement": self.movement,
+            "tiles": [
+                {"q": q, "r": r, "s": s, "cost": cost, "remaining": self.movement - cost}
+                for (q, r, s), cost in self.tiles
+            ]
+        }
+
+
+class _SearchSpace:
+    """그리드 하나 + 유닛 분류 하나의 탐색용 목록 (타일 배치와 지형은 바뀌지 않으므로 재사용)"""
+
+    def __init__(self, grid: HexGrid, unit_class: str):
+        self.grid = grid
+        costs = move_cost_grid(grid, unit_class)
+        self.costs: List[int] = costs.tolist()
+        self.neighbors: List[List[int]] = grid.neighbor_table.tolist()
+        self.q: List[int] = grid.q.tolist()
+        self.r: List[int] = grid.r.tolist()
+        passable = costs[costs > 0]
+        self.min_cost = int(passable.min()) if len(passable) else 1
+        self.component = grid.water_body if UNIT_CLASS_RULES[unit_class].naval else grid.continent
+
+
+def _search(space: _SearchSpace, start: int, goal: int) -> Optional[Tuple[List[int], List[int]]]:
+    """A* (휴리스틱 = 헥스 거리 x 최소 이동 비용) - (타일 인덱스 경로, 단계별 비용), 없으면 None"""
+    q, r, costs, neighbors = space.q, space.r, space.costs, space.neighbors
+    goal_q, goal_r, min_cost = q[goal], r[goal], space.min_cost
+
+    def heuristic(i: int) -> int:
+        dq, dr = q[i] - goal_q, r[i] - goal_r
+        return max(abs(dq), abs(dr), abs(dq + dr)) * min_cost
+
+    best = {start: 0}
+    came_from: Dict[int, int] = {}
+    # 같은 f 값이면 더 많이 온(g가 큰) 타일을 먼저 확장
+    heap = [(heuristic(start), 0, start)]
+    while heap:
+        _, negative_g, i = heapq.heappop(heap)
+        g = -negative_g
+        if i == goal:
+            path = [goal]
+            while path[-1] != start:
+                path.append(came_from[path[-1]])
+            path.reverse()
+            return path, [costs[j] for j in path[1:]]
+        if g > best[i]:
+            continue
+        for j in neighbors[i]:
+            if j == NO_VALUE:
+                continue
+            cost = costs[j]
+            if not cost:
+                continue
+            new_g = g + cost
+            if new_g < best.get(j, new_g + 1):
+                best[j] = new_g
+                came_from[j] = i
+                heapq.heappush(heap, (new_g + heuristic(j), -new_g, j))
+    return None
+
+
+def _flood(space: _SearchSpace, start: int, budget: int) -> Dict[int, int]:
+    """비용 budget 이내로 갈 수 있는 타일별 최소 비용 (Dijkstra, 출발지 포함)"""
+    costs, neighbors = space.costs, space.neighbors
+    best = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        g, i = heapq.heappop(heap)
+        if g > best[i]:
+            continue
+        for j in neighbors[i]:
+            if j == NO_VALUE:
+                continue
+            cost = costs[j]
+            if not cost:
+                continue
+            new_g = g + cost
+            if new_g <= budget and new_g < best.get(j, budget + 1):
+                best[j] = new_g
+                heapq.heappush(heap, (new_g, j))
+    return best
+
+
+# 도달할 수 없는 경로의 캐시 값 (None은 캐시 미적중과 구분)
+_UNREACHABLE = object()
+
+
+class PathFinder:
+    """세션 헥스 그리드 위 A* 경로 탐색 + (유닛 분류, 출발지, 목적지, 지형 버전)별 결과 캐시
+
+    경로는 지형만 고려하므로 유닛 이동/시야 변경으로는 무효화되지 않습니다 (다른 유닛의 점유는 목적지에서만 확인).
+    이동 범위(reachable)는 (유닛 분류, 출발지, 이동력, 점유 버전)별로 캐시합니다.
+    """
+
+    def __init__(self, max_entries: int):
+        self._paths: LRUCache = LRUCache(maxsize=max_entries)
+        self._reaches: LRUCache = LRUCache(maxsize=max_entries)
+        self._spaces: LRUCache = LRUCache(maxsize=settings.HEX_GRID_CACHE_SIZE * len(UNIT_CLASS_RULES))
+        self.hits = 0
+        self.misses = 0
+        self.reach_hits = 0
+        self.reach_misses = 0
+
+    def _space(self, grid: HexGrid, unit_class: str) -> _SearchSpace:
+        key = (grid.session_id, unit_class)
+        space = self._spaces.get(key)
+        if space is None or space.grid is not grid:
+            space = self._spaces[key] = _SearchSpace(grid, unit_class)
+        return space
+
+    def find(self, grid: HexGrid, unit_class: str, start: int, goal: int) -> Optional[Path]:
+        """start -> goal 최소 비용 경로 (타일 인덱스 기준, 도달할 수 없으면 None)"""
+        start_q, start_r = int(grid.q[start]), int(grid.r[start])
+        goal_q, goal_r = int(grid.q[goal]), int(grid.r[goal])
+        key = (grid.session_id, unit_class, (start_q, start_r), (goal_q, goal_r), grid.terrain_version)
+        cached = self._paths.get(key)
+        if cached is not None:
+            self.hits += 1
+            return None if cached is _UNREACHABLE else cached
+        self.misses += 1
+
+        path = self._find(grid, unit_class, start, goal)
+        self._paths[key] = _UNREACHABLE if path is None else path
+        return path
+
+    def _find(self, grid: HexGrid, unit_class: str, start: int, goal: int) -> Optional[Path]:
+        if start == goal:
+            return Path(coords=tuple(grid.coords([start])), step_costs=())
+        space = self._space(grid, unit_class)
+        if not space.costs[goal]:
+            return None
+        # 다른 대륙(해상 유닛은 다른 수역)이면 탐색 없이 바로 실패
+        start_component, goal_component = int(space.component[start]), int(space.component[goal])
+        if start_component != NO_COMPONENT and start_component != goal_component:
+            return None
+
+        found = _search(space, start, goal)
+        if found is None:
+            return None
+        indices, step_costs = found
+        return Path(coords=tuple(grid.coords(indices)), step_costs=tuple(step_costs))
+
+    def reachable(self, grid: HexGrid, unit_class: str, start: int, movement: int) -> Reach:
+        """start에서 이동력 movement로 이동할 수 있는 타일 (출발지와 다른 유닛이 있는 타일 제외)
+
+        지나가는 것은 점유와 무관하고 도착만 빈 타일이어야 합니다 (move_unit과 같은 규칙).
+        """
+        start_q, start_r = int(grid.q[start]), int(grid.r[start])
+        key = (grid.session_id, unit_class, (start_q, start_r), movement, grid.occupancy_version)
+        reach = self._reaches.get(key)
+        if reach is not None:
+            self.reach_hits += 1
+            return reach
+        self.reach_misses += 1
+
+        costs = _flood(self._space(grid, unit_class), start, max(0, movement))
+        indices = np.array([i for i in costs if i != start], dtype=np.int64)
+        if len(indices):
+            indices = indices[grid.unit_id[indices] == NO_VALUE]
+        tiles = sorted(zip(grid.coords(indices), (costs[i] for i in indices.tolist())), key=lambda tile: (tile[1], tile[0]))
+        reach = self._reaches[key] = Reach(
+            origin=grid.coords([start])[0],
+            movement=movement,
+            tiles=tuple(tiles)
+        )
+        return reach
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._paths),
+            "hits": self.hits,
+            "misses": self.misses,
+            "reach_entries": len(self._reaches),
+            "reach_hits": self.reach_hits,
+            "reach_misses": self.reach_misses
+        }
+
+
+# 전역 경로 탐색기 인스턴스
+path_finder = PathFinder(settings.PATH_CACHE_SIZE)
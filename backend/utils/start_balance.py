@@ -0,0 +1,290 @@
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from utils.map_generator import (
+    DEFAULT_RESOURCE_TYPES,
+    RESOURCE_IDS,
+    RESOURCE_INDEX,
+    TERRAIN_RESOURCE_MAPPING,
+    YIELD_TYPES,
+    GeneratedMap,
+    NO_RESOURCE,
+    terrain_yield_table
+)
+from utils.map_utils import GUARANTEED_RESOURCES, WATER_TERRAINS, offset_coords, radius_offsets
+from utils.start_positions import CITY_RADIUS
+
+logger = logging.getLogger(__name__)
+
+# 헥스 좌표 저장을 위한 튜플 타입
+HexCoord = Tuple[int, int, int]
+
+# 자원 종류별 타일 추가 수확량 (YIELD_TYPES 순서)
+RESOURCE_TYPE_YIELDS: Dict[str, Tuple[int, int, int]] = {
+    "food": (1, 0, 0),
+    "production": (0, 1, 0),
+    "gold": (0, 0, 1)
+}
+
+# 전략 자원 종류
+STRATEGIC_RESOURCE_TYPE = "strategic"
+
+# 수도 반경에 보장되는 자원 (마지막 하나는 다른 수도로 옮기지 않음)
+GUARANTEED_RESOURCE_IDS = {resource["id"] for resource in GUARANTEED_RESOURCES}
+
+
+def gini(values) -> float:
+    """지니 계수 (0 = 완전 균등, 1에 가까울수록 불균등)"""
+    values = np.sort(np.asarray(values, dtype=np.float64))
+    total = values.sum()
+    if len(values) < 2 or total <= 0:
+        return 0.0
+    ranks = np.arange(1, len(values) + 1)
+    return float((2 * ranks - len(values) - 1).dot(values) / (len(values) * total))
+
+
+def resource_yield_table(resource_types: Optional[Dict[str, str]] = None) -> np.ndarray:
+    """자원 인덱스별 추가 수확량 표 (len(RESOURCE_IDS) + 1, len(YIELD_TYPES)) - 마지막 행은 자원 없음(-1)"""
+    resource_types = resource_types or DEFAULT_RESOURCE_TYPES
+    table = np.zeros((len(RESOURCE_IDS) + 1, len(YIELD_TYPES)), dtype=np.int32)
+    for resource_id, resource_type in resource_types.items():
+        if resource_id in RESOURCE_INDEX and resource_type in RESOURCE_TYPE_YIELDS:
+            table[RESOURCE_INDEX[resource_id]] = RESOURCE_TYPE_YIELDS[resource_type]
+    return table
+
+
+def strategic_resource_table(resource_types: Optional[Dict[str, str]] = None) -> np.ndarray:
+    """자원 인덱스별 전략 자원 여부 (len(RESOURCE_IDS) + 1,) - 마지막 항목은 자원 없음(-1)"""
+    resource_types = resource_types or DEFAULT_RESOURCE_TYPES
+    table = np.zeros(len(RESOURCE_IDS) + 1, dtype=bool)
+    for resource_id, resource_type in resource_types.items():
+        if resource_id in RESOURCE_INDEX and resource_type == STRATEGIC_RESOURCE_TYPE:
+            table[RESOURCE_INDEX[resource_id]] = True
+    return table
+
+
+async def load_yield_data(db) -> Tuple[Dict[str, Dict[str, int]], Dict[str, str]]:
+    """Terrain.yield_json과 Resource.type을 읽어 (지형별 수확량, 자원별 종류) 반환"""
+    terrain_yields = {}
+    for terrain in await db.terrain.find_many():
+        yields = terrain.yield_json
+        if isinstance(yields, str):
+            yields = json.loads(yields)
+        terrain_yields[terrain.id] = yields or {}
+    resource_types = {resource.id: resource.type for resource in await db.resource.find_many()}
+    return terrain_yields, resource_types
+
+
+@dataclass
+class StartBalanceReport:
+    """수도별 도시 반경 수확량/전략 자원과 문명 간 편차 지표"""
+    capital_coords: List[HexCoord]
+    yields: np.ndarray      # (수도 수, len(YIELD_TYPES))
+    strategic: np.ndarray   # (수도 수,)
+    threshold: float
+    adjustments: int = 0
+    elapsed_ms: float = 0.0
+    gini: Dict[str, float] = field(init=False)
+
+    def __post_init__(self):
+        self.gini = {y: gini(self.yields[:, i]) for i, y in enumerate(YIELD_TYPES)}
+        self.gini["total"] = gini(self.yields.sum(axis=1))
+        self.gini["strategic"] = gini(self.strategic)
+
+    @property
+    def balanced(self) -> bool:
+        return self.gini["total"] <= self.threshold
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "capitals": [
+                {
+                    "location": {"q": q, "r": r, "s": s},
+                    **{y: int(self.yields[i, j]) for j, y in enumerate(YIELD_TYPES)},
+                    "total": int(self.yields[i].sum()),
+                    "strategic": int(self.strategic[i])
+                }
+                for i, (q, r, s) in enumerate(self.capital_coords)
+            ],
+            "gini": {key: round(value, 4) for key, value in self.gini.items()},
+            "threshold": self.threshold,
+            "balanced": self.balanced,
+            "adjustments": self.adjustments,
+            "elapsedMs": round(self.elapsed_ms, 2)
+        }
+
+
+class StartBalancer:
+    """수도별 도시 반경 수확량을 배열 연산으로 계산하고 자원을 옮겨 문명 간 편차를 줄이는 도구
+
+    수도마다 반경 CITY_RADIUS 타일 좌표를 (수도 수, 반경 타일 수) 배열로 한 번만 만들어 두고,
+    타일 수확량(지형 수확량 + 자원 추가 수확량)을 모아 합산합니다.
+    """
+
+    def __init__(
+        self,
+        game_map: GeneratedMap,
+        capital_coords: List[HexCoord],
+        terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+        resource_types: Optional[Dict[str, str]] = None
+    ):
+        self.game_map = game_map
+        self.capital_coords = list(capital_coords)
+        terrain_table = terrain_yield_table(terrain_yields)[game_map.terrain]
+        self.resource_yields = resource_yield_table(resource_types)
+        self.strategic_resources = strategic_resource_table(resource_types)
+        self.resource_types = resource_types or DEFAULT_RESOURCE_TYPES
+
+        # 수도별 반경 타일 (맵 밖 타일은 inside가 거짓, 좌표는 잘라서 안전하게 인덱싱)
+        tiles = offset_coords(np.array([c[:2] for c in self.capital_coords]).reshape(-1, 2), radius_offsets(CITY_RADIUS))
+        q, r = tiles[..., 0], tiles[..., 1]
+        self.inside = (q >= 0) & (q < game_map.width) & (r >= 0) & (r < game_map.height)
+        self.q = np.clip(q, 0, game_map.width - 1)
+        self.r = np.clip(r, 0, game_map.height - 1)
+        self.tile_terrain_yields = np.where(self.inside[..., None], terrain_table[self.q, self.r], 0)
+
+        # 수도 타일에는 자원을 새로 놓지 않고, 다른 수도에서 옮긴 자원은 땅 타일에만 놓음
+        capital_mask = np.zeros((game_map.width, game_map.height), dtype=bool)
+        for coord in self.capital_coords:
+            capital_mask[coord[0], coord[1]] = True
+        self.capital_tile = capital_mask[self.q, self.r]
+        self.placeable = self.inside & ~self.capital_tile & ~game_map.terrain_mask(WATER_TERRAINS)[self.q, self.r]
+
+    def measure(self) -> Tuple[np.ndarray, np.ndarray]:
+        """수도별 (수확량 합 (수도 수, len(YIELD_TYPES)), 전략 자원 수 (수도 수,))"""
+        resource = np.where(self.inside, self.game_map.resource[self.q, self.r], NO_RESOURCE)
+        yields = (self.tile_terrain_yields + self.resource_yields[resource]).sum(axis=1)
+        strategic = self.strategic_resources[resource].sum(axis=1)
+        return yields, strategic
+
+    def report(self, threshold: float, adjustments: int = 0, elapsed_ms: float = 0.0) -> StartBalanceReport:
+        yields, strategic = self.measure()
+        return StartBalanceReport(self.capital_coords, yields, strategic, threshold, adjustments, elapsed_ms)
+
+    def _movable_sources(self, capital: int, exclude: int) -> List[Tuple[int, int]]:
+        """capital 반경에서 옮길 수 있는 자원 타일 (반경 순서, exclude 수도 반경과 겹치는 타일 제외)"""
+        resource = self.game_map.resource[self.q[capital], self.r[capital]]
+        has_resource = self.inside[capital] & (resource != NO_RESOURCE)
+        shared = set(zip(self.q[exclude][self.inside[exclude]].tolist(), self.r[exclude][self.inside[exclude]].tolist()))
+        counts = np.bincount(resource[has_resource], minlength=len(RESOURCE_IDS))
+        sources = []
+        for index in np.flatnonzero(has_resource & self.placeable[capital]).tolist():
+            code = int(resource[index])
+            if RESOURCE_IDS[code] in GUARANTEED_RESOURCE_IDS and counts[code] <= 1:
+                continue
+            tile = (int(self.q[capital, index]), int(self.r[capital, index]))
+            if tile not in shared:
+                sources.append(tile)
+        return sources
+
+    def _empty_targets(self, capital: int) -> List[Tuple[int, int]]:
+        """capital 반경에서 옮긴 자원을 놓을 수 있는 빈 땅 타일 (반경 순서)"""
+        resource = self.game_map.resource[self.q[capital], self.r[capital]]
+        empty = self.placeable[capital] & (resource == NO_RESOURCE)
+        return list(zip(self.q[capital][empty].tolist(), self.r[capital][empty].tolist()))
+
+    def _regenerate_targets(self, capital: int) -> List[Tuple[int, int]]:
+        """capital 반경에서 자원을 새로 만들 수 있는 타일 - 수도 외 타일 중 비었거나 수확량 없는 자원이 있는 타일 (반경 순서)"""
+        resource = self.game_map.resource[self.q[capital], self.r[capital]]
+        barren = ~self.resource_yields[resource].any(axis=1) & ~self.strategic_resources[resource]
+        regenerable = self.inside[capital] & ~self.capital_tile[capital] & barren
+        return list(zip(self.q[capital][regenerable].tolist(), self.r[capital][regenerable].tolist()))
+
+    def _new_resource_for(self, q: int, r: int) -> Optional[str]:
+        """타일에 새로 놓을 자원 - 지형에 맞고 수확량이 있는 첫 자원"""
+        for resource_id in TERRAIN_RESOURCE_MAPPING.get(self.game_map.terrain_id(q, r), []):
+            if self.resource_types.get(resource_id) in RESOURCE_TYPE_YIELDS:
+                return resource_id
+        return None
+
+    def _candidate_moves(self, rich: int, poor: int):
+        """rich 수도의 자원을 poor 수도 반경의 빈 땅으로 옮기는 변경 후보 (타일, 이전 자원, 새 자원) 목록
+
+        자원은 지형이 허용하는(TERRAIN_RESOURCE_MAPPING) 첫 빈 타일로만 옮기며, 놓을 타일이 없는 자원은 후보에서 빠집니다
+        (그 경우 balance()의 _regenerate_move 후보가 대신 쓰입니다).
+        """
+        targets = self._empty_targets(poor)
+        if not targets:
+            return []
+        target_terrains = [self.game_map.terrain_id(q, r) for q, r in targets]
+        moves = []
+        for source in self._movable_sources(rich, poor):
+            resource_id = self.game_map.resource_id(*source)
+            target = next(
+                (tile for tile, terrain_id in zip(targets, target_terrains)
+                 if resource_id in TERRAIN_RESOURCE_MAPPING.get(terrain_id, [])),
+                None
+            )
+            if target is not None:
+                moves.append([(source, resource_id, None), (target, None, resource_id)])
+        return moves
+
+    def _regenerate_move(self, poor: int):
+        """poor 수도 반경의 빈/수확량 없는 타일 하나에 지형에 맞는 자원을 새로 만드는 변경 (없으면 None)"""
+        for q, r in self._regenerate_targets(poor):
+            resource_id = self._new_resource_for(q, r)
+            if resource_id:
+                return [((q, r), self.game_map.resource_id(q, r), resource_id)]
+        return None
+
+    def _apply(self, move, undo: bool = False):
+        for (q, r), before, after in move:
+            self.game_map.set_resource(q, r, before if undo else after)
+
+    def balance(self, threshold: float, time_budget_seconds: float, max_adjustments: Optional[int] = None) -> StartBalanceReport:
+        """총 수확량 지니 계수가 threshold 이하가 될 때까지 가장 가난한 수도 반경으로 자원을 옮기거나 새로 만듦
+
+        각 단계에서 지니 계수를 가장 많이 줄이는 변경 하나만 반영하며, 줄어드는 변경이 없거나
+        최대 변경 수/시간 예산에 도달하면 멈춥니다. 난수를 쓰지 않으므로 같은 맵에서는 같은 결과가 나옵니다.
+        """
+        started = time.perf_counter()
+        deadline = started + time_budget_seconds
+        if max_adjustments is None:
+            max_adjustments = 4 * len(self.capital_coords)
+
+        adjustments = 0
+        current = gini(self.measure()[0].sum(axis=1))
+        while current > threshold and adjustments < max_adjustments and len(self.capital_coords) > 1:
+            if time.perf_counter() > deadline:
+                logger.warning(f"시작 위치 균형 조정이 시간 예산({time_budget_seconds}초)을 초과하여 중단합니다.")
+                break
+            totals = self.measure()[0].sum(axis=1)
+            poor = int(np.argmin(totals))
+            # 가장 부유한 수도부터 가장 가난한 수도보다 부유한 모든 수도를 자원 출처 후보로 사용
+            richer = [int(i) for i in np.argsort(-totals, kind="stable") if totals[i] > totals[poor]]
+            moves = [move for rich in richer for move in self._candidate_moves(rich, poor)]
+            # 옮길 자원이 없거나 옮겨도 줄지 않을 때를 위해 가난한 수도 반경에 자원을 새로 만드는 변경도 후보에 포함
+            regenerate = self._regenerate_move(poor)
+            if regenerate:
+                moves.append(regenerate)
+
+            best_move, best_value = None, current
+            for move in moves:
+                self._apply(move)
+                value = gini(self.measure()[0].sum(axis=1))
+                self._apply(move, undo=True)
+                if value < best_value - 1e-9:
+                    best_move, best_value = move, value
+            if best_move is None:
+                break
+            self._apply(best_move)
+            current = best_value
+            adjustments += 1
+
+        return self.report(threshold, adjustments, (time.perf_counter() - started) * 1000)
+
+
+def balance_starts(
+    game_map: GeneratedMap,
+    capital_coords: List[HexCoord],
+    threshold: float,
+    time_budget_seconds: float,
+    terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+    resource_types: Optional[Dict[str, str]] = None
+) -> StartBalanceReport:
+    """수도별 시작 수확량 편차를 threshold 이하로 맞추도록 자원 조정 후 지표 반환 (메모리 맵에 기록)"""
+    balancer = StartBalancer(game_map, capital_coords, terrain_yields, resource_types)
+    return balancer.balance(threshold, time_budget_seconds)
@@ -0,0 +1,268 @@
+import logging
+import random
+import time
+from typing import Dict, List, Optional, Set, Tuple
+import numpy as np
+from core.config import settings
+from utils.map_generator import GeneratedMap, NO_RESOURCE, terrain_yield_table
+from utils.map_utils import far_enough_mask, hex_distance_matrix, hex_radius_sum, min_hex_distance, radius_offsets
+from utils.landmass import Landmasses, label_landmasses
+
+logger = logging.getLogger(__name__)
+
+# 헥스 좌표 저장을 위한 튜플 타입
+HexCoord = Tuple[int, int, int]
+
+# 시작 위치로 적합한 지형
+SUITABLE_START_TERRAINS = ["grassland", "plains"]
+
+# 도시 작업 반경 (부지 가치 계산 범위)
+CITY_RADIUS = 2
+
+# 부지 가치에서 자원 하나의 가중치 (지형 수확량 단위)
+RESOURCE_SITE_WEIGHT = 2
+
+# 부지 가치 편차 1당 감점 (수도 간 거리 타일 단위)
+FAIRNESS_WEIGHT = 0.5
+
+# 수도 간 최소 거리 하한 (플레이어 수도와 AI 수도 / AI 수도끼리) - 부지 가치 기준/공정성보다 우선
+MIN_PLAYER_CAPITAL_DISTANCE = 7
+MIN_AI_CAPITAL_DISTANCE = 5
+
+# 모든 수도를 놓을 수 없을 때 거리 하한을 완화하는 순서 - 플레이어 거리부터 AI 거리까지 줄인 뒤 둘을 함께 1칸씩
+# (7, 5), (6, 5), (5, 5), (4, 4), ..., (1, 1)
+SPACING_FLOOR_LEVELS: List[Tuple[int, int]] = [
+    (player_floor, min(MIN_AI_CAPITAL_DISTANCE, player_floor))
+    for player_floor in range(MIN_PLAYER_CAPITAL_DISTANCE, 0, -1)
+]
+
+# AI 수도 후보로 쓰는 부지 가치 하한 분위 (하위 절반 제외)
+SITE_VALUE_FLOOR_QUANTILE = 0.5
+
+# AI 수도를 둘 수 있는 최소 대륙 크기 (도시 반경 타일 수 - 이보다 작은 섬은 제외)
+MIN_START_LANDMASS_SIZE = len(radius_offsets(CITY_RADIUS))
+
+# 수도 재배치 개선 최대 반복 수 (결정론적 상한 - 안전용 시간 예산은 settings.START_PLACEMENT_TIME_BUDGET_MS)
+PLACEMENT_MAX_ITERATIONS = 8
+
+# 시작 위치 주변 자원 밀도를 세는 헥스 반경 / 자원이 풍부하다고 보는 최소 자원 수
+RESOURCE_DENSITY_RADIUS = 2
+MIN_NEARBY_RESOURCES = 2
+
+
+class StartPositionError(ValueError):
+    """시작 위치로 쓸 수 있는 타일이 없는 경우"""
+
+
+def site_values(
+    game_map: GeneratedMap,
+    terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+    radius: int = CITY_RADIUS
+) -> np.ndarray:
+    """각 타일을 수도로 삼았을 때의 부지 가치 (width, height) - 반경 내 지형 수확량 합 + 자원 가중치 x 자원 수"""
+    tile_yields = terrain_yield_table(terrain_yields).sum(axis=1)[game_map.terrain]
+    has_resource = (game_map.resource != NO_RESOURCE).astype(np.int32)
+    return hex_radius_sum(tile_yields + RESOURCE_SITE_WEIGHT * has_resource, radius).astype(np.float64)
+
+
+def resource_density(game_map: GeneratedMap, radius: int = RESOURCE_DENSITY_RADIUS) -> np.ndarray:
+    """각 타일의 헥스 반경 radius 이내 자원 타일 수 (width, height)"""
+    return hex_radius_sum((game_map.resource != NO_RESOURCE).astype(np.int32), radius)
+
+
+class StartPositionSolver:
+    """맵을 한 번 읽어 모든 문명의 시작 위치를 결정하는 메모리 내 탐색기
+
+    적합 지형 후보와 후보별 주변 자원 밀도/부지 가치(헥스 반경 합)를 처음에 한 번만 계산하고,
+    이후 플레이어/AI 위치 선택은 후보 배열에 대한 배열 연산으로만 수행합니다.
+    """
+
+    def __init__(
+        self,
+        game_map: GeneratedMap,
+        terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+        landmasses: Optional[Landmasses] = None
+    ):
+        self.game_map = game_map
+        suitable_mask = game_map.terrain_mask(SUITABLE_START_TERRAINS)
+        # 후보는 q, r 오름차순 (기존 탐색 순서 유지)
+        self.candidates = np.argwhere(suitable_mask)
+        self.candidate_coords: List[HexCoord] = game_map.coords(suitable_mask)
+        self.density = resource_density(game_map)[suitable_mask]
+
+        # 부지 가치: 도시 반경 내 지형 수확량 합 + 자원 가중치 x 자원 수
+        self.site_value_grid = site_values(game_map, terrain_yields)
+        self.site_value = self.site_value_grid[suitable_mask]
+        # 부지 가치 하위 후보와 도시 하나도 감당하지 못하는 작은 섬은 AI 수도로 우선 고려하지 않음
+        self.landmasses = landmasses if landmasses is not None else label_landmasses(game_map)
+        floor = np.quantile(self.site_value, SITE_VALUE_FLOOR_QUANTILE) if len(self.site_value) else 0.0
+        self.eligible = (
+            (self.site_value >= floor)
+            & (self.landmasses.continent_size_grid()[suitable_mask] >= MIN_START_LANDMASS_SIZE)
+        )
+
+    def _coord(self, index: int) -> HexCoord:
+        return self.candidate_coords[index]
+
+    def find_starting_position(self, occupied_positions: Set[HexCoord], min_distance: int = 5) -> HexCoord:
+        """적합한 시작 위치 찾기 (이미 점유된 위치와 일정 거리 이상 떨어진 위치)"""
+        if not self.candidate_coords:
+            raise StartPositionError("적합한 시작 위치를 찾을 수 없습니다.")
+
+        far_mask = far_enough_mask(self.candidates, list(occupied_positions), min_distance)
+
+        # 적합한 위치 중 이미 점유된 위치와 일정 거리 이상 떨어지고 근처에 자원이 있는 위치 우선
+        rich_indices = np.flatnonzero(far_mask & (self.density >= MIN_NEARBY_RESOURCES))
+        if len(rich_indices):
+            return self._coord(rich_indices[0])
+
+        # 자원 주변 위치를 찾지 못했다면, 기본 조건만 만족하는 위치 반환
+        far_indices = np.flatnonzero(far_mask)
+        if len(far_indices):
+            return self._coord(far_indices[0])
+
+        # 최소 거리 조건을 만족하는 위치가 없다면, 그냥 아무 적합한 위치 반환
+        return random.choice(self.candidate_coords)
+
+    def find_player_start(self) -> HexCoord:
+        """플레이어 시작 위치 - 맵 왼쪽 상단 영역에서 주변 자원이 가장 많은 타일 (같으면 앞선 후보)"""
+        left_upper = (
+            (self.candidates[:, 0] <= self.game_map.width // 3)
+            & (self.candidates[:, 1] <= self.game_map.height // 3)
+        )
+        if not left_upper.any():
+            # 왼쪽 상단에 적합한 타일이 없으면 일반적인 방법으로 시작 위치 찾기
+            return self.find_starting_position(set())
+
+        return self._coord(int(np.argmax(np.where(left_upper, self.density, -1))))
+
+    def _min_distance_to(self, capitals: List[int], exclude: Optional[int] = None) -> np.ndarray:
+        """모든 후보에서 capitals (후보 인덱스, exclude 제외) 중 가장 가까운 수도까지의 거리"""
+        others = [index for index in capitals if index != exclude]
+        return min_hex_distance(self.candidates, self.candidates[others])
+
+    def _objective(self, capitals: List[int]) -> float:
+        """배치 목표값 (클수록 좋음) = 수도 간 최소 거리 - FAIRNESS_WEIGHT x 부지 가치 평균 편차"""
+        coords = self.candidates[capitals]
+        distances = hex_distance_matrix(coords, coords)
+        np.fill_diagonal(distances, np.iinfo(np.int32).max)
+        values = self.site_value[capitals]
+        return float(distances.min()) - FAIRNESS_WEIGHT * float(np.abs(values - values.mean()).mean())
+
+    def _best_site(
+        self,
+        capitals: List[int],
+        target_value: float,
+        floors: Tuple[int, int],
+        exclude: Optional[int] = None,
+        spread_only: bool = False
+    ) -> Optional[int]:
+        """거리 하한 floors (플레이어 수도까지, 다른 AI 수도까지)를 지키는 후보 중
+        다른 수도와의 최소 거리가 크고 부지 가치가 target_value에 가까운 후보 (동점이면 앞선 후보, 없으면 None)
+
+        거리 하한이 부지 가치 기준(eligible)보다 우선하며, 하한 안에 기준을 만족하는 후보가 있을 때만 그 안에서 고릅니다.
+        spread_only이면 부지 가치 기준과 공정성을 무시하고 거리만 봅니다 (순수 최원점 샘플링).
+        """
+        player_floor, ai_floor = floors
+        allowed = (
+            (min_hex_distance(self.candidates, self.candidates[capitals[:1]]) >= player_floor)
+            & (self._min_distance_to(capitals[1:], exclude) >= ai_floor)
+        )
+        allowed[[index for index in capitals if index != exclude]] = False
+        if not allowed.any():
+            return None
+        score = self._min_distance_to(capitals, exclude).astype(np.float64)
+        if not spread_only:
+            if (allowed & self.eligible).any():
+                allowed &= self.eligible
+            score -= FAIRNESS_WEIGHT * np.abs(self.site_value - target_value)
+        return int(np.argmax(np.where(allowed, score, -np.inf)))
+
+    def _place_ai_capitals(
+        self,
+        player_index: int,
+        count: int,
+        floors: Tuple[int, int],
+        spread_only: bool = False
+    ) -> Optional[List[int]]:
+        """거리 하한 floors로 최원점 샘플링 - 모든 수도를 놓지 못하면 None"""
+        target_value = float(self.site_value[player_index])
+        capitals = [player_index]
+        for _ in range(1, count):
+            site = self._best_site(capitals, target_value, floors, spread_only=spread_only)
+            if site is None:
+                return None
+            capitals.append(site)
+        return capitals
+
+    def place_capitals(self, civ_count: int, time_budget_seconds: float) -> List[HexCoord]:
+        """모든 문명의 수도 위치를 한 번에 결정 (0번은 플레이어)
+
+        1. 플레이어 수도는 왼쪽 상단 영역에서 고정
+        2. AI 수도는 최원점 샘플링 (이미 놓인 수도들과의 최소 거리가 가장 큰 후보, 부지 가치가 플레이어와 비슷할수록 우대)
+           - 거리 하한(SPACING_FLOOR_LEVELS)을 모든 수도가 지킬 수 있는 가장 엄격한 단계에서 배치
+             (부지 가치/공정성을 고려한 배치가 실패하면 같은 단계에서 순수 최원점 샘플링을 시도한 뒤 완화)
+        3. 같은 거리 하한 안에서 수도를 하나씩 다시 놓아 보며 목표값(최소 거리 - 공정성 편차)이 좋아지는 경우만 반영
+           (최대 반복 수/시간 예산 내)
+
+        난수를 쓰지 않으므로 같은 맵(= 같은 시드)에서는 항상 같은 결과가 나옵니다.
+        """
+        player_capital = self.find_player_start()
+        if civ_count <= 1 or not self.candidate_coords:
+            return [player_capital]
+
+        player_index = self._index_of(player_capital)
+        if player_index is None:
+            # 플레이어 수도가 후보 밖(전체 맵에 적합 지형 없음)이면 AI 배치 불가
+            return [player_capital]
+
+        # 마지막 단계 (1, 1)은 빈 후보만 있으면 항상 성공
+        count = min(civ_count, len(self.candidate_coords))
+        capitals = None
+        for floors in SPACING_FLOOR_LEVELS:
+            capitals = (
+                self._place_ai_capitals(player_index, count, floors)
+                or self._place_ai_capitals(player_index, count, floors, spread_only=True)
+            )
+            if capitals is not None:
+                break
+
+        # 최대-최소 반복 개선 (플레이어 수도는 고정)
+        deadline = time.perf_counter() + time_budget_seconds
+        objective = self._objective(capitals)
+        for _ in range(PLACEMENT_MAX_ITERATIONS):
+            improved = False
+            for slot in range(1, len(capitals)):
+                if time.perf_counter() > deadline:
+                    logger.warning(f"수도 배치 개선이 시간 예산({time_budget_seconds}초)을 초과하여 중단합니다.")
+                    return [self._coord(index) for index in capitals]
+                others_value = float(np.delete(self.site_value[capitals], slot).mean())
+                candidate = self._best_site(capitals, others_value, floors, exclude=capitals[slot])
+                if candidate is None or candidate == capitals[slot]:
+                    continue
+                trial = capitals[:slot] + [candidate] + capitals[slot + 1:]
+                trial_objective = self._objective(trial)
+                if trial_objective > objective + 1e-9:
+                    capitals, objective = trial, trial_objective
+                    improved = True
+            if not improved:
+                break
+
+        return [self._coord(index) for index in capitals]
+
+    def _index_of(self, coord: HexCoord) -> Optional[int]:
+        matches = np.flatnonzero((self.candidates[:, 0] == coord[0]) & (self.candidates[:, 1] == coord[1]))
+        return int(matches[0]) if len(matches) else None
+
+
+def place_capitals(
+    game_map: GeneratedMap,
+    civ_count: int,
+    terrain_yields: Optional[Dict[str, Dict[str, int]]] = None,
+    landmasses: Optional[Landmasses] = None,
+    time_budget_seconds: Optional[float] = None
+) -> List[HexCoord]:
+    """모든 문명의 수도 위치 결정 (0번은 플레이어, 시간 예산 기본값은 settings.START_PLACEMENT_TIME_BUDGET_MS)"""
+    if time_budget_seconds is None:
+        time_budget_seconds = settings.START_PLACEMENT_TIME_BUDGET_MS / 1000
+    return StartPositionSolver(game_map, terrain_yields, landmasses).place_capitals(civ_count, time_budget_seconds)
@@ -0,0 +1,145 @@
+from typing import Any, Dict, Optional, Tuple
+from cachetools import LRUCache
+from core.config import settings
+from models.hexmap import TileStore
+from utils.state_snapshot import (
+    SnapshotFormatError, apply_tile_delta, decode_state_parts, encode_tile_delta,
+    encode_tile_store, is_delta, same_tile_layout
+)
+
+# (타일 저장소, 타일 외 상태) - 캐시에 보관되므로 호출자는 변경하지 않아야 함
+TurnState = Tuple[TileStore, Dict[str, Any]]
+
+
+class TurnStateHistory:
+    """키프레임 + 턴 변경분으로 저장된 GameState 행에서 임의 턴 상태를 복원
+
+    STATE_KEYFRAME_INTERVAL 턴마다 전체 스냅샷(키프레임)을 저장하고 그 사이 턴은 이전 턴 대비 변경분만 저장합니다.
+    복원한 턴은 LRU에 보관하므로 연속된 턴을 조회할 때는 변경분 하나만 적용하면 됩니다.
+    """
+
+    def __init__(self, keyframe_interval: int, max_entries: int):
+        self.keyframe_interval = max(1, keyframe_interval)
+        self._cache: LRUCache = LRUCache(maxsize=max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.applied_deltas = 0
+
+    def is_keyframe_turn(self, turn: int) -> bool:
+        """키프레임으로 저장할 턴 (1, 1 + K, 1 + 2K, ...)"""
+        return (turn - 1) % self.keyframe_interval == 0
+
+    def remember(self, game_id: str, turn: int, state: TurnState):
+        self._cache[(game_id, turn)] = state
+
+    def forget_game(self, game_id: str):
+        for key in [key for key in self._cache.keys() if key[0] == game_id]:
+            self._cache.pop(key, None)
+
+    def encode(
+        self,
+        turn: int,
+        state: TurnState,
+        previous: Optional[TurnState] = None,
+        keyframe_turn: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """턴 상태를 stateData 값으로 인코딩
+
+        키프레임 턴이거나 이전 턴(turn - 1) 상태가 없으면 전체 스냅샷, 아니면 이전 턴 대비 변경분으로 저장합니다.
+        """
+        store, meta = state
+        if (
+            previous is None
+            or keyframe_turn is None
+            or self.is_keyframe_turn(turn)
+            or not same_tile_layout(previous[0], store)
+        ):
+            return encode_tile_store(store, meta)
+        return encode_tile_delta(previous[0], previous[1], store, meta, turn - 1, keyframe_turn)
+
+    async def load(self, db, game_id: str, turn: int, row=None) -> Optional[TurnState]:
+        """턴 상태 복원 (행이 없으면 None) - 이미 조회한 GameState 행이 있으면 row로 전달
+
+        변경분 행이면 가장 가까운 캐시된 이전 턴(없으면 키프레임)부터 필요한 행만 한 번에 읽어 순서대로 적용합니다.
+        """
+        cached = self._cache.get((game_id, turn))
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        if row is None:
+            row = await self._find_row(db, game_id, turn)
+        if row is None:
+            return None
+        if not is_delta(row.stateData):
+            state = decode_state_parts(row.stateData)
+            self.remember(game_id, turn, state)
+            return state
+
+        # 키프레임 ~ 요청 턴 사이에서 가장 늦은 캐시된 턴부터 시작
+        keyframe_turn = row.stateData["keyframe_turn"]
+        start_turn = keyframe_turn
+        state = None
+        for candidate in range(turn - 1, keyframe_turn - 1, -1):
+            state = self._cache.get((game_id, candidate))
+            if state is not None:
+                start_turn = candidate
+                break
+
+        rows = await db.gamestate.find_many(
+            where={
+                "gameId": game_id,
+                "turn": {"gte": start_turn if state is None else start_turn + 1, "lt": turn}
+            }
+        )
+        # 버전 호환성 문제로 order_by 대신 프로그램에서 정렬 (같은 턴이 여러 행이면 마지막 행 사용)
+        rows_by_turn = {r.turn: r for r in sorted(rows, key=lambda r: (r.turn, r.id))}
+        rows_by_turn[turn] = row
+
+        if state is None:
+            keyframe_row = rows_by_turn.get(keyframe_turn)
+            if keyframe_row is None:
+                raise SnapshotFormatError(f"{game_id} 턴 {keyframe_turn} 키프레임이 없습니다.")
+            state = decode_state_parts(keyframe_row.stateData)
+            self.remember(game_id, keyframe_turn, state)
+
+        for current in range(start_turn + 1, turn + 1):
+            delta_row = rows_by_turn.get(current)
+            if delta_row is None:
+                raise SnapshotFormatError(f"{game_id} 턴 {current} 상태가 없어 복원할 수 없습니다.")
+            if is_delta(delta_row.stateData):
+                state = apply_tile_delta(state[0], state[1], delta_row.stateData)
+                self.applied_deltas += 1
+            else:
+                state = decode_state_parts(delta_row.stateData)
+            self.remember(game_id, current, state)
+        return state
+
+    async def _find_row(self, db, game_id: str, turn: int):
+        rows = await db.gamestate.find_many(where={"gameId": game_id, "turn": turn})
+        return max(rows, key=lambda r: r.id) if rows else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._cache),
+            "keyframe_interval": self.keyframe_interval,
+            "hits": self.hits,
+            "misses": self.misses,
+            "applied_deltas": self.applied_deltas
+        }
+
+
+def keyframe_turn_for(state_value: Any, turn: int) -> int:
+    """turn의 stateData 값이 의존하는 키프레임 턴 (키프레임이면 turn 자신)"""
+    return state_value["keyframe_turn"] if is_delta(state_value) else turn
+
+
+def to_state_data(state: TurnState) -> Dict[str, Any]:
+    """복원한 턴 상태를 프론트엔드가 쓰는 기존 JSON 형태로 변환"""
+    store, meta = state
+    return {"tiles": store.to_dicts(), **meta}
+
+
+# 전역 턴 상태 기록 인스턴스
+turn_state_history = TurnStateHistory(settings.STATE_KEYFRAME_INTERVAL, settings.STATE_HISTORY_CACHE_SIZE)
@@ -0,0 +1,373 @@
+import base64
+import io
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+import zstandard
+from models.hexmap import (
+    GameMapState, TileStore, TERRAIN_CODES, RESOURCE_CODES,
+    TERRAIN_CODE_INDEX, RESOURCE_CODE_INDEX, NO_RESOURCE_CODE, SPARSE_TILE_FIELDS
+)
+
+# GameState.stateData 압축 스냅샷 형식
+#   {"format": "civ-snapshot", "version": 1, "codec": "npz+zstd", "tile_count": n, "payload": base64}
+#   payload는 타일 배열(npz)을 zstd로 압축한 것이며, 타일 외 상태(civs, turn 등)는 헤더 JSON에 들어갑니다.
+SNAPSHOT_FORMAT = "civ-snapshot"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_CODEC = "npz+zstd"
+SNAPSHOT_ZSTD_LEVEL = 3
+
+_compressor = zstandard.ZstdCompressor(level=SNAPSHOT_ZSTD_LEVEL)
+_decompressor = zstandard.ZstdDecompressor()
+
+
+# 키프레임 사이 턴의 변경분 형식 (base_turn 상태에 적용)
+#   {"format": "civ-snapshot-delta", "version": 1, "codec": "npz+zstd",
+#    "base_turn": t - 1, "keyframe_turn": k, "tile_count": n, "changed_tiles": m, "payload": base64}
+DELTA_FORMAT = "civ-snapshot-delta"
+
+
+class SnapshotFormatError(ValueError):
+    """지원하지 않거나 손상된 스냅샷"""
+
+
+def is_snapshot(value: Any) -> bool:
+    """stateData 값이 압축 스냅샷인지 여부 (아니면 기존 JSON 형태)"""
+    return isinstance(value, dict) and value.get("format") == SNAPSHOT_FORMAT
+
+
+def is_delta(value: Any) -> bool:
+    """stateData 값이 턴 변경분인지 여부"""
+    return isinstance(value, dict) and value.get("format") == DELTA_FORMAT
+
+
+def _pack(arrays: Dict[str, np.ndarray]) -> str:
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return base64.b64encode(_compressor.compress(buffer.getvalue())).decode("ascii")
+
+
+def _unpack(value: Dict[str, Any]) -> Tuple[Any, Dict[str, Any]]:
+    """payload를 (npz 배열, 헤더)로 읽음"""
+    if value.get("version", 0) > SNAPSHOT_VERSION or value.get("codec") != SNAPSHOT_CODEC:
+        raise SnapshotFormatError(
+            f"지원하지 않는 스냅샷입니다: version={value.get('version')}, codec={value.get('codec')}"
+        )
+    try:
+        raw = _decompressor.decompress(base64.b64decode(value["payload"]))
+        arrays = np.load(io.BytesIO(raw))
+        header = json.loads(arrays["header"].tobytes().decode("utf-8"))
+    except Exception as e:
+        raise SnapshotFormatError(f"스냅샷 payload를 읽을 수 없습니다: {str(e)}") from e
+    return arrays, header
+
+
+def _header_array(header: Dict[str, Any]) -> np.ndarray:
+    return np.frombuffer(json.dumps(header, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+
+
+def _grid_shape(store: TileStore) -> Optional[Tuple[int, int]]:
+    """타일이 (0, 0)부터 q, r 순서로 빈틈없이 나열된 격자면 (width, height) - 좌표 배열 저장 생략"""
+    if len(store) == 0 or store.q.min() != 0 or store.r.min() != 0:
+        return None
+    width, height = int(store.q.max()) + 1, int(store.r.max()) + 1
+    if width * height != len(store):
+        return None
+    if not np.array_equal(store.r, np.tile(np.arange(height, dtype=np.int32), width)):
+        return None
+    if not np.array_equal(store.q, np.repeat(np.arange(width, dtype=np.int32), height)):
+        return None
+    return width, height
+
+
+def encode_tile_store(store: TileStore, meta: Dict[str, Any]) -> Dict[str, Any]:
+    """TileStore와 나머지 상태(meta)를 압축 스냅샷으로 인코딩"""
+    # 점유자/도시/유닛 ID는 문자열 테이블 인덱스로 저장
+    strings: List[str] = []
+    string_index: Dict[str, int] = {}
+    sparse_field, sparse_index, sparse_value = [], [], []
+    for field_code, field in enumerate(SPARSE_TILE_FIELDS):
+        for index, value in sorted(store.sparse_values(field).items()):
+            if value not in string_index:
+                string_index[value] = len(strings)
+                strings.append(value)
+            sparse_field.append(field_code)
+            sparse_index.append(index)
+            sparse_value.append(string_index[value])
+
+    grid = _grid_shape(store)
+    header = {
+        "count": len(store),
+        "grid": list(grid) if grid else None,
+        "terrain_table": [terrain.value for terrain in TERRAIN_CODES],
+        "resource_table": [resource.value for resource in RESOURCE_CODES],
+        "sparse_fields": list(SPARSE_TILE_FIELDS),
+        "strings": strings,
+        "meta": meta
+    }
+    arrays = {
+        "header": _header_array(header),
+        "terrain": store.terrain,
+        "resource": store.resource,
+        "visible": np.packbits(store.visible),
+        "explored": np.packbits(store.explored),
+        "sparse_field": np.array(sparse_field, dtype=np.int8),
+        "sparse_index": np.array(sparse_index, dtype=np.int32),
+        "sparse_value": np.array(sparse_value, dtype=np.int32)
+    }
+    if grid is None:
+        arrays["q"] = store.q
+        arrays["r"] = store.r
+
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "codec": SNAPSHOT_CODEC,
+        "tile_count": len(store),
+        "payload": _pack(arrays)
+    }
+
+
+def encode_state(state: Union[GameMapState, Dict[str, Any]]) -> Dict[str, Any]:
+    """GameMapState 또는 기존 JSON 형태의 stateData를 압축 스냅샷으로 인코딩"""
+    if isinstance(state, GameMapState):
+        return encode_tile_store(state.tiles, state.model_dump(mode="json", exclude={"tiles"}))
+    if is_snapshot(state):
+        return state
+    meta = {key: value for key, value in state.items() if key != "tiles"}
+    return encode_tile_store(TileStore.validate(state.get("tiles", [])), meta)
+
+
+def dumps_state(state: Union[GameMapState, Dict[str, Any]]) -> str:
+    """GameState.stateData 컬럼에 쓸 JSON 문자열"""
+    return json.dumps(encode_state(state))
+
+
+def _remap_codes(codes: np.ndarray, table: List[str], index: Dict[Any, int]) -> np.ndarray:
+    """스냅샷에 기록된 코드 테이블 기준 코드를 현재 enum 순서의 코드로 변환 (-1은 유지)"""
+    lookup = np.array([index[value] for value in table] or [NO_RESOURCE_CODE], dtype=np.int8)
+    return np.where(codes < 0, NO_RESOURCE_CODE, lookup[np.clip(codes, 0, None)]).astype(np.int8)
+
+
+def decode_tile_store(snapshot: Dict[str, Any]) -> Tuple[TileStore, Dict[str, Any]]:
+    """압축 스냅샷을 (TileStore, 나머지 상태)로 디코딩"""
+    if not is_snapshot(snapshot):
+        raise SnapshotFormatError("압축 스냅샷 형식이 아닙니다.")
+    arrays, header = _unpack(snapshot)
+
+    count = header["count"]
+    if header["grid"]:
+        width, height = header["grid"]
+        q = np.repeat(np.arange(width, dtype=np.int32), height)
+        r = np.tile(np.arange(height, dtype=np.int32), width)
+    else:
+        q, r = arrays["q"], arrays["r"]
+
+    sparse: Dict[str, Dict[int, str]] = {field: {} for field in SPARSE_TILE_FIELDS}
+    strings = header["strings"]
+    for field_code, index, value in zip(
+        arrays["sparse_field"].tolist(), arrays["sparse_index"].tolist(), arrays["sparse_value"].tolist()
+    ):
+        sparse[header["sparse_fields"][field_code]][index] = strings[value]
+
+    store = TileStore(
+        q=q,
+        r=r,
+        terrain=_remap_codes(arrays["terrain"], header["terrain_table"], TERRAIN_CODE_INDEX),
+        resource=_remap_codes(arrays["resource"], header["resource_table"], RESOURCE_CODE_INDEX),
+        visible=np.unpackbits(arrays["visible"], count=count).astype(bool),
+        explored=np.unpackbits(arrays["explored"], count=count).astype(bool),
+        **sparse
+    )
+    return store, header["meta"]
+
+
+def same_tile_layout(a: TileStore, b: TileStore) -> bool:
+    """두 저장소의 타일 좌표/순서가 같은지 (변경분 인코딩 가능 여부)"""
+    return len(a) == len(b) and np.array_equal(a.q, b.q) and np.array_equal(a.r, b.r)
+
+
+def _diff_meta(base_meta: Dict[str, Any], meta: Dict[str, Any]) -> Dict[str, Any]:
+    """타일 외 상태 변경분 - 리스트(civs 등)는 바뀐 항목만, 나머지는 값 전체"""
+    changes: Dict[str, Any] = {"set": {}, "removed": [], "lists": {}}
+    for key, value in meta.items():
+        base_value = base_meta.get(key)
+        if key in base_meta and base_value == value:
+            continue
+        if isinstance(value, list) and isinstance(base_value, list):
+            changes["lists"][key] = {
+                "length": len(value),
+                "items": {
+                    str(i): item for i, item in enumerate(value)
+                    if i >= len(base_value) or base_value[i] != item
+                }
+            }
+        else:
+            changes["set"][key] = value
+    changes["removed"] = [key for key in base_meta if key not in meta]
+    return changes
+
+
+def _apply_meta(base_meta: Dict[str, Any], changes: Dict[str, Any]) -> Dict[str, Any]:
+    meta = {key: value for key, value in base_meta.items() if key not in changes["removed"]}
+    for key, list_change in changes["lists"].items():
+        items = list(base_meta.get(key) or [])[:list_change["length"]]
+        items.extend([None] * (list_change["length"] - len(items)))
+        for i, item in list_change["items"].items():
+            items[int(i)] = item
+        meta[key] = items
+    meta.update(changes["set"])
+    return meta
+
+
+def encode_tile_delta(
+    base_store: TileStore,
+    base_meta: Dict[str, Any],
+    store: TileStore,
+    meta: Dict[str, Any],
+    base_turn: int,
+    keyframe_turn: int
+) -> Dict[str, Any]:
+    """base_turn 상태 대비 바뀐 타일/문명 정보만 담은 변경분 (타일 배치가 같아야 함)"""
+    if not same_tile_layout(base_store, store):
+        raise SnapshotFormatError("타일 배치가 달라 변경분으로 저장할 수 없습니다.")
+
+    visible, explored = store.visible, store.explored
+    changed = (
+        (base_store.terrain != store.terrain)
+        | (base_store.resource != store.resource)
+        | (base_store.visible != visible)
+        | (base_store.explored != explored)
+    )
+    index = np.flatnonzero(changed).astype(np.int32)
+
+    # 희소 문자열 필드는 바뀐 인덱스만 (값 -1은 삭제)
+    strings: List[str] = []
+    string_index: Dict[str, int] = {}
+    sparse_field, sparse_index, sparse_value = [], [], []
+    for field_code, field in enumerate(SPARSE_TILE_FIELDS):
+        before, after = base_store.sparse_values(field), store.sparse_values(field)
+        for tile_index in sorted(set(before) | set(after)):
+            value = after.get(tile_index)
+            if before.get(tile_index) == value:
+                continue
+            if value is not None and value not in string_index:
+                string_index[value] = len(strings)
+                strings.append(value)
+            sparse_field.append(field_code)
+            sparse_index.append(tile_index)
+            sparse_value.append(-1 if value is None else string_index[value])
+
+    header = {
+        "count": len(store),
+        "terrain_table": [terrain.value for terrain in TERRAIN_CODES],
+        "resource_table": [resource.value for resource in RESOURCE_CODES],
+        "sparse_fields": list(SPARSE_TILE_FIELDS),
+        "strings": strings,
+        "meta": _diff_meta(base_meta, meta)
+    }
+    arrays = {
+        "header": _header_array(header),
+        "index": index,
+        "terrain": store.terrain[index],
+        "resource": store.resource[index],
+        "visible": visible[index],
+        "explored": explored[index],
+        "sparse_field": np.array(sparse_field, dtype=np.int8),
+        "sparse_index": np.array(sparse_index, dtype=np.int32),
+        "sparse_value": np.array(sparse_value, dtype=np.int32)
+    }
+    return {
+        "format": DELTA_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "codec": SNAPSHOT_CODEC,
+        "base_turn": base_turn,
+        "keyframe_turn": keyframe_turn,
+        "tile_count": len(store),
+        "changed_tiles": int(index.size),
+        "payload": _pack(arrays)
+    }
+
+
+def apply_tile_delta(
+    base_store: TileStore,
+    base_meta: Dict[str, Any],
+    delta: Dict[str, Any]
+) -> Tuple[TileStore, Dict[str, Any]]:
+    """base 상태에 변경분을 적용한 새 (TileStore, 나머지 상태) - base는 변경하지 않음"""
+    if not is_delta(delta):
+        raise SnapshotFormatError("턴 변경분 형식이 아닙니다.")
+    arrays, header = _unpack(delta)
+    if header["count"] != len(base_store):
+        raise SnapshotFormatError(
+            f"변경분 타일 수({header['count']})가 기준 상태({len(base_store)})와 다릅니다."
+        )
+
+    index = arrays["index"]
+    terrain = base_store.terrain.copy()
+    resource = base_store.resource.copy()
+    visible = base_store.visible
+    explored = base_store.explored
+    terrain[index] = _remap_codes(arrays["terrain"], header["terrain_table"], TERRAIN_CODE_INDEX)
+    resource[index] = _remap_codes(arrays["resource"], header["resource_table"], RESOURCE_CODE_INDEX)
+    visible[index] = arrays["visible"]
+    explored[index] = arrays["explored"]
+
+    sparse = {field: base_store.sparse_values(field) for field in SPARSE_TILE_FIELDS}
+    strings = header["strings"]
+    for field_code, tile_index, value in zip(
+        arrays["sparse_field"].tolist(), arrays["sparse_index"].tolist(), arrays["sparse_value"].tolist()
+    ):
+        values = sparse[header["sparse_fields"][field_code]]
+        if value < 0:
+            values.pop(tile_index, None)
+        else:
+            values[tile_index] = strings[value]
+
+    store = TileStore(
+        q=base_store.q,
+        r=base_store.r,
+        terrain=terrain,
+        resource=resource,
+        visible=visible,
+        explored=explored,
+        **sparse
+    )
+    return store, _apply_meta(base_meta, header["meta"])
+
+
+def decode_state_parts(value: Any) -> Tuple[TileStore, Dict[str, Any]]:
+    """키프레임 stateData 값(압축 스냅샷 또는 기존 JSON)을 (TileStore, 나머지 상태)로 변환"""
+    if isinstance(value, str):
+        value = json.loads(value)
+    if is_delta(value):
+        raise SnapshotFormatError("턴 변경분은 이전 턴 상태가 필요합니다 (state_history.load_turn_state 사용).")
+    if is_snapshot(value):
+        return decode_tile_store(value)
+    meta = {key: item for key, item in value.items() if key != "tiles"}
+    return TileStore.validate(value.get("tiles", [])), meta
+
+
+def decode_state(value: Any) -> GameMapState:
+    """stateData 값(압축 스냅샷 또는 기존 JSON)을 GameMapState로 변환"""
+    if isinstance(value, str):
+        value = json.loads(value)
+    if is_snapshot(value):
+        store, meta = decode_tile_store(value)
+        return GameMapState(tiles=store, **meta)
+    return GameMapState(**value)
+
+
+def decode_state_data(value: Any) -> Dict[str, Any]:
+    """stateData 값을 프론트엔드가 쓰는 기존 JSON 형태(dict)로 변환
+
+    예전에 JSON 그대로 저장된 행은 그대로 반환하므로 두 형식이 섞여 있어도 동작합니다.
+    """
+    if isinstance(value, str):
+        value = json.loads(value)
+    if is_delta(value):
+        raise SnapshotFormatError("턴 변경분은 이전 턴 상태가 필요합니다 (state_history.load_turn_state 사용).")
+    if not is_snapshot(value):
+        return value
+    store, meta = decode_tile_store(value)
+    return {"tiles": store.to_dicts(), **meta}
@@ -0,0 +1,39 @@
+from typing import Callable, Dict, Iterable, Optional
+from core.config import settings
+from models.map import MapType
+from utils.map_generator import GeneratedMap, generate_terrain_grid
+from utils.terrain_noise import generate_noise_terrain
+
+# 지형 생성기 시그니처: (map_type, width, height, seed, available_resources) -> GeneratedMap
+TerrainEngine = Callable[[MapType, int, int, int, Optional[Iterable[str]]], GeneratedMap]
+
+TERRAIN_ENGINES: Dict[str, TerrainEngine] = {
+    "continent_seeds": generate_terrain_grid,
+    "noise": generate_noise_terrain,
+}
+
+# "auto"일 때 이 타일 수를 넘는 맵은 노이즈 생성기 사용
+NOISE_ENGINE_MIN_TILES = 1000
+
+
+def resolve_terrain_engine(width: int, height: int, engine: Optional[str] = None) -> str:
+    """사용할 지형 생성기 이름 결정 (기본값은 settings.TERRAIN_ENGINE)"""
+    engine = engine or settings.TERRAIN_ENGINE
+    if engine == "auto":
+        return "noise" if width * height > NOISE_ENGINE_MIN_TILES else "continent_seeds"
+    if engine not in TERRAIN_ENGINES:
+        raise ValueError(f"알 수 없는 지형 생성기입니다: {engine}")
+    return engine
+
+
+def generate_map_grid(
+    map_type: MapType,
+    width: int,
+    height: int,
+    seed: int,
+    available_resources: Optional[Iterable[str]] = None,
+    engine: Optional[str] = None
+) -> GeneratedMap:
+    """설정된 지형 생성기로 맵 그리드 생성"""
+    engine_name = resolve_terrain_engine(width, height, engine)
+    return TERRAIN_ENGINES[engine_name](map_type, width, height, seed, available_resources)
@@ -0,0 +1,180 @@
+import logging
+import time
+from typing import Dict, Iterable, Optional
+import numpy as np
+from models.map import MapType
+from utils.map_generator import GeneratedMap, TERRAIN_INDEX, roll_resources
+
+logger = logging.getLogger(__name__)
+
+# 256x160 맵 기준 목표 생성 시간 (더 큰 맵은 타일 수에 비례해 늘림 - 초과 시 경고)
+NOISE_TIME_BUDGET_MS = 200
+NOISE_BUDGET_TILES = 256 * 160
+
+# 헥스 축 좌표 -> 평면 좌표 변환 계수 (pointy-top 배치)
+SQRT3_HALF = np.float32(np.sqrt(3) / 2)
+
+# 맵 타입별 지형 형태 설정
+#   land_fraction: 전체 타일 중 육지 비율 (해수면은 고도 분위수로 결정)
+#   feature_size: 가장 큰 노이즈 격자 한 칸의 타일 수 (클수록 큰 대륙)
+#   shape: 고도에 더하는 형태 마스크 (none, center, ring, edges)
+#   shape_weight: 형태 마스크 가중치
+NOISE_MAP_SHAPES: Dict[str, Dict] = {
+    MapType.CONTINENTS.value: {"land_fraction": 0.40, "feature_size": 24, "shape": "edges", "shape_weight": 0.6},
+    MapType.PANGAEA.value: {"land_fraction": 0.50, "feature_size": 32, "shape": "center", "shape_weight": 1.2},
+    MapType.ARCHIPELAGO.value: {"land_fraction": 0.25, "feature_size": 8, "shape": "edges", "shape_weight": 0.4},
+    MapType.SMALL_CONTINENTS.value: {"land_fraction": 0.35, "feature_size": 14, "shape": "edges", "shape_weight": 0.5},
+    MapType.FRACTAL.value: {"land_fraction": 0.40, "feature_size": 20, "shape": "none", "shape_weight": 0.0},
+    MapType.TERRA.value: {"land_fraction": 0.40, "feature_size": 28, "shape": "edges", "shape_weight": 0.6},
+    MapType.TILTED_AXIS.value: {"land_fraction": 0.40, "feature_size": 24, "shape": "edges", "shape_weight": 0.6},
+    MapType.INLAND_SEA.value: {"land_fraction": 0.65, "feature_size": 24, "shape": "ring", "shape_weight": 1.5},
+    MapType.SHUFFLE.value: {"land_fraction": 0.40, "feature_size": 18, "shape": "none", "shape_weight": 0.0},
+    MapType.DONUT.value: {"land_fraction": 0.45, "feature_size": 20, "shape": "ring", "shape_weight": 1.2},
+}
+
+# 육지 중 산/언덕 비율 (고도 상위 분위)
+MOUNTAIN_FRACTION = 0.05
+HILLS_FRACTION = 0.12
+
+# 해안으로 분류할 해수면 아래 고도 폭 (바다 타일 중 비율)
+COAST_FRACTION = 0.30
+
+NOISE_OCTAVES = 4
+NOISE_PERSISTENCE = 0.5
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+
+def gradient_noise(x: np.ndarray, y: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """격자점마다 임의 기울기 벡터를 둔 2D 그래디언트(Perlin) 노이즈, 약 [-1, 1]"""
+    xi = np.floor(x).astype(np.intp)
+    yi = np.floor(y).astype(np.intp)
+    xf = (x - xi).astype(np.float32)
+    yf = (y - yi).astype(np.float32)
+
+    angles = rng.random((int(xi.max()) + 2, int(yi.max()) + 2), dtype=np.float32) * np.float32(2 * np.pi)
+    grad_x, grad_y = np.cos(angles), np.sin(angles)
+
+    def corner(dx: int, dy: int) -> np.ndarray:
+        return grad_x[xi + dx, yi + dy] * (xf - dx) + grad_y[xi + dx, yi + dy] * (yf - dy)
+
+    u, v = _fade(xf), _fade(yf)
+    bottom = corner(0, 0) + u * (corner(1, 0) - corner(0, 0))
+    top = corner(0, 1) + u * (corner(1, 1) - corner(0, 1))
+    return (bottom + v * (top - bottom)) * np.float32(np.sqrt(2))
+
+
+def fractal_noise(
+    x: np.ndarray,
+    y: np.ndarray,
+    rng: np.random.Generator,
+    feature_size: float,
+    octaves: int = NOISE_OCTAVES,
+    persistence: float = NOISE_PERSISTENCE
+) -> np.ndarray:
+    """여러 옥타브의 그래디언트 노이즈 합 (fBm), 진폭 합으로 정규화"""
+    total = np.zeros(x.shape, dtype=np.float32)
+    amplitude = 1.0
+    amplitude_sum = 0.0
+    frequency = 1.0 / feature_size
+    for _ in range(octaves):
+        total += np.float32(amplitude) * gradient_noise(x * frequency, y * frequency, rng)
+        amplitude_sum += amplitude
+        amplitude *= persistence
+        frequency *= 2
+    return total / np.float32(amplitude_sum)
+
+
+def shape_mask(shape: str, width: int, height: int) -> np.ndarray:
+    """맵 타입 형태를 만드는 고도 보정값 (width, height), 대략 [-1, 1]"""
+    if shape == "none":
+        return np.zeros((width, height), dtype=np.float32)
+
+    # 맵 중심으로부터의 정규화 거리 (0: 중심, 1: 가장자리)
+    nq = (np.arange(width, dtype=np.float32) + 0.5) / width * 2 - 1
+    nr = (np.arange(height, dtype=np.float32) + 0.5) / height * 2 - 1
+    distance = np.sqrt(nq[:, None] ** 2 + nr[None, :] ** 2) / np.float32(np.sqrt(2))
+
+    if shape == "center":
+        return 1 - 2 * distance
+    if shape == "ring":
+        # 중앙은 바다, 그 바깥 고리는 육지
+        return 1 - 4 * np.abs(distance - np.float32(0.55))
+    # edges: 맵 가장자리만 바다로 누름
+    edge = np.maximum(np.abs(nq)[:, None], np.abs(nr)[None, :])
+    return np.where(edge > 0.8, -(edge - 0.8) * 5, 0).astype(np.float32)
+
+
+def generate_noise_terrain(
+    map_type: MapType,
+    width: int,
+    height: int,
+    seed: int,
+    available_resources: Optional[Iterable[str]] = None
+) -> GeneratedMap:
+    """고도/습도/기온 노이즈 층으로 지형을 결정하는 대형 맵용 생성기
+
+    모든 단계가 O(타일 수) 배열 연산이며 같은 seed에 대해 항상 같은 결과를 반환합니다.
+    시간 예산(NOISE_TIME_BUDGET_MS)을 넘어도 결과는 그대로 쓰고 경고만 남깁니다 (다른 생성기로 바꾸면 같은 시드의 맵이 달라짐).
+    """
+    started = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    map_type_value = getattr(map_type, "value", map_type)
+    config = NOISE_MAP_SHAPES.get(map_type_value, NOISE_MAP_SHAPES[MapType.CONTINENTS.value])
+
+    # 축 좌표를 평면 좌표로 변환 (헥스 배치 왜곡 보정)
+    q = np.arange(width, dtype=np.float32)[:, None]
+    r = np.arange(height, dtype=np.float32)[None, :]
+    x = np.broadcast_to(q + r * np.float32(0.5), (width, height))
+    y = np.broadcast_to(r * SQRT3_HALF, (width, height))
+
+    elevation = fractal_noise(x, y, rng, config["feature_size"])
+    elevation += np.float32(config["shape_weight"]) * shape_mask(config["shape"], width, height)
+    moisture = fractal_noise(x, y, rng, config["feature_size"] / 2)
+
+    # 위도 기반 기온 (적도 1, 극지 0) + 약간의 노이즈
+    latitude = np.abs((np.arange(height, dtype=np.float32) + 0.5) / height * 2 - 1)
+    temperature = (1 - latitude)[None, :] + np.float32(0.15) * fractal_noise(x, y, rng, config["feature_size"], octaves=2)
+
+    # 해수면/해안/언덕/산 경계는 분위수로 정해 목표 비율을 맞춤
+    sea_level = np.quantile(elevation, 1 - config["land_fraction"])
+    is_land = elevation >= sea_level
+    water_elevation = elevation[~is_land]
+    land_elevation = elevation[is_land]
+    coast_level = np.quantile(water_elevation, 1 - COAST_FRACTION) if water_elevation.size else sea_level
+    hills_level, mountain_level = (
+        np.quantile(land_elevation, [1 - MOUNTAIN_FRACTION - HILLS_FRACTION, 1 - MOUNTAIN_FRACTION])
+        if land_elevation.size else (sea_level, sea_level)
+    )
+
+    # 기본 육지 지형은 기온/습도로 결정
+    terrain = np.full((width, height), TERRAIN_INDEX["plains"], dtype=np.int8)
+    terrain[moisture > 0.05] = TERRAIN_INDEX["grassland"]
+    terrain[moisture > 0.2] = TERRAIN_INDEX["forest"]
+    hot = temperature > 0.7
+    terrain[hot & (moisture < -0.15)] = TERRAIN_INDEX["desert"]
+    terrain[hot & (moisture > 0.25)] = TERRAIN_INDEX["jungle"]
+    terrain[temperature < 0.2] = TERRAIN_INDEX["tundra"]
+
+    # 고도 기반 지형이 우선
+    terrain[elevation >= hills_level] = TERRAIN_INDEX["hills"]
+    terrain[elevation >= mountain_level] = TERRAIN_INDEX["mountain"]
+    terrain[~is_land] = TERRAIN_INDEX["ocean"]
+    terrain[~is_land & (elevation >= coast_level)] = TERRAIN_INDEX["coast"]
+
+    game_map = GeneratedMap(
+        map_type=map_type_value,
+        width=width,
+        height=height,
+        seed=seed,
+        terrain=terrain,
+        resource=roll_resources(terrain, rng, available_resources)
+    )
+
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    budget_ms = NOISE_TIME_BUDGET_MS * max(1.0, width * height / NOISE_BUDGET_TILES)
+    if elapsed_ms > budget_ms:
+        logger.warning(f"노이즈 지형 생성이 시간 예산({budget_ms:.0f}ms)을 초과했습니다: {width}x{height} {elapsed_ms:.1f}ms")
+    return game_map
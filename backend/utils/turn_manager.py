@@ -1,10 +1,19 @@
 from typing import Dict, List, Any, Optional, Tuple
 import random
+import numpy as np
 from datetime import datetime
 from models.game import GameTurnInfo, GamePhase, GameSpeed
 from utils.scenario_manager import get_turn_info, calculate_turn_year, check_objective_completion
 from core.config import prisma_client
 from utils.production_utils import process_production
+from utils.hex_grid import NO_VALUE, hex_grids
+from utils.landmass import NO_COMPONENT
+from utils.map_utils import far_enough_mask
+
+# AI 새 도시 위치 - 기존 도시로부터 최대 거리, 다른 모든 도시와의 최소 거리, 도시를 세울 수 없는 지형
+CITY_SITE_MAX_DISTANCE = 6
+MIN_CITY_DISTANCE = 3
+UNBUILDABLE_TERRAINS = ["ocean", "coast", "lake", "mountain"]
 
 async def process_turn_end(game_id: str, player_id: str) -> Dict[str, Any]:
     """플레이어 턴 종료 처리"""
@@ -295,22 +304,18 @@ async def process_ai_turns(game_id: str, current_turn: int) -> List[Dict[str, An
     
     ai_actions = []
     
+    # 세션의 도시/유닛을 한 번씩 읽어 플레이어별로 나눔 (AI 수와 무관한 쿼리 수)
+    cities_by_owner: Dict[int, List[Any]] = {}
+    for city in await prisma_client.city.find_many(where={"session_id": game_id}):
+        cities_by_owner.setdefault(city.owner_player_id, []).append(city)
+    units_by_owner: Dict[int, List[Any]] = {}
+    for unit in await prisma_client.unit.find_many(where={"session_id": game_id}):
+        units_by_owner.setdefault(unit.owner_player_id, []).append(unit)
+    
     # 각 AI 플레이어에 대한 액션 처리
     for ai_player in ai_players:
-        # AI 도시 및 유닛 조회
-        ai_cities = await prisma_client.city.find_many(
-            where={
-                "session_id": game_id,
-                "owner_player_id": ai_player.id
-            }
-        )
-        
-        ai_units = await prisma_client.unit.find_many(
-            where={
-                "session_id": game_id,
-                "owner_player_id": ai_player.id
-            }
-        )
+        ai_cities = cities_by_owner.get(ai_player.id, [])
+        ai_units = units_by_owner.get(ai_player.id, [])
         
         # AI 로직 - 여기서는 간단한 예시
         actions = generate_ai_actions(ai_player, ai_cities, ai_units, current_turn)
@@ -407,19 +412,58 @@ def generate_ai_actions(ai_player, cities, units, current_turn) -> List[Dict[str
     
     return actions
 
+async def choose_city_site(game_id: str, ai_player_id: int):
+    """AI 새 도시 위치 - (세션 그리드, 타일 인덱스), 없으면 None
+
+    기존 도시(첫 도시) 반경 CITY_SITE_MAX_DISTANCE 안에서 같은 대륙의 빈 땅 중
+    모든 도시와 MIN_CITY_DISTANCE 이상 떨어진 타일을 무작위로 고릅니다.
+    """
+    grid = await hex_grids.get(prisma_client, game_id)
+    if grid is None:
+        return None
+    
+    cities = await prisma_client.city.find_many(
+        where={"session_id": game_id, "owner_player_id": ai_player_id}
+    )
+    home = next(
+        (index for index in (grid.index_of(c.loc_q, c.loc_r, c.loc_s) for c in cities) if index != NO_VALUE),
+        NO_VALUE
+    )
+    if home == NO_VALUE or grid.continent_of(home) == NO_COMPONENT:
+        return None
+    
+    home_q, home_r, _ = grid.coords([home])[0]
+    candidates = grid.within(home_q, home_r, CITY_SITE_MAX_DISTANCE)
+    candidates = candidates[
+        (grid.continent[candidates] == grid.continent_of(home))
+        & (grid.city_id[candidates] == NO_VALUE)
+        & ~grid.terrain_mask(UNBUILDABLE_TERRAINS)[candidates]
+    ]
+    city_tiles = np.flatnonzero(grid.city_id != NO_VALUE)
+    candidates = candidates[far_enough_mask(
+        np.stack([grid.q[candidates], grid.r[candidates]], axis=1),
+        np.stack([grid.q[city_tiles], grid.r[city_tiles]], axis=1),
+        MIN_CITY_DISTANCE
+    )]
+    if not len(candidates):
+        return None
+    return grid, int(random.choice(candidates.tolist()))
+
 async def apply_ai_action(game_id: str, ai_player_id: int, action: Dict[str, Any]):
     """AI 액션을 실제 게임 상태에 적용"""
     action_type = action["type"]
     details = action["details"]
     
     if action_type == "found_city":
-        # 새 도시 위치 선택 로직
-        # 실제로는 더 복잡한 로직 필요
-        q, r = random.randint(5, 15), random.randint(5, 15)
-        s = -q - r
+        # 새 도시 위치 선택 (기존 도시와 같은 대륙 - 세울 곳이 없으면 건설하지 않음)
+        site = await choose_city_site(game_id, ai_player_id)
+        if site is None:
+            return
+        grid, site_index = site
+        q, r, s = grid.coords([site_index])[0]
         
         # 도시 생성
-        await prisma_client.city.create(
+        city = await prisma_client.city.create(
             data={
                 "session_id": game_id,
                 "name": details["city_name"],
@@ -439,6 +483,13 @@ async def apply_ai_action(game_id: str, ai_player_id: int, action: Dict[str, Any
                 "happiness": 10
             }
         )
+        
+        # 도시 타일 기록 (DB와 세션 그리드)
+        await prisma_client.hexagon.update(
+            where={"session_id_q_r_s": {"session_id": game_id, "q": q, "r": r, "s": s}},
+            data={"city_id": city.id}
+        )
+        grid.set_city(site_index, city.id)
     
     elif action_type == "move_unit":
         # 유닛 이동
@@ -549,12 +600,12 @@ async def reset_units(game_id: str):
         where={"session_id": game_id}
     )
     from models.unit import UnitStatus
-    # 각 유닛 이동력과 상태 초기화
-    for unit in units:
-        await prisma_client.unit.update(
-            where={"id": unit.id},
+    # 최대 이동력이 같은 유닛끼리 묶어 update_many 한 번으로 초기화 (유닛 수와 무관한 쿼리 수)
+    for max_movement in {unit.max_movement for unit in units}:
+        await prisma_client.unit.update_many(
+            where={"session_id": game_id, "max_movement": max_movement},
             data={
-                "movement": unit.max_movement,
+                "movement": max_movement,
                 "status": UnitStatus.IDLE.value
             }
         )